@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.routes import auth, interview, jobs, users, analysis
+from app.api.routes import auth, interview, jobs, users, analysis, metrics
 
 api_router = APIRouter()
 api_router.include_router(auth.router)
@@ -8,3 +8,4 @@ api_router.include_router(jobs.router)
 api_router.include_router(users.router)
 api_router.include_router(interview.router)
 api_router.include_router(analysis.router)
+api_router.include_router(metrics.router)
@@ -1,28 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+import json
 
-from app.api.deps import get_current_user
-from app.core.database import get_session
-from app.models import User, Project, Job
-from app.schemas.analysis import PortfolioAnalysisResponse
-from app.utils.ai_analysis import analyze_portfolio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import get_current_operator, get_current_user
+from app.core.config import LLM_BREAKER_RESET_SECONDS
+from app.core.database import get_session, run_with_sync_session
+from app.models import AnalysisJob, User, Project, Job
+from app.schemas.analysis import (
+    AnalysisJobResponse,
+    BatchAnalysisRequest,
+    JobRankingResponse,
+    PortfolioAnalysisResponse,
+    RankedJob,
+    SkillMatchPreviewResponse,
+)
+from app.services.analysis_cache import get_cached_analysis, store_analysis
+from app.services.analysis_jobs import enqueue_analysis, get_analysis_job
+from app.services.batch_analysis import stream_batch_analysis
+from app.services.job_index import job_index
+from app.services.llm_gateway import LLMUnavailable
+from app.services.portfolio_analysis import (
+    AnalysisError,
+    build_payload,
+    owned_skills,
+    payload_fingerprint,
+    run_portfolio_analysis,
+)
+from app.services.skill_matcher import job_skills, match_portfolio, match_skills
 
 router = APIRouter(prefix="/analysis", tags=["Analysis"])
 
-@router.post("/portfolio", response_model=PortfolioAnalysisResponse)
-async def analyze_user_portfolio(
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
-):
+
+async def _latest_project(session: AsyncSession, current_user: User) -> Optional[Project]:
+    project_statement = (
+        select(Project)
+        .where(Project.user_id == current_user.id)
+        .order_by(Project.created_at.desc())
+        .limit(1)
+    )
+    return (await session.exec(project_statement)).first()
+
+
+async def build_analysis_payload(session: AsyncSession, current_user: User) -> dict:
     """
-    Analyze user's portfolio fit against job openings.
+    Collect the inputs of a portfolio analysis for the current user.
 
-    Automatically selects:
-    - User's most recent project
-    - First job matching user's domain
+    Uses the user's most recent project and the best-ranked job of their
+    domain (see job_index).
 
-    Returns AI-generated analysis with skill match, fit score,
-    missing competencies, and recommended training programs.
+    Raises:
+        HTTPException 400: If the user has no domain or no projects
+        HTTPException 404: If no job matches the user's domain
     """
     # Validate user has domain
     if not current_user.domain:
@@ -32,13 +65,7 @@ async def analyze_user_portfolio(
         )
 
     # Fetch most recent project
-    project_statement = (
-        select(Project)
-        .where(Project.user_id == current_user.id)
-        .order_by(Project.created_at.desc())
-        .limit(1)
-    )
-    project = session.exec(project_statement).first()
+    project = await _latest_project(session, current_user)
 
     if not project:
         raise HTTPException(
@@ -46,13 +73,11 @@ async def analyze_user_portfolio(
             detail="분석할 프로젝트가 없습니다. 먼저 프로젝트를 등록해주세요."
         )
 
-    # Fetch job matching user's domain
-    job_statement = (
-        select(Job)
-        .where(Job.domain == current_user.domain)
-        .limit(1)
+    # Fetch the best matching job of the user's domain
+    ranked = await run_with_sync_session(
+        job_index.rank, owned_skills(current_user, project), domain=current_user.domain, limit=1
     )
-    job = session.exec(job_statement).first()
+    job = await session.get(Job, ranked[0].job_id) if ranked else None
 
     if not job:
         raise HTTPException(
@@ -60,47 +85,204 @@ async def analyze_user_portfolio(
             detail=f"{current_user.domain} 도메인에 매칭되는 채용공고를 찾을 수 없습니다."
         )
 
-    # Build data dictionaries for analyze_portfolio
-    user_data = {
-        "self_summary": current_user.self_summary or "",
-        "survey_text": current_user.survey_text or "",
-        "skills": current_user.skills or ""
-    }
+    return build_payload(current_user, project, job)
 
-    project_data = {
-        "title": project.title,
-        "content": project.content or "",
-        "skills_used": project.skills_used or ""
-    }
 
-    job_data = {
-        "company": job.company,
-        "title": job.title,
-        "description": job.description,
-        "skills_required": job.skills_required or ""
-    }
+@router.post("/portfolio", response_model=PortfolioAnalysisResponse)
+async def analyze_user_portfolio(
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Analyze user's portfolio fit against job openings.
 
-    # Call AI analysis
-    try:
-        analysis_result = analyze_portfolio(user_data, project_data, job_data)
+    Automatically selects:
+    - User's most recent project
+    - Best-ranked job of user's domain (see GET /analysis/jobs)
 
-        # Check if result contains error
-        if isinstance(analysis_result, dict) and "error" in analysis_result:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"AI 분석 오류: {analysis_result['error']}"
-            )
+    Returns AI-generated analysis with skill match, fit score,
+    missing competencies, and recommended training programs.
 
-        # Add metadata for tracking
-        analysis_result["analyzed_project"] = project.title
-        analysis_result["analyzed_job"] = f"{job.company} - {job.title}"
+    Results are cached per user and input fingerprint (profile, project,
+    job and program catalogue version), so repeat views skip the LLM call.
+    """
+    payload = await build_analysis_payload(session, current_user)
 
-        return analysis_result
+    # Return the stored result if nothing relevant changed
+    fingerprint = payload_fingerprint(payload)
+    cached_result = await session.run_sync(get_cached_analysis, current_user.id, fingerprint)
+    if cached_result is not None:
+        return cached_result
 
-    except HTTPException:
-        raise
+    # Call AI analysis off the event loop
+    try:
+        result = await run_portfolio_analysis(payload)
+    except LLMUnavailable:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI 분석 서비스가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(int(LLM_BREAKER_RESET_SECONDS))}
+        )
+    except AnalysisError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"AI 분석 오류: {str(e)}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"포트폴리오 분석 중 오류가 발생했습니다: {str(e)}"
         )
+
+    await session.run_sync(store_analysis, fingerprint, current_user.id, result)
+    return result
+
+
+@router.get("/jobs", response_model=JobRankingResponse)
+async def rank_jobs(
+    limit: int = Query(5, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Rank the jobs of the user's domain against their skills and latest project.
+
+    Scores are computed locally (no AI call); /analysis/portfolio analyzes
+    the top-ranked job.
+    """
+    if not current_user.domain:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="사용자의 도메인이 설정되지 않았습니다. 먼저 설문조사를 완료해주세요."
+        )
+
+    owned = owned_skills(current_user, await _latest_project(session, current_user))
+    ranked = await run_with_sync_session(job_index.rank, owned, domain=current_user.domain, limit=limit)
+    jobs = {
+        job.id: job
+        for job in await session.exec(select(Job).where(Job.id.in_([r.job_id for r in ranked])))
+    }
+
+    results = []
+    for entry in ranked:
+        job = jobs.get(entry.job_id)
+        if job is None:
+            continue
+        skill_match = match_skills(owned, job_skills(job.skills_required, job.description))
+        results.append(RankedJob(
+            id=job.id,
+            company=job.company,
+            title=job.title,
+            domain=job.domain,
+            score=entry.score,
+            matched_skills=skill_match.matched,
+            missing_skills=skill_match.missing
+        ))
+    return JobRankingResponse(jobs=results)
+
+
+@router.post("/portfolio/preview", response_model=SkillMatchPreviewResponse)
+async def preview_portfolio_analysis(
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Instant skill-match preview for the same project/job as /portfolio.
+
+    Computed locally from the canonical skill dictionary (no AI call):
+    matched/missing skills and a weighted 0-100 baseline score.
+    """
+    payload = await build_analysis_payload(session, current_user)
+    skill_match = match_portfolio(payload["user_data"], payload["project_data"], payload["job_data"])
+    return SkillMatchPreviewResponse(
+        **skill_match.to_dict(),
+        analyzed_project=payload["analyzed_project"],
+        analyzed_job=payload["analyzed_job"]
+    )
+
+
+@router.post(
+    "/portfolio/jobs",
+    response_model=AnalysisJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def enqueue_portfolio_analysis(
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Queue a portfolio analysis and return its job id immediately.
+
+    The analysis runs on the background worker pool; poll
+    GET /analysis/portfolio/jobs/{job_id} for the result. A cached result
+    yields a job that is already done, and re-submitting the same inputs
+    while a job is pending returns that job.
+    """
+    payload = await build_analysis_payload(session, current_user)
+    fingerprint = payload_fingerprint(payload)
+    cached_result = await session.run_sync(get_cached_analysis, current_user.id, fingerprint)
+    job = await session.run_sync(
+        enqueue_analysis,
+        current_user.id,
+        fingerprint,
+        payload,
+        result=cached_result
+    )
+    return _job_response(job)
+
+
+@router.get("/portfolio/jobs/{job_id}", response_model=AnalysisJobResponse)
+async def get_portfolio_analysis_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Return the status of a queued analysis, with its result once done.
+
+    Raises:
+        HTTPException 404: If the job does not exist or belongs to another user
+    """
+    job = await session.run_sync(get_analysis_job, job_id, current_user.id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="분석 작업을 찾을 수 없습니다."
+        )
+    return _job_response(job)
+
+
+@router.post("/batch")
+async def analyze_batch(
+    request: BatchAnalysisRequest,
+    operator: User = Depends(get_current_operator)
+):
+    """
+    Analyze a cohort's portfolios and stream results as NDJSON.
+
+    Operators only (ANALYSIS_BATCH_OPERATORS). Inputs are bulk-loaded,
+    identical inputs are analyzed once, cached results are returned
+    first, and the remaining Gemini calls run with bounded concurrency and
+    retries. Each line is one user's result as it finishes:
+
+        {"user_id": 1, "status": "done", "cached": false, "result": {...}}
+        {"user_id": 2, "status": "failed", "error": "..."}
+
+    The final line is {"summary": {...}}.
+    """
+    async def lines():
+        async for record in stream_batch_analysis(request.user_ids):
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _job_response(job: AnalysisJob) -> AnalysisJobResponse:
+    return AnalysisJobResponse(
+        job_id=job.id,
+        status=job.status,
+        result=json.loads(job.result) if job.result else None,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at
+    )
@@ -1,32 +1,56 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.database import get_session
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import HashingBusy, create_access_token, password_hasher
 from app.models import User
 from app.schemas import UserCreate, UserLogin
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
+def _auth_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Authentication is busy, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/signup")
-def signup(user_in: UserCreate, session: Session = Depends(get_session)):
+async def signup(user_in: UserCreate, session: AsyncSession = Depends(get_session)):
+    try:
+        hashed_password = await password_hasher.hash(user_in.password)
+    except HashingBusy:
+        raise _auth_busy()
     user = User(
         email=user_in.email,
         name=user_in.name,
         phone_number=user_in.phone_number,
-        hashed_password=hash_password(user_in.password),
+        hashed_password=hashed_password,
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.commit()
+    await session.refresh(user)
     return user
 
 
 @router.post("/login")
-def login(user_in: UserLogin, session: Session = Depends(get_session)):
-    user = session.exec(select(User).where(User.email == user_in.email)).first()
-    if not user or not verify_password(user_in.password, user.hashed_password):
+async def login(user_in: UserLogin, session: AsyncSession = Depends(get_session)):
+    user = (await session.exec(select(User).where(User.email == user_in.email))).first()
+    if not user:
+        raise HTTPException(status_code=401, detail="Login failed")
+    try:
+        valid, new_hash = await password_hasher.verify_and_update(user_in.password, user.hashed_password)
+    except HashingBusy:
+        raise _auth_busy()
+    if not valid:
         raise HTTPException(status_code=401, detail="Login failed")
-    token = create_access_token({"sub": user.email})
+    token = create_access_token({"sub": user.email, "uid": user.id})
+    if new_hash:
+        # Stored with an outdated BCRYPT_ROUNDS; upgrade transparently
+        user.hashed_password = new_hash
+        session.add(user)
+        await session.commit()
     return {"access_token": token, "token_type": "bearer"}
@@ -1,27 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+import asyncio
+import base64
+import json
+import re
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import get_current_user
-from app.core.database import get_session
-from app.models import Project, User
+from app.core.database import get_session, new_async_session
+from app.core.metrics import span
+from app.models import InterviewSession, Project, User
 from app.schemas.interview import (
+    AudioFormat,
     InterviewerChatRequest,
     InterviewerChatResponse,
     InterviewStartResponse,
+    InterviewTurnRequest,
+    InterviewTurnResponse,
     MentorChatRequest,
     MentorChatResponse,
     ProjectInfo,
 )
+from app.services.context_budget import ContextBudget, schedule_compaction
 from app.services.llm_service import LLMService
-from app.services.tts_service import TTSService
+from app.services.session_store import (
+    InterviewSessionStore,
+    build_session_store,
+    get_session_store,
+)
+from app.services.tts_service import TTSService, get_tts_service
+from app.utils.sentence import SentenceSplitter
 
 router = APIRouter(prefix="/interview", tags=["Interview"])
 
 
 @router.post("/start", response_model=InterviewStartResponse)
 async def start_interview(
+    http_request: Request,
+    audio_format: AudioFormat = AudioFormat.BASE64,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    store: InterviewSessionStore = Depends(get_session_store),
+    tts_service: TTSService = Depends(get_tts_service)
 ):
     """
     Start a new mock interview session.
@@ -30,10 +53,12 @@ async def start_interview(
     1. Fetch user's most recent project
     2. Generate Korean greeting
     3. Convert greeting to audio (TTS)
-    4. Return greeting text + base64 audio + project info
+    4. Create a server-side session holding the transcript
+    5. Return greeting text + audio (base64, or a URL with audio_format=url) + project info
 
     Returns:
-        InterviewStartResponse with greeting message, audio, and project info
+        InterviewStartResponse with greeting message, audio, project info and
+        the session_id to pass on subsequent turns
 
     Raises:
         HTTPException 400: If user has no projects
@@ -46,7 +71,7 @@ async def start_interview(
         .order_by(Project.created_at.desc())
         .limit(1)
     )
-    project = session.exec(statement).first()
+    project = (await session.exec(statement)).first()
 
     if not project:
         raise HTTPException(
@@ -64,87 +89,74 @@ async def start_interview(
 
     # 3. Convert to audio
     try:
-        tts_service = TTSService()
-        audio_base64 = await tts_service.text_to_speech(greeting)
+        audio = await _deliver_audio(tts_service, greeting, audio_format, http_request)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"TTS 서비스 오류: {str(e)}"
         )
 
-    # 4. Return response
+    # 4. Create session with the greeting as the first turn
+    interview_session = await store.create(user_id=current_user.id, project_id=project.id)
+    await store.append_turns(interview_session.id, [("interviewer", greeting)])
+
+    # 5. Return response
     return InterviewStartResponse(
         message=greeting,
-        audio=f"data:audio/mp3;base64,{audio_base64}",
+        **audio,
         project=ProjectInfo(
             id=project.id,
             title=project.title,
             skills_used=project.skills_used or ""
-        )
+        ),
+        session_id=interview_session.id
     )
 
 
 @router.post("/chat/interviewer", response_model=InterviewerChatResponse)
 async def interviewer_chat(
     request: InterviewerChatRequest,
+    http_request: Request,
+    audio_format: AudioFormat = AudioFormat.BASE64,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    store: InterviewSessionStore = Depends(get_session_store),
+    tts_service: TTSService = Depends(get_tts_service)
 ):
     """
     Generate interviewer's follow-up question.
 
     Logic:
-    1. Fetch user's most recent project (for tech stack context)
+    1. Load the session transcript (or the client-sent history) and project
     2. Use Gemini Flash to generate aggressive follow-up question
-    3. Convert question to audio (TTS)
-    4. Return question text + base64 audio
+    3. Append the answer and question to the session
+    4. Convert question to audio (TTS)
+    5. Return question text + audio (base64, or a URL with audio_format=url)
 
     Args:
-        request: Contains user_answer and optional conversation_history
+        request: Contains user_answer and either session_id or conversation_history
 
     Returns:
         InterviewerChatResponse with question message and audio
 
     Raises:
         HTTPException 400: If user has no projects
+        HTTPException 404: If session_id is unknown
         HTTPException 502: If LLM or TTS service fails
     """
-    # 1. Fetch most recent project for context
-    statement = (
-        select(Project)
-        .where(Project.user_id == current_user.id)
-        .order_by(Project.created_at.desc())
-        .limit(1)
+    # 1. Load project and history
+    project, history_text, interview_session = await _load_turn_context(
+        session, store, current_user, request.session_id
     )
-    project = session.exec(statement).first()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="프로젝트를 찾을 수 없습니다."
-        )
-
-    # 2. Build project context
-    project_context = {
-        "title": project.title,
-        "content": project.content or "",
-        "skills_used": project.skills_used or "",
-        "results": project.results or ""
-    }
 
-    # 3. Generate follow-up question
+    # 2. Generate follow-up question
     llm_service = LLMService()
     try:
-        # Convert conversation history to dict format
-        history = [
-            {"role": msg.role, "content": msg.content}
-            for msg in (request.conversation_history or [])
-        ]
-
         question = await llm_service.generate_interviewer_question(
             user_answer=request.user_answer,
-            project_context=project_context,
-            history=history
+            project_context=_project_context(project),
+            history=_history_dicts(request.conversation_history),
+            history_text=history_text
         )
     except Exception as e:
         raise HTTPException(
@@ -152,59 +164,329 @@ async def interviewer_chat(
             detail=f"LLM 서비스 오류: {str(e)}"
         )
 
+    # 3. Record the turn
+    if interview_session:
+        if await _record_turn(store, interview_session, request.user_answer, question):
+            schedule_compaction(interview_session.id)
+
     # 4. Convert to audio
     try:
-        tts_service = TTSService()
-        audio_base64 = await tts_service.text_to_speech(question)
+        audio = await _deliver_audio(tts_service, question, audio_format, http_request)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"TTS 서비스 오류: {str(e)}"
         )
 
-    return InterviewerChatResponse(
-        message=question,
-        audio=f"data:audio/mp3;base64,{audio_base64}"
+    return InterviewerChatResponse(message=question, **audio)
+
+
+@router.post("/chat/interviewer/stream")
+async def interviewer_chat_stream(
+    request: InterviewerChatRequest,
+    http_request: Request,
+    audio_format: AudioFormat = AudioFormat.BASE64,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    store: InterviewSessionStore = Depends(get_session_store),
+    tts_service: TTSService = Depends(get_tts_service)
+):
+    """
+    Streaming variant of /chat/interviewer (Server-Sent Events).
+
+    The question text is streamed as Gemini generates it, split at Korean
+    sentence boundaries, and each sentence is sent to TTS as soon as it is
+    complete, so the first audio chunk can play while later sentences are
+    still being generated or synthesized.
+
+    Events:
+        text:  {"delta": str}                              - question text as generated
+        audio: {"index": int, "text": str, "audio" | "audio_url": str}
+                                                           - per-sentence audio, in order
+        done:  {"message": str}                            - full question text
+        error: {"detail": str}                             - LLM or TTS failure
+
+    Raises:
+        HTTPException 400: If user has no projects
+        HTTPException 404: If session_id is unknown
+    """
+    project, history_text, interview_session = await _load_turn_context(
+        session, store, current_user, request.session_id
     )
 
+    llm_service = LLMService()
+    text_stream = llm_service.stream_interviewer_question(
+        user_answer=request.user_answer,
+        project_context=_project_context(project),
+        history=_history_dicts(request.conversation_history),
+        history_text=history_text
+    )
+
+    async def _record(question: str):
+        await _record_turn_detached(interview_session, request.user_answer, question)
+
+    on_complete = _record if interview_session else None
+
+    return StreamingResponse(
+        _stream_question_with_audio(
+            text_stream,
+            lambda sentence: _deliver_audio(tts_service, sentence, audio_format, http_request),
+            on_complete
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _load_turn_context(
+    session: AsyncSession,
+    store: InterviewSessionStore,
+    current_user: User,
+    session_id: Optional[str]
+) -> Tuple[Project, Optional[str], Optional[InterviewSession]]:
+    """
+    Resolve the project and rendered history for an interviewer turn.
+
+    With a session_id the session's project and cached transcript are used;
+    otherwise the user's most recent project and the client-sent history.
+    """
+    interview_session = None
+    if session_id:
+        interview_session = await _get_interview_session(store, current_user, session_id)
+        project = await session.get(Project, interview_session.project_id)
+        history_text = _session_history(interview_session)
+    else:
+        statement = (
+            select(Project)
+            .where(Project.user_id == current_user.id)
+            .order_by(Project.created_at.desc())
+            .limit(1)
+        )
+        project = (await session.exec(statement)).first()
+        history_text = None
+
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="프로젝트를 찾을 수 없습니다."
+        )
+    return project, history_text, interview_session
+
+
+def _session_history(interview_session: InterviewSession) -> str:
+    """Rolling summary + verbatim window of a session, within budget"""
+    return ContextBudget().render(interview_session.summary, interview_session.history_text)
+
+
+async def _record_turn(
+    store: InterviewSessionStore,
+    interview_session: InterviewSession,
+    user_answer: str,
+    question: str
+) -> bool:
+    """
+    Append an answer/question pair to the session.
+
+    Returns:
+        True if the verbatim window is now full and should be compacted
+    """
+    window_turns = interview_session.turn_count + 2 - interview_session.summarized_turns
+    await store.append_turns(interview_session.id, [("user", user_answer), ("interviewer", question)])
+    return ContextBudget().needs_compaction(window_turns)
+
+
+async def _record_turn_detached(
+    interview_session: InterviewSession,
+    user_answer: str,
+    question: str
+):
+    """
+    Record a turn from inside a streaming response.
+
+    The request-scoped DB session may already be closed once streaming
+    starts, so the turn is written through a fresh one.
+    """
+    async with new_async_session() as stream_session:
+        needs_compaction = await _record_turn(
+            build_session_store(stream_session), interview_session, user_answer, question
+        )
+    if needs_compaction:
+        schedule_compaction(interview_session.id)
+
+
+async def _get_interview_session(
+    store: InterviewSessionStore,
+    current_user: User,
+    session_id: str
+) -> InterviewSession:
+    interview_session = await store.get(session_id, current_user.id)
+    if interview_session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="면접 세션을 찾을 수 없습니다. /interview/start 로 새 세션을 시작해주세요."
+        )
+    return interview_session
+
+
+def _history_dicts(conversation_history) -> List[Dict[str, str]]:
+    """Convert conversation history to dict format"""
+    return [
+        {"role": msg.role, "content": msg.content}
+        for msg in (conversation_history or [])
+    ]
+
+
+def _project_context(project: Project) -> Dict[str, str]:
+    return {
+        "title": project.title,
+        "content": project.content or "",
+        "skills_used": project.skills_used or "",
+        "results": project.results or ""
+    }
+
+
+async def _deliver_audio(
+    tts_service: TTSService,
+    text: str,
+    audio_format: AudioFormat,
+    http_request: Request
+) -> Dict[str, str]:
+    """Synthesize text and return it as an inline data URI or as an audio URL"""
+    audio = await tts_service.synthesize(text)
+    if audio_format == AudioFormat.URL:
+        audio_id = tts_service.audio_id(text)
+        return {"audio_url": str(http_request.url_for("get_interview_audio", audio_id=audio_id))}
+    with span("encode"):
+        return {"audio": f"data:audio/mp3;base64,{base64.b64encode(audio).decode('utf-8')}"}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_question_with_audio(
+    text_stream: AsyncIterator[str],
+    deliver_audio: Callable[[str], Awaitable[Dict[str, str]]],
+    on_complete: Optional[Callable[[str], Awaitable[None]]] = None
+) -> AsyncIterator[str]:
+    """
+    Merge LLM text deltas and per-sentence TTS results into one SSE stream.
+
+    Sentences are synthesized concurrently but their audio events are
+    emitted in sentence order. on_complete receives the full question
+    before the done event is sent.
+    """
+    events: asyncio.Queue = asyncio.Queue()
+    tts_tasks: asyncio.Queue = asyncio.Queue()
+
+    async def synthesize(index: int, sentence: str) -> str:
+        audio = await deliver_audio(sentence)
+        return _sse("audio", {"index": index, "text": sentence, **audio})
+
+    async def pump_text():
+        splitter = SentenceSplitter()
+        index = 0
+        parts = []
+        try:
+            async for delta in text_stream:
+                parts.append(delta)
+                await events.put(_sse("text", {"delta": delta}))
+                for sentence in splitter.feed(delta):
+                    await tts_tasks.put(asyncio.create_task(synthesize(index, sentence)))
+                    index += 1
+            for sentence in splitter.flush():
+                await tts_tasks.put(asyncio.create_task(synthesize(index, sentence)))
+                index += 1
+        finally:
+            await tts_tasks.put(None)
+        return "".join(parts).strip()
+
+    async def pump_audio():
+        while (task := await tts_tasks.get()) is not None:
+            await events.put(await task)
+
+    async def run():
+        text_task = asyncio.create_task(pump_text())
+        audio_task = asyncio.create_task(pump_audio())
+        try:
+            message = await text_task
+            await audio_task
+            if on_complete:
+                await on_complete(message)
+            await events.put(_sse("done", {"message": message}))
+        except Exception as e:
+            await events.put(_sse("error", {"detail": str(e)}))
+        finally:
+            text_task.cancel()
+            audio_task.cancel()
+            events.put_nowait(None)
+
+    runner = asyncio.create_task(run())
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+    finally:
+        # Client disconnected or stream finished: stop any outstanding work
+        runner.cancel()
+        while not tts_tasks.empty():
+            task = tts_tasks.get_nowait()
+            if task is not None:
+                task.cancel()
+
 
 @router.post("/chat/mentor", response_model=MentorChatResponse)
 async def mentor_chat(
     request: MentorChatRequest,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    store: InterviewSessionStore = Depends(get_session_store)
 ):
     """
     Generate mentor's constructive feedback.
 
     Logic:
-    1. Use Gemini Pro to analyze interviewer's question and user's answer
-    2. Generate constructive feedback in Korean
-    3. Provide actionable tips
+    1. Resolve the interviewer question and history (from the session if given)
+    2. Use Gemini Pro to analyze interviewer's question and user's answer
+    3. Generate constructive feedback in Korean with actionable tips
     4. Return text only (no audio)
 
     Args:
-        request: Contains interviewer_question, user_answer, and optional history
+        request: Contains user_answer plus session_id, or interviewer_question
+            and optional history
 
     Returns:
         MentorChatResponse with feedback and tips
 
     Raises:
+        HTTPException 400: If the interviewer question cannot be determined
+        HTTPException 404: If session_id is unknown
         HTTPException 502: If LLM service fails
     """
-    # 1. Generate mentor feedback
+    # 1. Resolve question and history
+    interviewer_question = request.interviewer_question
+    if request.session_id:
+        interview_session = await _get_interview_session(store, current_user, request.session_id)
+        history_text = _session_history(interview_session)
+        if not interviewer_question:
+            interviewer_question = await store.find_question_for_answer(
+                interview_session.id, request.user_answer
+            )
+    else:
+        history_text = None
+
+    if not interviewer_question:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="면접관 질문(interviewer_question) 또는 session_id가 필요합니다."
+        )
+
+    # 2. Generate mentor feedback
     llm_service = LLMService()
     try:
-        # Convert conversation history to dict format
-        history = [
-            {"role": msg.role, "content": msg.content}
-            for msg in (request.conversation_history or [])
-        ]
-
         feedback_data = await llm_service.generate_mentor_feedback(
-            interviewer_question=request.interviewer_question,
+            interviewer_question=interviewer_question,
             user_answer=request.user_answer,
-            history=history
+            history=_history_dicts(request.conversation_history),
+            history_text=history_text
         )
     except Exception as e:
         raise HTTPException(
@@ -216,3 +498,223 @@ async def mentor_chat(
         feedback=feedback_data["feedback"],
         tips=feedback_data["tips"]
     )
+
+
+@router.post("/chat/turn", response_model=InterviewTurnResponse)
+async def interview_turn(
+    request: InterviewTurnRequest,
+    http_request: Request,
+    audio_format: AudioFormat = AudioFormat.BASE64,
+    stream: bool = False,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+    store: InterviewSessionStore = Depends(get_session_store),
+    tts_service: TTSService = Depends(get_tts_service)
+):
+    """
+    Run a full interview turn for one answer in a single request.
+
+    Replaces calling /chat/interviewer and /chat/mentor back-to-back: the
+    follow-up question (then its TTS) and the mentor feedback on the
+    answer are generated concurrently, so the turn takes as long as the
+    slower of the two chains instead of their sum.
+
+    With stream=true the response is NDJSON and each part is sent as soon
+    as it completes:
+        {"type": "question", "message": str}
+        {"type": "audio", "audio" | "audio_url": str}
+        {"type": "mentor", "feedback": str, "tips": [str]}
+        {"type": "error", "part": "question" | "audio" | "mentor", "detail": str}
+
+    Raises:
+        HTTPException 400: If user has no projects or the question being
+            answered cannot be determined
+        HTTPException 404: If session_id is unknown
+        HTTPException 502: If LLM or TTS service fails (non-streaming only)
+    """
+    # 1. Resolve context once for both agents
+    project, history_text, interview_session = await _load_turn_context(
+        session, store, current_user, request.session_id
+    )
+    history = _history_dicts(request.conversation_history)
+
+    answered_question = request.interviewer_question
+    if not answered_question and interview_session:
+        answered_question = await store.find_question_for_answer(interview_session.id, request.user_answer)
+    if not answered_question:
+        answered_question = next(
+            (msg["content"] for msg in reversed(history) if msg["role"] == "interviewer"),
+            None
+        )
+    if not answered_question:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="면접관 질문(interviewer_question) 또는 session_id가 필요합니다."
+        )
+
+    # 2. Start question -> TTS and mentor feedback concurrently
+    llm_service = LLMService()
+    question_task = asyncio.create_task(llm_service.generate_interviewer_question(
+        user_answer=request.user_answer,
+        project_context=_project_context(project),
+        history=history,
+        history_text=history_text
+    ))
+
+    async def question_audio() -> Dict[str, str]:
+        question = await question_task
+        return await _deliver_audio(tts_service, question, audio_format, http_request)
+
+    audio_task = asyncio.create_task(question_audio())
+    mentor_task = asyncio.create_task(llm_service.generate_mentor_feedback(
+        interviewer_question=answered_question,
+        user_answer=request.user_answer,
+        history=history,
+        history_text=history_text
+    ))
+    tasks = {"question": question_task, "audio": audio_task, "mentor": mentor_task}
+
+    if stream:
+        async def on_question(question: str):
+            if interview_session:
+                await _record_turn_detached(interview_session, request.user_answer, question)
+
+        return StreamingResponse(
+            _stream_turn_parts(tasks, on_question),
+            media_type="application/x-ndjson"
+        )
+
+    # 3. Wait for all parts
+    await asyncio.wait(tasks.values())
+    for part, task in tasks.items():
+        if task.exception():
+            service = "TTS" if part == "audio" else "LLM"
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"{service} 서비스 오류: {str(task.exception())}"
+            )
+
+    if interview_session:
+        if await _record_turn(store, interview_session, request.user_answer, question_task.result()):
+            schedule_compaction(interview_session.id)
+
+    feedback_data = mentor_task.result()
+    return InterviewTurnResponse(
+        interviewer=InterviewerChatResponse(message=question_task.result(), **audio_task.result()),
+        mentor=MentorChatResponse(feedback=feedback_data["feedback"], tips=feedback_data["tips"])
+    )
+
+
+async def _stream_turn_parts(
+    tasks: Dict[str, asyncio.Task],
+    on_question: Callable[[str], Awaitable[None]]
+) -> AsyncIterator[str]:
+    """Emit each turn part as an NDJSON line in completion order"""
+    async def labelled(part: str, task: asyncio.Task):
+        try:
+            return part, await task, None
+        except Exception as e:
+            return part, None, e
+
+    try:
+        for next_done in asyncio.as_completed([labelled(p, t) for p, t in tasks.items()]):
+            part, result, error = await next_done
+            if error is not None:
+                line = {"type": "error", "part": part, "detail": str(error)}
+            elif part == "question":
+                await on_question(result)
+                line = {"type": "question", "message": result}
+            elif part == "mentor":
+                line = {"type": "mentor", "feedback": result["feedback"], "tips": result["tips"]}
+            else:
+                line = {"type": "audio", **result}
+            yield json.dumps(line, ensure_ascii=False) + "\n"
+    finally:
+        for task in tasks.values():
+            task.cancel()
+
+
+_AUDIO_ID = re.compile(r"^[0-9a-f]{64}$")
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@router.api_route("/audio/{audio_id}", methods=["GET", "HEAD"], name="get_interview_audio")
+async def get_interview_audio(
+    audio_id: str,
+    http_request: Request,
+    tts_service: TTSService = Depends(get_tts_service)
+):
+    """
+    Serve synthesized interview audio as raw audio/mpeg bytes.
+
+    Audio IDs are content hashes, so responses are immutable: they carry a
+    strong ETag, long-lived Cache-Control and support single byte ranges
+    for seeking.
+
+    Raises:
+        HTTPException 404: If the audio is not (or no longer) cached
+        HTTPException 416: If the requested range is not satisfiable
+    """
+    if not _AUDIO_ID.match(audio_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="오디오를 찾을 수 없습니다.")
+
+    etag = f'"{audio_id}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=86400, immutable",
+        "Accept-Ranges": "bytes",
+    }
+    if http_request.headers.get("if-none-match") in (etag, "*"):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    audio = await tts_service.get_audio(audio_id)
+    if audio is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="오디오를 찾을 수 없습니다.")
+
+    byte_range = _parse_range(http_request.headers.get("range"), len(audio))
+    if byte_range is None:
+        return Response(content=audio, media_type="audio/mpeg", headers=headers)
+
+    start, end = byte_range
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="요청한 범위가 올바르지 않습니다.",
+            headers={"Content-Range": f"bytes */{len(audio)}"}
+        )
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(audio)}"
+    return Response(
+        content=audio[start:end + 1],
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="audio/mpeg",
+        headers=headers
+    )
+
+
+def _parse_range(header: Optional[str], size: int) -> Optional[tuple]:
+    """
+    Parse a single "bytes=start-end" range into inclusive offsets.
+
+    Returns None when there is no usable Range header (serve the full body),
+    including an invalid range-spec whose last-pos is below its first-pos
+    (RFC 9110 says to ignore the header), and (start, end) with start > end
+    when the range is unsatisfiable, i.e. starts at or beyond the body size.
+    """
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: last N bytes
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        return size, size - 1
+    return start, end
@@ -1,23 +1,91 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.database import get_session
+from app.core.database import get_session, run_with_sync_session
 from app.models.job import Job
-from app.schemas.job import JobsResponse
+from app.schemas.job import JobResponse, JobSearchResponse, JobsResponse
+from app.services.job_listing import (
+    InvalidCursor,
+    job_table_stamp,
+    jobs_response_cache,
+    list_jobs_page,
+    listing_etag,
+)
+from app.services.job_search import job_search_index
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
 @router.get("", response_model=JobsResponse)
-def get_jobs(
+async def get_jobs(
+    request: Request,
     domain: Optional[str] = None,
-    session: Session = Depends(get_session),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
 ):
-    query = select(Job)
-    if domain:
-        query = query.where(Job.domain == domain)
+    """
+    List jobs, newest first, without descriptions (see GET /jobs/{id}).
 
-    jobs = session.exec(query).all()
-    return {"jobs": jobs}
+    Paginated by keyset: pass the returned next_cursor as ?cursor= to get
+    the next page. Responses carry an ETag derived from the job table
+    version and the query, so clients can revalidate with If-None-Match
+    (304) and identical listings are served from a rendered-body cache
+    until a job is written.
+
+    Raises:
+        HTTPException 400: If cursor is malformed
+    """
+    etag = listing_etag(await session.run_sync(job_table_stamp), domain, cursor, limit)
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if request.headers.get("if-none-match") in (etag, "*"):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = jobs_response_cache.get(etag)
+    if body is None:
+        try:
+            jobs, next_cursor = await session.run_sync(list_jobs_page, domain, cursor, limit)
+        except InvalidCursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 cursor 값입니다."
+            )
+        body = JobsResponse(jobs=jobs, next_cursor=next_cursor).model_dump_json().encode("utf-8")
+        jobs_response_cache.put(etag, body)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/search", response_model=JobSearchResponse)
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=100),
+    domain: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    """
+    Full-text search over company, title, description and required skills.
+
+    Korean text is indexed as syllable bigrams, so partial words and words
+    with particles match ("백엔드" finds "백엔드개발자"). All query terms must
+    match; results are ordered by relevance.
+    """
+    return {"jobs": await run_with_sync_session(job_search_index.search, q, domain=domain, limit=limit)}
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int, session: AsyncSession = Depends(get_session)):
+    """
+    Job detail including the full description.
+
+    Raises:
+        HTTPException 404: If the job does not exist
+    """
+    job = await session.get(Job, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="채용공고를 찾을 수 없습니다."
+        )
+    return job
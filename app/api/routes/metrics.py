@@ -0,0 +1,38 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import registry
+from app.schemas.metrics import LLMClientMetrics
+from app.services.gemini_client import gemini_client
+from app.services.llm_gateway import llm_gateway
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """
+    All metrics of this worker in the Prometheus text format.
+
+    Includes request counts and latency per route template, per-stage
+    request time (auth, db, prompt, llm, tts, encode, serialize), LLM
+    calls and token counts per purpose, TTS cache hits/misses, the circuit
+    breaker state and DB/Gemini connection pools. Each worker process keeps
+    its own counters; scrape every worker (or sum in Prometheus).
+    """
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/llm", response_model=LLMClientMetrics)
+def llm_client_metrics():
+    """
+    Gemini client and gateway health (this worker only).
+
+    connections_reused counts requests served over a pooled keep-alive
+    connection, i.e. without a new TCP/TLS handshake. gateway reports the
+    circuit breaker state, retry/hedge/fail-fast counters and per-purpose
+    latency of successful calls in seconds.
+    """
+    return {"gemini": gemini_client.stats.snapshot(), "gateway": llm_gateway.snapshot()}
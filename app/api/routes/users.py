@@ -1,32 +1,39 @@
+from datetime import datetime, timezone
+
 from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import get_current_user
 from app.core.database import get_session
 from app.models import Project, User
 from app.schemas import PortfolioCreate, SurveyCreate
+from app.services.analysis_cache import invalidate_user_analyses
+from app.services.user_cache import user_cache
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.post("/me/survey")
-def update_survey(
+async def update_survey(
     survey_in: SurveyCreate,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     current_user.domain = survey_in.domain
     current_user.survey_text = survey_in.text
+    current_user.updated_at = datetime.now(timezone.utc)
     session.add(current_user)
-    session.commit()
+    await invalidate_user_analyses(session, current_user.id)
+    user_cache.invalidate(current_user.id, current_user.updated_at)
+    await session.commit()
     return {"msg": "Survey updated"}
 
 
 @router.post("/me/portfolio")
-def create_portfolio(
+async def create_portfolio(
     portfolio_in: PortfolioCreate,
     current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ):
     # Update User Profile
     if portfolio_in.self_summary is not None:
@@ -35,6 +42,7 @@ def create_portfolio(
         current_user.skills = portfolio_in.user_skills
     if portfolio_in.external_links is not None:
         current_user.external_links = portfolio_in.external_links
+    current_user.updated_at = datetime.now(timezone.utc)
 
     session.add(current_user)
 
@@ -49,8 +57,10 @@ def create_portfolio(
         user_id=current_user.id,
     )
     session.add(project)
+    await invalidate_user_analyses(session, current_user.id)
+    user_cache.invalidate(current_user.id, current_user.updated_at)
 
-    session.commit()
-    session.refresh(project)
+    await session.commit()
+    await session.refresh(project)
 
     return {"msg": "Portfolio created successfully", "project_id": project.id}
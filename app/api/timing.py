@@ -0,0 +1,90 @@
+import time
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import SERVER_TIMING_ENABLED
+from app.core.metrics import end_request_timing, registry, span, start_request_timing
+
+http_requests = registry.counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+http_request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to finishing its response",
+    ["method", "route"],
+)
+http_stage_seconds = registry.histogram(
+    "http_request_stage_seconds",
+    "Time each request spent per stage (auth, db, prompt, llm, tts, encode, serialize)",
+    ["route", "stage"],
+)
+
+
+def server_timing(stages: Dict[str, float], total: float) -> str:
+    """Server-Timing header value, durations in milliseconds"""
+    metrics = [f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in stages.items()]
+    metrics.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+class TimingMiddleware:
+    """
+    Times every HTTP request and breaks it down into the stages recorded
+    with app.core.metrics.span/record_stage while it ran.
+
+    Requests are labelled by route template (/interview/chat/turn,
+    /interview/audio/{audio_id}), not by path, to keep label cardinality
+    bounded. With SERVER_TIMING_ENABLED the stages seen before the response
+    starts are also sent back as a Server-Timing header; for streamed
+    responses that excludes the stream body.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing_enabled: bool = SERVER_TIMING_ENABLED):
+        self.app = app
+        self.server_timing_enabled = server_timing_enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = start_request_timing()
+        status_code = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing_enabled:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        server_timing(timing.snapshot(), time.perf_counter() - timing.started_at),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request_timing(token)
+            elapsed = time.perf_counter() - timing.started_at
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_requests.inc(method=method, route=template, status=str(status_code))
+            http_request_seconds.observe(elapsed, method=method, route=template)
+            for stage, seconds in timing.snapshot().items():
+                http_stage_seconds.observe(seconds, route=template, stage=stage)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse whose rendering is recorded as the "serialize" stage"""
+
+    def render(self, content: Any) -> bytes:
+        with span("serialize"):
+            return super().render(content)
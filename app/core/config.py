@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,3 +17,95 @@ DATABASE_URL = os.getenv(
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "")
 TTS_VOICE_NAME = os.getenv("TTS_VOICE_NAME", "ko-KR-Wavenet-A")
+
+# LLM 동시 호출 상한 (워커 프로세스당)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+
+# TTS 클라이언트 풀 (워커 프로세스당 gRPC 채널 수) 및 동시 합성 상한
+TTS_CLIENT_POOL_SIZE = int(os.getenv("TTS_CLIENT_POOL_SIZE", "2"))
+TTS_MAX_CONCURRENCY = int(os.getenv("TTS_MAX_CONCURRENCY", "16"))
+
+# TTS 오디오 캐시: 메모리 LRU(바이트 상한 + TTL) + 워커 간 공유 디스크 캐시 (빈 값이면 디스크 캐시 비활성화)
+# /interview/audio/{audio_id} 는 요청이 어느 워커로 가든 디스크 캐시에서 오디오를 찾는다.
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+TTS_CACHE_TTL_SECONDS = int(os.getenv("TTS_CACHE_TTL_SECONDS", str(24 * 60 * 60)))
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "onewave-tts-cache"))
+TTS_CACHE_DISK_MAX_BYTES = int(os.getenv("TTS_CACHE_DISK_MAX_BYTES", str(1024 * 1024 * 1024)))
+
+# 면접 세션 저장소: "db" (기본, 워커 간 공유) 또는 "memory" (단일 워커 개발/부하 테스트용)
+INTERVIEW_SESSION_STORE = os.getenv("INTERVIEW_SESSION_STORE", "db")
+
+# 면접 프롬프트 컨텍스트 예산: 최근 N턴은 원문 유지, 이전 턴은 요약으로 접음 (토큰 수는 추정치)
+INTERVIEW_CONTEXT_RECENT_TURNS = int(os.getenv("INTERVIEW_CONTEXT_RECENT_TURNS", "6"))
+INTERVIEW_CONTEXT_TURN_TOKENS = int(os.getenv("INTERVIEW_CONTEXT_TURN_TOKENS", "500"))
+INTERVIEW_CONTEXT_SUMMARY_TOKENS = int(os.getenv("INTERVIEW_CONTEXT_SUMMARY_TOKENS", "400"))
+INTERVIEW_CONTEXT_PROJECT_TOKENS = int(os.getenv("INTERVIEW_CONTEXT_PROJECT_TOKENS", "600"))
+
+# 포트폴리오 분석 작업 큐 (DB 기반, 워커 프로세스당 동시 분석 수)
+ANALYSIS_WORKER_CONCURRENCY = int(os.getenv("ANALYSIS_WORKER_CONCURRENCY", "2"))
+ANALYSIS_JOB_POLL_SECONDS = float(os.getenv("ANALYSIS_JOB_POLL_SECONDS", "2"))
+ANALYSIS_JOB_TIMEOUT_SECONDS = int(os.getenv("ANALYSIS_JOB_TIMEOUT_SECONDS", "300"))
+ANALYSIS_JOB_MAX_ATTEMPTS = int(os.getenv("ANALYSIS_JOB_MAX_ATTEMPTS", "3"))
+
+# 교육 프로그램 카탈로그 (파일 변경 확인 주기, 분석 프롬프트에 포함할 최대 후보 수)
+PROGRAM_CATALOGUE_RELOAD_SECONDS = float(os.getenv("PROGRAM_CATALOGUE_RELOAD_SECONDS", "5"))
+PROGRAM_CANDIDATE_LIMIT = int(os.getenv("PROGRAM_CANDIDATE_LIMIT", "20"))
+
+# 배치 분석 (운영자 이메일 목록은 쉼표로 구분)
+ANALYSIS_BATCH_CONCURRENCY = int(os.getenv("ANALYSIS_BATCH_CONCURRENCY", "4"))
+ANALYSIS_BATCH_MAX_USERS = int(os.getenv("ANALYSIS_BATCH_MAX_USERS", "500"))
+ANALYSIS_BATCH_OPERATORS = [
+    email.strip() for email in os.getenv("ANALYSIS_BATCH_OPERATORS", "").split(",") if email.strip()
+]
+
+# 채용공고 목록 응답 캐시
+JOBS_CACHE_MAX_ENTRIES = int(os.getenv("JOBS_CACHE_MAX_ENTRIES", "1024"))
+JOBS_CACHE_TTL_SECONDS = float(os.getenv("JOBS_CACHE_TTL_SECONDS", "300"))
+
+# 채용공고 일괄 적재 (INSERT ... ON CONFLICT 한 번에 보낼 행 수)
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "1000"))
+
+# 인증 사용자 캐시 (워커별, 다른 워커의 변경은 TTL 이내에 반영)
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+
+# 비밀번호 해시 (bcrypt 비용, 워커당 해시 전용 프로세스 수, 대기 포함 최대 동시 해시 수 - 초과 시 503)
+# BCRYPT_ROUNDS를 바꾸면 기존 해시는 다음 로그인 때 새 비용으로 다시 저장된다.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+AUTH_HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", "1"))
+AUTH_HASH_MAX_PENDING = int(os.getenv("AUTH_HASH_MAX_PENDING", "16"))
+
+# Gemini 공유 클라이언트 HTTP 연결 풀 (워커 프로세스당, keep-alive 연결 재사용) 및 요청 타임아웃
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "64"))
+GEMINI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("GEMINI_MAX_KEEPALIVE_CONNECTIONS", "32"))
+GEMINI_KEEPALIVE_SECONDS = float(os.getenv("GEMINI_KEEPALIVE_SECONDS", "60"))
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "120"))
+
+# LLM 게이트웨이: 호출별 마감 시간(재시도 포함, 초), 일시적 오류 재시도 횟수와 백오프 기준(초),
+# 헤지 요청 기준 지연 백분위(0이면 비활성)와 최소 표본 수, 서킷 브레이커(연속 실패 횟수, 차단 시간)
+# LLM_FALLBACK_ENABLED이면 Gemini 장애 시 면접 질문/멘토 피드백을 기본 문구로 대체한다.
+LLM_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "20"))
+LLM_ANALYSIS_DEADLINE_SECONDS = float(os.getenv("LLM_ANALYSIS_DEADLINE_SECONDS", "90"))
+LLM_MAX_ATTEMPTS = int(os.getenv("LLM_MAX_ATTEMPTS", "3"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+LLM_FALLBACK_ENABLED = os.getenv("LLM_FALLBACK_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 업스트림 백엔드: LLM_BACKEND "gemini" | "fake", TTS_BACKEND "google" | "fake"
+# fake는 네트워크/자격 증명 없이 지연 분포와 오류를 흉내 내는 로컬 대역 (부하 테스트용).
+# 지연 분포 형식: "fixed:초", "uniform:최소:최대", "lognormal:중앙값:시그마"
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+TTS_BACKEND = os.getenv("TTS_BACKEND", "google")
+FAKE_LLM_LATENCY = os.getenv("FAKE_LLM_LATENCY", "lognormal:0.8:0.4")
+FAKE_LLM_TOKEN_INTERVAL = float(os.getenv("FAKE_LLM_TOKEN_INTERVAL", "0.03"))
+FAKE_LLM_ERROR_RATE = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+FAKE_TTS_LATENCY = os.getenv("FAKE_TTS_LATENCY", "lognormal:0.3:0.3")
+FAKE_TTS_ERROR_RATE = float(os.getenv("FAKE_TTS_ERROR_RATE", "0"))
+FAKE_BACKEND_SEED = int(os.getenv("FAKE_BACKEND_SEED", "0"))
+
+# 요청별 단계 시간(auth, db, prompt, llm, tts, encode, serialize)을 Server-Timing 응답 헤더로 노출할지 여부
+# (브라우저 개발자 도구에서 확인 가능, 내부 구조가 드러나므로 기본 비활성). 집계는 /metrics에서 항상 제공된다.
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() in ("1", "true", "yes")
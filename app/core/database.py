@@ -1,10 +1,34 @@
-from sqlmodel import create_engine, Session
+import asyncio
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import DATABASE_URL
+from app.core.metrics import record_stage, registry
 
-# DB 연결 풀 설정 (100명 동시 접속 대비)
-engine = create_engine(
-    DATABASE_URL,
+logger = logging.getLogger(__name__)
+
+# 비동기 드라이버 (PostgreSQL: asyncpg, 로컬 SQLite: aiosqlite)
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL with its driver swapped for the async one"""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+# 요청 처리용 비동기 DB 연결 풀 (100명 동시 접속 대비)
+async_engine = create_async_engine(
+    async_database_url(DATABASE_URL),
     echo=False,  # 프로덕션에서는 로그 off (성능 향상)
     pool_size=20,  # 기본 커넥션 풀 크기
     max_overflow=30,  # 추가 가능한 최대 연결 수
@@ -12,7 +36,88 @@ engine = create_engine(
     pool_recycle=3600,  # 1시간마다 연결 재생성 (MySQL timeout 방지)
 )
 
+# 동기 DB 연결 풀: 스크립트(initial_data.py, batch_analysis.py), 스레드에서 도는 분석 워커/색인 재구성, 시작 시 스키마 생성용
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Runs in the caller's context (the async engine drives the driver in a
+    # greenlet of the same task), so queries count towards the request
+    record_stage("db", time.perf_counter() - context._query_started_at)
+
 
-def get_session():
-    with Session(engine) as session:
+for _sync_engine in (engine, async_engine.sync_engine):
+    event.listen(_sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(_sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _pool_connections():
+    """Checked-out and idle connections per engine (pools without counters are skipped)"""
+    values = {}
+    for name, pool in (("async", async_engine.pool), ("sync", engine.pool)):
+        if hasattr(pool, "checkedout"):
+            values[(name, "checked_out")] = pool.checkedout()
+            values[(name, "idle")] = pool.checkedin()
+    return values
+
+
+registry.callback("db_pool_connections", "DB pool connections by engine and state", _pool_connections, ["engine", "state"])
+
+
+def new_async_session() -> AsyncSession:
+    """
+    AsyncSession on the async engine, for use outside a request.
+
+    expire_on_commit is off so attributes stay readable after a commit
+    (an expired attribute would need lazy IO, which AsyncSession forbids).
+    """
+    return AsyncSession(async_engine, expire_on_commit=False)
+
+
+async def get_session():
+    """Request-scoped AsyncSession (FastAPI dependency)"""
+    async with new_async_session() as session:
         yield session
+
+
+async def run_with_sync_session(fn, *args, **kwargs):
+    """
+    Run fn(session, *args, **kwargs) with a sync Session in a worker thread.
+
+    For CPU-heavy helpers (job ranking and search index rebuilds) that
+    must not run on the event loop, and that serialize rebuilds with thread
+    locks held across queries (unsafe under AsyncSession.run_sync).
+    """
+    def call():
+        with Session(engine) as session:
+            return fn(session, *args, **kwargs)
+
+    return await asyncio.to_thread(call)
+
+
+def create_missing_indexes():
+    """
+    Create indexes declared on existing tables.
+
+    create_all only creates indexes together with new tables, so indexes
+    added to a model later are created here (no-op when they exist). A
+    unique index that existing rows violate is skipped with an error log
+    instead of failing startup.
+    """
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except Exception as e:
+                logger.error("Could not create index %s: %s", index.name, e)
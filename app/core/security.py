@@ -1,11 +1,29 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
-from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.core.config import (
+    SECRET_KEY,
+    ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    AUTH_HASH_MAX_PENDING,
+    AUTH_HASH_WORKERS,
+    BCRYPT_ROUNDS,
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes with any other cost fail needs_update() and are rehashed on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS,
+)
 
 
 def hash_password(password: str) -> str:
@@ -16,6 +34,71 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """(valid, new hash if the stored one uses an outdated cost)"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+class HashingBusy(Exception):
+    """Too many password hash operations are already pending"""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a small per-worker process pool.
+
+    bcrypt holds a core for hundreds of milliseconds per call; in a
+    separate process it neither blocks the event loop nor takes the
+    threadpool slots sync routes need, and the pool size caps how many
+    cores a login burst can use. Calls beyond max_pending (running plus
+    queued) raise HashingBusy immediately so callers can shed load instead
+    of queueing without bound.
+    """
+
+    def __init__(self, workers: int = AUTH_HASH_WORKERS, max_pending: int = AUTH_HASH_MAX_PENDING):
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+    def start(self):
+        """Start the pool (otherwise started on first use)"""
+        if self._executor is None:
+            # spawn: forking a worker that already runs gRPC/DB threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def stop(self):
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return await self._run(verify_and_update_password, password, hashed_password)
+
+    async def _run(self, fn, *args):
+        if self._pending >= self.max_pending:
+            raise HashingBusy()
+        self.start()
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+
+password_hasher = PasswordHasher()
+
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
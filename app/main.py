@@ -5,17 +5,42 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlmodel import SQLModel
 
 from app.api.routes import api_router
-from app.core.database import engine
-from app.models import Job, Project, User  # noqa: F401
+from app.api.timing import TimedJSONResponse, TimingMiddleware
+from app.core.database import async_engine, create_missing_indexes, engine
+from app.core.security import password_hasher
+from app.models import AnalysisCache, AnalysisJob, InterviewSession, InterviewTurn, Job, JobSearch, JobTableVersion, Project, User  # noqa: F401
+from app.services.analysis_cache import migrate_analysis_cache
+from app.services.analysis_jobs import analysis_worker_pool
+from app.services.job_ingestion import ensure_natural_key
+from app.services.job_search import create_search_index, sync_search_documents
+from app.services.llm_gateway import llm_gateway
+from app.services.program_catalogue import program_catalogue
+from app.services.session_store import repair_turn_sequence
+from app.services.tts_service import close_tts_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    migrate_analysis_cache(engine)
     SQLModel.metadata.create_all(engine)
+    ensure_natural_key(engine)
+    repair_turn_sequence(engine)
+    create_missing_indexes()
+    create_search_index(engine)
+    sync_search_documents(engine)
+    program_catalogue.load()
+    analysis_worker_pool.start()
+    password_hasher.start()
+    llm_gateway.start()
     yield
+    password_hasher.stop()
+    await analysis_worker_pool.stop()
+    await close_tts_service()
+    await llm_gateway.close()
+    await async_engine.dispose()
 
 
-app = FastAPI(title="Hackathon API", lifespan=lifespan)
+app = FastAPI(title="Hackathon API", lifespan=lifespan, default_response_class=TimedJSONResponse)
 
 # CORS 설정 - 모든 origin 허용
 app.add_middleware(
@@ -26,4 +51,7 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+# 요청별 단계 시간 측정 (/metrics, Server-Timing) - CORS 응답까지 포함하도록 가장 바깥에 둔다
+app.add_middleware(TimingMiddleware)
+
 app.include_router(api_router)
@@ -1,5 +1,17 @@
-from app.models.job import Job
+from app.models.analysis import AnalysisCache, AnalysisJob
+from app.models.interview import InterviewSession, InterviewTurn
+from app.models.job import Job, JobSearch, JobTableVersion
 from app.models.project import Project
 from app.models.user import User
 
-__all__ = ["User", "Project", "Job"]
+__all__ = [
+    "User",
+    "Project",
+    "Job",
+    "JobSearch",
+    "JobTableVersion",
+    "InterviewSession",
+    "InterviewTurn",
+    "AnalysisCache",
+    "AnalysisJob",
+]
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import uuid4
+
+from sqlmodel import Field, SQLModel
+
+
+class AnalysisCache(SQLModel, table=True):
+    # Keyed per user: users with identical inputs each own their row, so
+    # invalidating one user's analyses never touches another's
+    user_id: int = Field(foreign_key="user.id", primary_key=True)
+    # sha256 of the analysis inputs + program catalogue version
+    fingerprint: str = Field(primary_key=True)
+
+    result: str  # PortfolioAnalysisResponse JSON
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class AnalysisJob(SQLModel, table=True):
+    id: str = Field(default_factory=lambda: uuid4().hex, primary_key=True)
+    user_id: int = Field(foreign_key="user.id", index=True)
+
+    status: str = Field(default="queued", index=True)  # queued, running, done, failed
+    fingerprint: str
+    payload: str  # JSON analysis inputs (see build_analysis_payload)
+    result: Optional[str] = None  # PortfolioAnalysisResponse JSON
+    error: Optional[str] = None
+    attempts: int = Field(default=0)
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class InterviewSession(SQLModel, table=True):
+    id: str = Field(default_factory=lambda: uuid4().hex, primary_key=True)
+    user_id: int = Field(foreign_key="user.id", index=True)
+    project_id: int = Field(foreign_key="project.id")
+
+    # Pre-rendered transcript of the verbatim window ("면접관: ...\n지원자: ...\n"),
+    # i.e. turns with seq >= summarized_turns; appended per turn
+    history_text: str = Field(default="")
+    turn_count: int = Field(default=0)
+
+    # Rolling summary of the turns folded out of the verbatim window
+    summary: str = Field(default="")
+    summarized_turns: int = Field(default=0)
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class InterviewTurn(SQLModel, table=True):
+    __table_args__ = (
+        # One turn per position; append_turns reserves positions atomically
+        Index("uq_interviewturn_session_id_seq", "session_id", "seq", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    session_id: str = Field(foreign_key="interviewsession.id", index=True)
+    seq: int
+    role: str  # "interviewer", "user"
+    content: str
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
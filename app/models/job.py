@@ -1,10 +1,19 @@
 from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class Job(SQLModel, table=True):
+    __table_args__ = (
+        # Keyset pagination of the listing, with and without a domain filter
+        Index("ix_job_domain_created_at_id", "domain", "created_at", "id"),
+        Index("ix_job_created_at_id", "created_at", "id"),
+        # Natural key of a posting; ingestion upserts on it (ON CONFLICT)
+        Index("uq_job_company_title", "company", "title", unique=True),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
     company: str
@@ -15,3 +24,16 @@ class Job(SQLModel, table=True):
 
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class JobTableVersion(SQLModel, table=True):
+    # One-row counter bumped by every job write (see app/services/job_listing.py)
+    id: int = Field(default=1, primary_key=True)
+    version: int = 0
+
+
+class JobSearch(SQLModel, table=True):
+    # Full-text document of a job (see app/services/job_search.py)
+    job_id: int = Field(foreign_key="job.id", primary_key=True)
+    tokens: str  # Space separated search tokens (Hangul bigrams + Latin words)
+    indexed_at: datetime  # updated_at of the job when it was tokenized
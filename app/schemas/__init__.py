@@ -1,14 +1,34 @@
-from app.schemas.analysis import PortfolioAnalysisResponse, RecommendedProgram
+from app.schemas.analysis import (
+    AnalysisJobResponse,
+    BatchAnalysisRequest,
+    JobRankingResponse,
+    PortfolioAnalysisResponse,
+    RankedJob,
+    RecommendedProgram,
+    SkillMatchPreviewResponse,
+)
 from app.schemas.interview import (
+    AudioFormat,
     ConversationMessage,
     InterviewerChatRequest,
     InterviewerChatResponse,
     InterviewStartResponse,
+    InterviewTurnRequest,
+    InterviewTurnResponse,
     MentorChatRequest,
     MentorChatResponse,
     ProjectInfo,
 )
-from app.schemas.job import JobCreate, JobResponse, JobUpdate
+from app.schemas.job import (
+    JobCreate,
+    JobResponse,
+    JobSearchHit,
+    JobSearchResponse,
+    JobsResponse,
+    JobSummary,
+    JobUpdate,
+)
+from app.schemas.metrics import ConnectionPoolStats, LatencyPercentiles, LLMClientMetrics, LLMGatewayStats
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
 from app.schemas.user import SurveyCreate, UserCreate, UserLogin, UserResponse, PortfolioCreate
 
@@ -23,14 +43,30 @@ __all__ = [
     "JobCreate",
     "JobUpdate",
     "JobResponse",
+    "JobsResponse",
+    "JobSearchHit",
+    "JobSearchResponse",
+    "JobSummary",
     "PortfolioCreate",
+    "AudioFormat",
     "ConversationMessage",
     "InterviewerChatRequest",
     "InterviewerChatResponse",
     "InterviewStartResponse",
+    "InterviewTurnRequest",
+    "InterviewTurnResponse",
     "MentorChatRequest",
     "MentorChatResponse",
     "ProjectInfo",
     "PortfolioAnalysisResponse",
+    "AnalysisJobResponse",
+    "BatchAnalysisRequest",
+    "JobRankingResponse",
+    "RankedJob",
     "RecommendedProgram",
+    "SkillMatchPreviewResponse",
+    "ConnectionPoolStats",
+    "LLMClientMetrics",
+    "LatencyPercentiles",
+    "LLMGatewayStats",
 ]
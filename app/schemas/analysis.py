@@ -1,6 +1,10 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
+from app.core.config import ANALYSIS_BATCH_MAX_USERS
+
 class RecommendedProgram(BaseModel):
     """Training program recommended by AI"""
     program_name: str
@@ -22,3 +26,44 @@ class PortfolioAnalysisResponse(BaseModel):
     recommended_programs: List[RecommendedProgram]
     analyzed_project: Optional[str] = None
     analyzed_job: Optional[str] = None
+
+
+class SkillMatchPreviewResponse(BaseModel):
+    """Response for POST /analysis/portfolio/preview"""
+    matched_skills: List[str]
+    missing_skills: List[str]
+    extra_skills: List[str]
+    score: int  # 0-100, share of required skill weight covered
+    analyzed_project: Optional[str] = None
+    analyzed_job: Optional[str] = None
+
+
+class RankedJob(BaseModel):
+    """A job posting ranked against the user's skills"""
+    id: int
+    company: str
+    title: str
+    domain: Optional[str] = None
+    score: int  # 0-100, share of the job's skill weight covered
+    matched_skills: List[str]
+    missing_skills: List[str]
+
+
+class JobRankingResponse(BaseModel):
+    """Response for GET /analysis/jobs"""
+    jobs: List[RankedJob]
+
+
+class AnalysisJobResponse(BaseModel):
+    """Response for POST /analysis/portfolio/jobs and GET /analysis/portfolio/jobs/{job_id}"""
+    job_id: str
+    status: str  # queued, running, done, failed
+    result: Optional[PortfolioAnalysisResponse] = None
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class BatchAnalysisRequest(BaseModel):
+    """Request for POST /analysis/batch"""
+    user_ids: List[int] = Field(min_length=1, max_length=ANALYSIS_BATCH_MAX_USERS)
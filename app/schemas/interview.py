@@ -1,7 +1,15 @@
+from enum import Enum
+
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
 
+class AudioFormat(str, Enum):
+    """How TTS audio is delivered in interview responses"""
+    BASE64 = "base64"  # data:audio/mp3;base64,... inline in JSON
+    URL = "url"  # audio_url pointing at GET /interview/audio/{audio_id}
+
+
 class ConversationMessage(BaseModel):
     """A single message in the conversation history"""
     role: str  # "interviewer", "user", "mentor"
@@ -18,26 +26,33 @@ class ProjectInfo(BaseModel):
 class InterviewStartResponse(BaseModel):
     """Response for POST /interview/start"""
     message: str
-    audio: str
+    audio: Optional[str] = None
+    audio_url: Optional[str] = None
     project: ProjectInfo
+    session_id: Optional[str] = None
 
 
 class InterviewerChatRequest(BaseModel):
     """Request for POST /interview/chat/interviewer"""
     user_answer: str = Field(..., min_length=1, max_length=2000)
+    # With session_id the server-side transcript is used and conversation_history is ignored
+    session_id: Optional[str] = None
     conversation_history: Optional[List[ConversationMessage]] = []
 
 
 class InterviewerChatResponse(BaseModel):
     """Response for POST /interview/chat/interviewer"""
     message: str
-    audio: str
+    audio: Optional[str] = None
+    audio_url: Optional[str] = None
 
 
 class MentorChatRequest(BaseModel):
     """Request for POST /interview/chat/mentor"""
-    interviewer_question: str = Field(..., min_length=1)
+    # Optional with session_id: defaults to the question the answer responded to
+    interviewer_question: Optional[str] = Field(None, min_length=1)
     user_answer: str = Field(..., min_length=1, max_length=2000)
+    session_id: Optional[str] = None
     conversation_history: Optional[List[ConversationMessage]] = []
 
 
@@ -45,3 +60,18 @@ class MentorChatResponse(BaseModel):
     """Response for POST /interview/chat/mentor"""
     feedback: str
     tips: List[str]
+
+
+class InterviewTurnRequest(BaseModel):
+    """Request for POST /interview/chat/turn"""
+    user_answer: str = Field(..., min_length=1, max_length=2000)
+    session_id: Optional[str] = None
+    # Question the answer responded to; inferred from the session or history if omitted
+    interviewer_question: Optional[str] = Field(None, min_length=1)
+    conversation_history: Optional[List[ConversationMessage]] = []
+
+
+class InterviewTurnResponse(BaseModel):
+    """Response for POST /interview/chat/turn"""
+    interviewer: InterviewerChatResponse
+    mentor: MentorChatResponse
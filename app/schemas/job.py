@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
@@ -31,5 +32,24 @@ class JobResponse(BaseModel):
         from_attributes = True
 
 
+class JobSummary(BaseModel):
+    """List view of a job (no description)"""
+    id: int
+    company: str
+    title: str
+    domain: Optional[str] = None
+    skills_required: Optional[str] = None
+    created_at: datetime
+
+
 class JobsResponse(BaseModel):
-    jobs: list[JobResponse]
+    jobs: list[JobSummary]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
+
+
+class JobSearchHit(JobSummary):
+    score: float  # Relevance, higher is better (scale depends on the database)
+
+
+class JobSearchResponse(BaseModel):
+    jobs: list[JobSearchHit]
@@ -0,0 +1,30 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+class ConnectionPoolStats(BaseModel):
+    requests: int
+    connections_opened: int
+    connections_reused: int
+    reuse_ratio: float
+
+
+class LatencyPercentiles(BaseModel):
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+
+
+class LLMGatewayStats(BaseModel):
+    circuit: str  # closed, open or half_open
+    calls: int
+    retries: int
+    hedged: int
+    rejected: int
+    unavailable: int
+    latency: Dict[str, LatencyPercentiles]
+
+
+class LLMClientMetrics(BaseModel):
+    gemini: ConnectionPoolStats
+    gateway: LLMGatewayStats
@@ -1,4 +1,4 @@
 from .llm_service import LLMService
-from .tts_service import TTSService
+from .tts_service import TTSService, close_tts_service, get_tts_service
 
-__all__ = ["LLMService", "TTSService"]
+__all__ = ["LLMService", "TTSService", "get_tts_service", "close_tts_service"]
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import logging
+from typing import Optional
+
+from sqlalchemy import delete, inspect
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import AnalysisCache
+
+logger = logging.getLogger(__name__)
+
+
+def analysis_fingerprint(
+    user_data: dict,
+    project_data: dict,
+    job_data: dict,
+    catalogue_version: str
+) -> str:
+    """Hash of everything that determines a portfolio analysis result"""
+    payload = json.dumps(
+        {
+            "user": user_data,
+            "project": project_data,
+            "job": job_data,
+            "catalogue": catalogue_version,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_analysis(session: Session, user_id: int, fingerprint: str) -> Optional[dict]:
+    """Return the user's stored analysis result for the fingerprint, if any"""
+    entry = session.get(AnalysisCache, (user_id, fingerprint))
+    if entry is None:
+        return None
+    return json.loads(entry.result)
+
+
+def store_analysis(session: Session, fingerprint: str, user_id: int, result: dict):
+    """Persist a successful analysis result for the user"""
+    session.merge(
+        AnalysisCache(
+            fingerprint=fingerprint,
+            user_id=user_id,
+            result=json.dumps(result, ensure_ascii=False),
+        )
+    )
+    session.commit()
+
+
+async def invalidate_user_analyses(session: AsyncSession, user_id: int):
+    """
+    Drop cached analyses of a user whose profile or projects changed.
+
+    Changed inputs already produce a new fingerprint; this removes the
+    now-unreachable rows. The caller commits.
+    """
+    await session.exec(delete(AnalysisCache).where(AnalysisCache.user_id == user_id))
+
+
+def migrate_analysis_cache(engine: Engine):
+    """
+    Drop an analysiscache table still keyed on the fingerprint alone.
+
+    That key let users with identical inputs overwrite each other's row.
+    The table only holds cached results, so it is recreated empty by
+    create_all (run this first) rather than migrated.
+    """
+    table = AnalysisCache.__tablename__
+    inspector = inspect(engine)
+    if not inspector.has_table(table):
+        return
+    if inspector.get_pk_constraint(table)["constrained_columns"] == ["fingerprint"]:
+        logger.warning("Recreating %s keyed on (user_id, fingerprint); cached analyses are dropped", table)
+        AnalysisCache.__table__.drop(engine)
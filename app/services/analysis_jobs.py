@@ -0,0 +1,228 @@
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, update
+from sqlmodel import Session, select
+
+from app.core.config import (
+    ANALYSIS_JOB_MAX_ATTEMPTS,
+    ANALYSIS_JOB_POLL_SECONDS,
+    ANALYSIS_JOB_TIMEOUT_SECONDS,
+    ANALYSIS_WORKER_CONCURRENCY,
+    LLM_BREAKER_RESET_SECONDS,
+)
+from app.core.database import engine
+from app.models import AnalysisJob
+from app.services.analysis_cache import store_analysis
+from app.services.llm_gateway import CircuitOpen, LLMUnavailable
+from app.services.portfolio_analysis import run_portfolio_analysis
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_analysis(
+    session: Session,
+    user_id: int,
+    fingerprint: str,
+    payload: dict,
+    result: Optional[dict] = None
+) -> AnalysisJob:
+    """
+    Create an analysis job, or return the user's pending job for the same inputs.
+
+    When result is given (e.g. from the analysis cache) the job is created
+    already done.
+    """
+    if result is None:
+        pending = session.exec(
+            select(AnalysisJob).where(
+                AnalysisJob.user_id == user_id,
+                AnalysisJob.fingerprint == fingerprint,
+                AnalysisJob.status.in_(["queued", "running"]),
+            )
+        ).first()
+        if pending:
+            return pending
+
+    now = datetime.now(timezone.utc)
+    job = AnalysisJob(
+        user_id=user_id,
+        fingerprint=fingerprint,
+        payload=json.dumps(payload, ensure_ascii=False),
+        status="done" if result is not None else "queued",
+        result=json.dumps(result, ensure_ascii=False) if result is not None else None,
+        finished_at=now if result is not None else None,
+    )
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+
+    if result is None:
+        analysis_worker_pool.notify()
+    return job
+
+
+def get_analysis_job(session: Session, job_id: str, user_id: int) -> Optional[AnalysisJob]:
+    """Return the job if it exists and belongs to user_id"""
+    job = session.get(AnalysisJob, job_id)
+    if job is None or job.user_id != user_id:
+        return None
+    return job
+
+
+def _claim_next_job() -> Optional[AnalysisJob]:
+    """
+    Atomically move the oldest runnable job to "running".
+
+    Runnable means queued, or running for longer than the job timeout
+    (its worker died) with attempts left. Stale jobs that used up
+    ANALYSIS_JOB_MAX_ATTEMPTS are marked failed instead, so a job that
+    keeps crashing or hanging its worker is not reclaimed forever. The
+    conditional UPDATE makes the claim safe across workers and processes
+    without an external broker.
+    """
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=ANALYSIS_JOB_TIMEOUT_SECONDS)
+    stale = and_(AnalysisJob.status == "running", AnalysisJob.started_at < stale_before)
+    runnable = or_(
+        AnalysisJob.status == "queued",
+        and_(stale, AnalysisJob.attempts < ANALYSIS_JOB_MAX_ATTEMPTS),
+    )
+
+    with Session(engine) as session:
+        session.exec(
+            update(AnalysisJob)
+            .where(stale, AnalysisJob.attempts >= ANALYSIS_JOB_MAX_ATTEMPTS)
+            .values(
+                status="failed",
+                error=f"Timed out after {ANALYSIS_JOB_MAX_ATTEMPTS} attempts",
+                finished_at=now,
+            )
+        )
+        session.commit()
+        candidates = session.exec(
+            select(AnalysisJob.id)
+            .where(runnable)
+            .order_by(AnalysisJob.created_at)
+            .limit(5)
+        ).all()
+        for job_id in candidates:
+            # Another consumer may have claimed it since the SELECT
+            claimed = session.exec(
+                update(AnalysisJob)
+                .where(AnalysisJob.id == job_id, runnable)
+                .values(status="running", started_at=now, attempts=AnalysisJob.attempts + 1)
+            )
+            session.commit()
+            if claimed.rowcount == 1:
+                return session.get(AnalysisJob, job_id)
+    return None
+
+
+def _finish_job(
+    job_id: str,
+    result: Optional[dict] = None,
+    error: Optional[str] = None,
+    retryable: bool = False
+):
+    """
+    Record a job's result, or its error.
+
+    Only retryable errors (Gemini unavailable) are requeued, until
+    ANALYSIS_JOB_MAX_ATTEMPTS; deterministic ones (AnalysisError, invalid
+    output, missing API key) would fail the same way again, so they fail
+    the job at once.
+    """
+    with Session(engine) as session:
+        job = session.get(AnalysisJob, job_id)
+        if job is None:
+            return
+        if result is not None:
+            job.status = "done"
+            job.result = json.dumps(result, ensure_ascii=False)
+            job.error = None
+        elif retryable and job.attempts < ANALYSIS_JOB_MAX_ATTEMPTS:
+            # Transient failure: let any worker retry it
+            job.status = "queued"
+            job.error = error
+        else:
+            job.status = "failed"
+            job.error = error
+        job.finished_at = datetime.now(timezone.utc) if job.status != "queued" else None
+        session.add(job)
+        session.commit()
+
+        if result is not None:
+            store_analysis(session, job.fingerprint, job.user_id, result)
+
+
+class AnalysisWorkerPool:
+    """
+    In-process workers that drain the DB-backed analysis job queue.
+
+    Every uvicorn worker runs ``concurrency`` consumers, so at most
+    workers x concurrency Gemini analyses run at once regardless of how
+    many jobs are enqueued. Consumers wake immediately on a local enqueue
+    and otherwise poll the table, which picks up jobs enqueued by other
+    processes and retries stale ones.
+    """
+
+    def __init__(self, concurrency: int = ANALYSIS_WORKER_CONCURRENCY):
+        self.concurrency = concurrency
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._consume()) for _ in range(self.concurrency)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self):
+        """Wake idle consumers after a job was enqueued in this process"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _consume(self):
+        while True:
+            try:
+                job = await asyncio.to_thread(_claim_next_job)
+            except Exception:
+                logger.exception("Failed to claim analysis job")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), ANALYSIS_JOB_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run(job)
+
+    async def _run(self, job: AnalysisJob):
+        try:
+            result = await run_portfolio_analysis(json.loads(job.payload))
+        except LLMUnavailable as e:
+            # llm_gateway already retried transient errors within this attempt
+            logger.warning("Analysis job %s: Gemini unavailable (attempt %d): %s", job.id, job.attempts, e)
+            await asyncio.to_thread(_finish_job, job.id, None, str(e), True)
+            if isinstance(e, CircuitOpen):
+                # Every claim would be rejected until the breaker half-opens
+                await asyncio.sleep(LLM_BREAKER_RESET_SECONDS)
+        except Exception as e:
+            logger.warning("Analysis job %s failed: %s", job.id, e)
+            await asyncio.to_thread(_finish_job, job.id, None, str(e))
+        else:
+            await asyncio.to_thread(_finish_job, job.id, result)
+
+
+analysis_worker_pool = AnalysisWorkerPool()
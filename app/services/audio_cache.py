@@ -0,0 +1,193 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class AudioCache:
+    """
+    Synthesized audio cache with an in-process LRU tier and an optional
+    on-disk content-addressed tier.
+
+    The memory tier is bounded by total bytes and entry age (TTL). The disk
+    tier stores one file per key under ``disk_dir`` and is shared by every
+    uvicorn worker on the host, so a phrase synthesized by one worker is a
+    hit for all of them.
+    """
+
+    # Prune the disk tier after this many writes
+    DISK_PRUNE_INTERVAL = 100
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 0
+    ):
+        """
+        Args:
+            max_bytes: Memory tier budget in bytes (0 disables the memory tier)
+            ttl_seconds: Entry lifetime in seconds for both tiers (0 = no expiry)
+            disk_dir: Directory for the shared disk tier (None disables it)
+            disk_max_bytes: Disk tier budget in bytes (0 = unbounded)
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._size = 0
+        self._disk_writes = 0
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(text: str, voice: str, speaking_rate: float, sample_rate_hertz: int) -> str:
+        """Content address for a synthesis request"""
+        key_string = f"{voice}\x00{speaking_rate:.3f}\x00{sample_rate_hertz}\x00{text}"
+        return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio bytes, or None on a miss"""
+        audio = self._get_memory(key)
+        if audio is not None:
+            self.hits += 1
+            return audio
+
+        if self.disk_dir is not None:
+            audio = await asyncio.to_thread(self._read_disk, key)
+            if audio is not None:
+                self.disk_hits += 1
+                self._put_memory(key, audio)
+                return audio
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, audio: bytes):
+        """Store audio bytes in every enabled tier"""
+        self._put_memory(key, audio)
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, audio)
+
+    def clear(self):
+        """Drop the memory tier (the shared disk tier is left intact)"""
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters and current memory usage"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    # Memory tier
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds
+
+    def _get_memory(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        audio, stored_at = entry
+        if self._expired(stored_at):
+            self._remove(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return audio
+
+    def _put_memory(self, key: str, audio: bytes):
+        if len(audio) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (audio, time.time())
+        self._size += len(audio)
+        while self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        audio, _ = self._entries.pop(key)
+        self._size -= len(audio)
+
+    # Disk tier
+
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.mp3"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            if self._expired(path.stat().st_mtime):
+                path.unlink(missing_ok=True)
+                self.expirations += 1
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key: str, audio: bytes):
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # Write to a temp file then rename so other workers never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._disk_writes += 1
+        if self._disk_writes % self.DISK_PRUNE_INTERVAL == 0:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Remove expired files, then the oldest files beyond disk_max_bytes"""
+        files = []
+        total = 0
+        for path in self.disk_dir.glob("*/*.mp3"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if self._expired(stat.st_mtime):
+                path.unlink(missing_ok=True)
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if self.disk_max_bytes <= 0 or total <= self.disk_max_bytes:
+            return
+        for _, size, path in sorted(files):
+            path.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+            if total <= self.disk_max_bytes:
+                break
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import logging
+import random
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.core.config import ANALYSIS_BATCH_CONCURRENCY, ANALYSIS_JOB_MAX_ATTEMPTS, LLM_BREAKER_RESET_SECONDS
+from app.core.database import engine
+from app.models import AnalysisCache, Job, Project, User
+from app.services.analysis_cache import store_analysis
+from app.services.job_index import job_index
+from app.services.llm_gateway import CircuitOpen
+from app.services.portfolio_analysis import (
+    build_payload,
+    owned_skills,
+    payload_fingerprint,
+    run_portfolio_analysis,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def load_batch_payloads(session: Session, user_ids: List[int]) -> Tuple[Dict[int, dict], Dict[int, str]]:
+    """
+    Bulk-load analysis inputs for many users.
+
+    One query each for the users, their latest projects and the selected
+    jobs; job selection itself runs on the in-memory job index.
+
+    Returns:
+        (payloads by user id, error message by user id)
+    """
+    payloads: Dict[int, dict] = {}
+    errors: Dict[int, str] = {}
+
+    users = {user.id: user for user in session.exec(select(User).where(User.id.in_(user_ids)))}
+
+    latest = (
+        select(
+            Project.id,
+            func.row_number().over(
+                partition_by=Project.user_id,
+                order_by=(Project.created_at.desc(), Project.id.desc())
+            ).label("position")
+        )
+        .where(Project.user_id.in_(list(users)))
+        .subquery()
+    )
+    projects = {
+        project.user_id: project
+        for project in session.exec(
+            select(Project).join(latest, Project.id == latest.c.id).where(latest.c.position == 1)
+        )
+    }
+
+    selected_jobs: Dict[int, int] = {}
+    for user_id in user_ids:
+        user = users.get(user_id)
+        if user is None:
+            errors[user_id] = "사용자를 찾을 수 없습니다."
+        elif not user.domain:
+            errors[user_id] = "사용자의 도메인이 설정되지 않았습니다. 먼저 설문조사를 완료해주세요."
+        elif user_id not in projects:
+            errors[user_id] = "분석할 프로젝트가 없습니다. 먼저 프로젝트를 등록해주세요."
+        else:
+            ranked = job_index.rank(
+                session, owned_skills(user, projects[user_id]), domain=user.domain, limit=1
+            )
+            if ranked:
+                selected_jobs[user_id] = ranked[0].job_id
+            else:
+                errors[user_id] = f"{user.domain} 도메인에 매칭되는 채용공고를 찾을 수 없습니다."
+
+    jobs = {
+        job.id: job
+        for job in session.exec(select(Job).where(Job.id.in_(set(selected_jobs.values()))))
+    }
+    for user_id, job_id in selected_jobs.items():
+        payloads[user_id] = build_payload(users[user_id], projects[user_id], jobs[job_id])
+
+    return payloads, errors
+
+
+async def stream_batch_analysis(
+    user_ids: List[int],
+    concurrency: int = ANALYSIS_BATCH_CONCURRENCY,
+    max_attempts: int = ANALYSIS_JOB_MAX_ATTEMPTS
+) -> AsyncIterator[dict]:
+    """
+    Analyze many users' portfolios, yielding one record per user as it finishes.
+
+    Users whose inputs are identical share a single analysis, cached inputs
+    skip the LLM, and at most ``concurrency`` Gemini calls run at once.
+    Transient upstream errors are retried by llm_gateway alone; an analysis
+    is only retried here (up to ``max_attempts`` times) when the circuit
+    breaker rejected it without calling Gemini, after the breaker's reset
+    time. Other errors fail the item at once. The last record is a summary.
+
+    Yields:
+        {"user_id", "status": "done", "cached", "result"} or
+        {"user_id", "status": "failed", "error"}, then {"summary": {...}}
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+
+    def load():
+        with Session(engine) as session:
+            payloads, errors = load_batch_payloads(session, user_ids)
+            fingerprints = {user_id: payload_fingerprint(payload) for user_id, payload in payloads.items()}
+            # Any user's row for a fingerprint holds the result for those inputs
+            cached = {
+                entry.fingerprint: json.loads(entry.result)
+                for entry in session.exec(
+                    select(AnalysisCache).where(AnalysisCache.fingerprint.in_(set(fingerprints.values())))
+                )
+            }
+            return payloads, errors, fingerprints, cached
+
+    payloads, errors, fingerprints, cached = await asyncio.to_thread(load)
+    summary = {"total": len(user_ids), "done": 0, "failed": 0, "cached": 0, "analyses": 0}
+
+    for user_id, error in errors.items():
+        summary["failed"] += 1
+        yield {"user_id": user_id, "status": "failed", "error": error}
+
+    # Deduplicate identical inputs
+    groups: Dict[str, List[int]] = {}
+    for user_id, fingerprint in fingerprints.items():
+        groups.setdefault(fingerprint, []).append(user_id)
+
+    pending: Dict[str, List[int]] = {}
+    for fingerprint, members in groups.items():
+        if fingerprint in cached:
+            for user_id in members:
+                summary["done"] += 1
+                summary["cached"] += 1
+                yield {"user_id": user_id, "status": "done", "cached": True, "result": cached[fingerprint]}
+        else:
+            pending[fingerprint] = members
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def analyze(fingerprint: str) -> Tuple[str, Optional[dict], Optional[str]]:
+        payload = payloads[pending[fingerprint][0]]
+        for attempt in range(1, max_attempts + 1):
+            try:
+                async with semaphore:
+                    result = await run_portfolio_analysis(payload)
+            except CircuitOpen as e:
+                if attempt == max_attempts:
+                    return fingerprint, None, str(e)
+                # Wait out the open breaker outside the semaphore so other analyses proceed
+                delay = LLM_BREAKER_RESET_SECONDS * random.uniform(1.0, 1.5)
+                logger.warning("Batch analysis rejected by open circuit, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                return fingerprint, None, str(e)
+            else:
+                await asyncio.to_thread(_store, fingerprint, pending[fingerprint], result)
+                return fingerprint, result, None
+
+    tasks = [asyncio.create_task(analyze(fingerprint)) for fingerprint in pending]
+    summary["analyses"] = len(tasks)
+    try:
+        for finished in asyncio.as_completed(tasks):
+            fingerprint, result, error = await finished
+            for user_id in pending[fingerprint]:
+                if result is not None:
+                    summary["done"] += 1
+                    yield {"user_id": user_id, "status": "done", "cached": False, "result": result}
+                else:
+                    summary["failed"] += 1
+                    yield {"user_id": user_id, "status": "failed", "error": error}
+    finally:
+        # The client went away or the consumer stopped early
+        for task in tasks:
+            task.cancel()
+
+    yield {"summary": summary}
+
+
+def _store(fingerprint: str, user_ids: List[int], result: dict):
+    """Store a shared result for every user it was computed for"""
+    with Session(engine) as session:
+        for user_id in user_ids:
+            store_analysis(session, fingerprint, user_id, result)
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.config import (
+    INTERVIEW_CONTEXT_PROJECT_TOKENS,
+    INTERVIEW_CONTEXT_RECENT_TURNS,
+    INTERVIEW_CONTEXT_SUMMARY_TOKENS,
+    INTERVIEW_CONTEXT_TURN_TOKENS,
+)
+from app.core.database import new_async_session
+
+logger = logging.getLogger(__name__)
+
+_HANGUL = re.compile(r"[가-힣ㄱ-ㆎ]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough Gemini token estimate without a tokenizer call.
+
+    Hangul syllables cost roughly one token each; other text averages about
+    four characters per token.
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int, keep: str = "head") -> str:
+    """Trim text to roughly max_tokens, keeping its head or tail"""
+    if not text or estimate_tokens(text) <= max_tokens:
+        return text or ""
+    # Binary search the longest prefix/suffix that fits
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        piece = text[:mid] if keep == "head" else text[-mid:]
+        if estimate_tokens(piece) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + "…" if keep == "head" else "…" + text[-low:]
+
+
+class ContextBudget:
+    """
+    Keeps interviewer/mentor prompts within a fixed budget.
+
+    - The last ``recent_turns`` turns are kept verbatim (each capped at
+      ``turn_tokens``).
+    - Older turns are folded into a rolling summary of at most
+      ``summary_tokens``. Server-side sessions fold with the LLM in the
+      background (see compact_session). Stateless requests use a cheap
+      extractive fallback.
+    - Project fields are truncated to ``project_tokens`` each.
+    """
+
+    def __init__(
+        self,
+        recent_turns: int = INTERVIEW_CONTEXT_RECENT_TURNS,
+        project_tokens: int = INTERVIEW_CONTEXT_PROJECT_TOKENS,
+        summary_tokens: int = INTERVIEW_CONTEXT_SUMMARY_TOKENS,
+        turn_tokens: int = INTERVIEW_CONTEXT_TURN_TOKENS
+    ):
+        self.recent_turns = recent_turns
+        self.project_tokens = project_tokens
+        self.summary_tokens = summary_tokens
+        self.turn_tokens = turn_tokens
+
+    def project_context(self, project_context: Dict[str, str]) -> Dict[str, str]:
+        """Truncate the long free-text project fields"""
+        trimmed = dict(project_context)
+        for field in ("content", "results"):
+            if trimmed.get(field):
+                trimmed[field] = truncate_to_tokens(trimmed[field], self.project_tokens)
+        return trimmed
+
+    def needs_compaction(self, window_turns: int) -> bool:
+        """
+        Whether a session's verbatim window should be folded.
+
+        Folding waits until the window holds twice the verbatim limit, so
+        the summarization call runs once every ``recent_turns`` turns.
+        """
+        return window_turns > 2 * self.recent_turns
+
+    def render(self, summary: str, window_text: str) -> str:
+        """Compose the prompt history block from summary + verbatim window"""
+        window_text = truncate_to_tokens(
+            window_text, self.turn_tokens * self.recent_turns * 2, keep="tail"
+        )
+        if not summary:
+            return window_text
+        return f"[이전 대화 요약]\n{summary}\n\n[최근 대화]\n{window_text}"
+
+    def compact_history(self, history: List[Dict], render_turn) -> str:
+        """Render a client-sent history within budget (no LLM call)"""
+        older = history[:-self.recent_turns] if self.recent_turns else history
+        recent = history[len(older):]
+        window_text = "".join(
+            render_turn(msg["role"], truncate_to_tokens(msg["content"], self.turn_tokens))
+            for msg in recent
+        )
+        summary = self.extractive_summary("", [(msg["role"], msg["content"]) for msg in older], render_turn)
+        return self.render(summary, window_text)
+
+    def extractive_summary(
+        self,
+        summary: str,
+        turns: List[Tuple[str, str]],
+        render_turn
+    ) -> str:
+        """Fallback summary: previous summary plus the first line of each folded turn"""
+        if not turns:
+            return summary
+        snippets = "".join(render_turn(role, truncate_to_tokens(content, 40)) for role, content in turns)
+        combined = f"{summary}\n{snippets}" if summary else snippets
+        return truncate_to_tokens(combined.strip(), self.summary_tokens, keep="tail")
+
+
+# Sessions this worker is currently compacting, and strong refs to the tasks
+_compacting: Set[str] = set()
+_compaction_tasks: Set[asyncio.Task] = set()
+
+
+def schedule_compaction(session_id: str):
+    """Fold old turns of a session into its summary in the background"""
+    if session_id in _compacting:
+        return
+    _compacting.add(session_id)
+    task = asyncio.create_task(compact_session(session_id))
+    _compaction_tasks.add(task)
+
+    def done(finished: asyncio.Task):
+        _compaction_tasks.discard(finished)
+        _compacting.discard(session_id)
+
+    task.add_done_callback(done)
+
+
+async def compact_session(session_id: str, budget: Optional[ContextBudget] = None):
+    """
+    Fold all but the last ``recent_turns`` window turns into the session summary.
+
+    The fold is applied only if no other worker folded the session in the
+    meantime. Turns appended while the summary was being generated are kept.
+    """
+    # Imported here: both modules depend on this one
+    from app.services.llm_service import LLMService
+    from app.services.session_store import build_session_store
+
+    budget = budget or ContextBudget()
+
+    async def load():
+        async with new_async_session() as db:
+            store = build_session_store(db)
+            interview_session = await store.get_by_id(session_id)
+            if interview_session is None:
+                return None
+            start = interview_session.summarized_turns
+            end = interview_session.turn_count - budget.recent_turns
+            if end <= start:
+                return None
+            turns = [(t.role, t.content) for t in await store.list_turns(session_id, start, end)]
+            return interview_session.summary, start, turns
+
+    try:
+        loaded = await load()
+        if loaded is None:
+            return
+        summary, start, turns = loaded
+
+        llm_service = LLMService()
+        folded_text = "".join(LLMService.render_turn(role, content) for role, content in turns)
+        try:
+            new_summary = await llm_service.summarize_history(summary, folded_text)
+            new_summary = truncate_to_tokens(new_summary, budget.summary_tokens, keep="tail")
+        except Exception as e:
+            logger.warning("LLM summary failed for session %s, using extractive summary: %s", session_id, e)
+            new_summary = budget.extractive_summary(summary, turns, LLMService.render_turn)
+
+        async with new_async_session() as db:
+            folded = await build_session_store(db).fold(
+                session_id,
+                expected_summarized_turns=start,
+                folded_turns=len(turns),
+                folded_prefix_length=len(folded_text),
+                summary=new_summary
+            )
+        if folded:
+            logger.info("Folded %d turns of session %s into summary", len(turns), session_id)
+    except Exception:
+        logger.exception("Session compaction failed for %s", session_id)
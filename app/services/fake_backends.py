@@ -0,0 +1,221 @@
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+from typing import AsyncIterator, List, Optional, Tuple
+
+from google.genai import errors
+
+from app.core.config import (
+    FAKE_BACKEND_SEED,
+    FAKE_LLM_ERROR_RATE,
+    FAKE_LLM_LATENCY,
+    FAKE_LLM_TOKEN_INTERVAL,
+    FAKE_TTS_ERROR_RATE,
+    FAKE_TTS_LATENCY,
+)
+from app.services.context_budget import estimate_tokens
+from app.services.llm_metrics import record_tokens
+
+# Silent MPEG-2 Layer III frame: 24 kHz mono, 32 kbps, 576 samples (24 ms)
+_MP3_FRAME = b"\xff\xf3\x44\xc0" + bytes(92)
+_MP3_FRAME_SECONDS = 576 / 24000
+# Approximate Korean speaking speed at speaking_rate 1.0
+_CHARS_PER_SECOND = 7.0
+
+_QUESTIONS = [
+    "방금 설명하신 구조에서 트래픽이 열 배로 늘어나면 가장 먼저 병목이 생기는 지점은 어디이고, 어떻게 대응하시겠습니까?",
+    "그 기술을 선택한 이유와, 검토했던 다른 대안과 비교한 장단점을 구체적으로 설명해 주세요.",
+    "해당 기능에서 장애가 발생했을 때 원인을 어떻게 추적하셨는지, 사용한 지표나 로그를 예로 들어 주세요.",
+    "데이터 정합성이 깨질 수 있는 상황을 하나 들고, 이를 어떤 방식으로 방지하셨는지 말씀해 주세요.",
+    "본인이 직접 구현한 부분 중 성능을 가장 크게 개선한 변경은 무엇이었고, 개선 폭은 어떻게 측정하셨나요?",
+]
+
+_TIPS = [
+    "답변의 첫 문장에 결론을 먼저 말해 보세요.",
+    "성과는 가능한 한 수치로 표현하세요.",
+    "기술 선택의 근거를 대안과 비교해 설명하세요.",
+    "본인의 역할과 팀의 역할을 구분해서 말하세요.",
+    "경험을 구조화해서 설명하세요 (STAR 기법).",
+]
+
+
+class LatencyDistribution:
+    """
+    Simulated upstream latency in seconds, parsed from a spec string.
+
+    Specs:
+        fixed:S                 always S
+        uniform:LOW:HIGH        uniform between LOW and HIGH
+        lognormal:MEDIAN:SIGMA  log-normal with the given median (long right tail)
+    """
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        kind, *params = spec.split(":")
+        try:
+            values = [float(p) for p in params]
+        except ValueError:
+            raise ValueError(f"Invalid latency spec: {spec!r}")
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2}.get(kind)
+        if expected is None or len(values) != expected:
+            raise ValueError(f"Invalid latency spec: {spec!r}")
+        self.kind = kind
+        self.params = values
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        median, sigma = self.params
+        return median * math.exp(rng.gauss(0, sigma)) if median > 0 else 0.0
+
+
+class _FakeUpstream:
+    """Seeded latency and error injection shared by the fake backends"""
+
+    def __init__(self, latency: str, error_rate: float, seed: Optional[int]):
+        self.latency = LatencyDistribution(latency)
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> Tuple[float, bool]:
+        """(latency, whether this call fails)"""
+        with self._lock:
+            return self.latency.sample(self._rng), self._rng.random() < self.error_rate
+
+
+def _pick(options: List[str], text: str, count: int = 1) -> List[str]:
+    """Deterministic choice: the same prompt always gets the same answers"""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    start = int.from_bytes(digest, "big")
+    return [options[(start + i) % len(options)] for i in range(count)]
+
+
+class FakeLLMBackend:
+    """
+    Offline stand-in for Gemini (LLM_BACKEND=fake).
+
+    Answers are deterministic per prompt and shaped like the real ones per
+    purpose (plain question, mentor feedback JSON, summary, portfolio
+    analysis JSON). Each call waits a latency drawn from FAKE_LLM_LATENCY
+    (time to first token) plus FAKE_LLM_TOKEN_INTERVAL per streamed chunk,
+    and fails with a 503 ServerError at FAKE_LLM_ERROR_RATE, so the gateway's
+    retries, hedging and circuit breaker run as they would against Gemini.
+    """
+
+    def __init__(
+        self,
+        latency: str = FAKE_LLM_LATENCY,
+        token_interval: float = FAKE_LLM_TOKEN_INTERVAL,
+        error_rate: float = FAKE_LLM_ERROR_RATE,
+        seed: Optional[int] = FAKE_BACKEND_SEED
+    ):
+        self.upstream = _FakeUpstream(latency, error_rate, seed)
+        self.token_interval = token_interval
+
+    def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def generate(self, purpose: str, model: str, contents: str, config: Optional[dict] = None) -> str:
+        text = self.respond(purpose, contents)
+        delay, fail = self.upstream.draw()
+        await asyncio.sleep(delay + self.token_interval * len(self.chunk(text)))
+        if fail:
+            raise self._injected_error()
+        record_tokens(purpose, estimate_tokens(contents), estimate_tokens(text))
+        return text
+
+    async def stream(self, purpose: str, model: str, contents: str) -> AsyncIterator[str]:
+        text = self.respond(purpose, contents)
+        delay, fail = self.upstream.draw()
+        await asyncio.sleep(delay)
+        if fail:
+            raise self._injected_error()
+        for chunk in self.chunk(text):
+            await asyncio.sleep(self.token_interval)
+            yield chunk
+        record_tokens(purpose, estimate_tokens(contents), estimate_tokens(text))
+
+    @staticmethod
+    def chunk(text: str) -> List[str]:
+        """Split a response into stream chunks of a few words, like Gemini's deltas"""
+        words = text.split(" ")
+        return [" ".join(words[i:i + 4]) + (" " if i + 4 < len(words) else "") for i in range(0, len(words), 4)]
+
+    def respond(self, purpose: str, contents: str) -> str:
+        if purpose == "mentor":
+            return json.dumps({
+                "feedback": "질문의 의도는 정확히 파악하셨지만, 근거가 되는 경험이 짧게 언급되어 설득력이 아쉽습니다. 상황과 본인의 역할, 결과를 순서대로 설명해 보세요.",
+                "tips": _pick(_TIPS, contents, 3),
+            }, ensure_ascii=False)
+        if purpose == "summary":
+            return "지원자는 프로젝트의 구조와 기술 선택 근거를 설명했으며, 성능 측정과 장애 대응 경험은 구체적인 수치 없이 답변했다."
+        if purpose == "analysis":
+            return json.dumps(self._analysis(contents), ensure_ascii=False)
+        return _pick(_QUESTIONS, contents)[0]
+
+    @staticmethod
+    def _analysis(prompt: str) -> dict:
+        """Analysis JSON built from the skills and programs embedded in the prompt"""
+        match = re.search(r"\[Missing Skills\]\s*\n\s*(.*)", prompt)
+        missing = [s.strip() for s in match.group(1).split(",")] if match and match.group(1).strip() != "None" else []
+        match = re.search(r"\[Baseline Skill Score\]\s*\n\s*(\d+)", prompt)
+        score = int(match.group(1)) if match else 50
+        match = re.search(r"=== AVAILABLE TRAINING PROGRAMS \(JSON\) ===\s*\n\s*(\[.*\])", prompt)
+        programs = json.loads(match.group(1)) if match else []
+        return {
+            "skill_match": "요구 스킬 중 일부를 프로젝트에서 직접 사용한 경험이 확인됩니다.",
+            "fit_evaluation": "프로젝트 경험이 직무의 핵심 업무와 대체로 일치하나, 부족한 스킬을 보완할 필요가 있습니다.",
+            "missing_competencies": missing,
+            "overall_score": score,
+            "recommended_programs": [
+                {**program, "recommendation_reason": "부족한 스킬을 실습할 수 있는 프로그램입니다."}
+                for program in programs[:2]
+            ],
+        }
+
+    @staticmethod
+    def _injected_error() -> errors.ServerError:
+        return errors.ServerError(503, {"error": {"code": 503, "message": "Injected fake upstream error", "status": "UNAVAILABLE"}})
+
+
+class FakeTTSBackend:
+    """
+    Offline stand-in for Google Cloud TTS (TTS_BACKEND=fake).
+
+    Returns silent MP3 frames sized like real speech for the text and
+    speaking rate, after a latency drawn from FAKE_TTS_LATENCY; fails at
+    FAKE_TTS_ERROR_RATE.
+    """
+
+    def __init__(
+        self,
+        latency: str = FAKE_TTS_LATENCY,
+        error_rate: float = FAKE_TTS_ERROR_RATE,
+        seed: Optional[int] = FAKE_BACKEND_SEED
+    ):
+        self.upstream = _FakeUpstream(latency, error_rate, seed)
+
+    async def close(self):
+        pass
+
+    async def synthesize(self, text: str, voice: str, speaking_rate: float, sample_rate_hertz: int) -> bytes:
+        delay, fail = self.upstream.draw()
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("Injected fake TTS error")
+        return self.audio(text, speaking_rate)
+
+    @staticmethod
+    def audio(text: str, speaking_rate: float = 1.0) -> bytes:
+        seconds = len(text) / _CHARS_PER_SECOND / max(speaking_rate, 0.25)
+        return _MP3_FRAME * max(1, math.ceil(seconds / _MP3_FRAME_SECONDS))
@@ -0,0 +1,181 @@
+import logging
+import threading
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+from google import genai
+from google.genai import types
+
+from app.core.config import (
+    GEMINI_API_KEY,
+    GEMINI_KEEPALIVE_SECONDS,
+    GEMINI_MAX_CONNECTIONS,
+    GEMINI_MAX_KEEPALIVE_CONNECTIONS,
+    GEMINI_TIMEOUT_SECONDS,
+)
+from app.core.metrics import registry
+from app.services.llm_metrics import record_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """
+    Counts Gemini HTTP requests and the TCP connections opened for them.
+
+    Fed by httpcore trace events, so "opened" is exact: every request that
+    did not open a connection reused a pooled keep-alive one.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+
+    def on_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def on_connect(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            requests, opened = self.requests, self.connections_opened
+        reused = max(requests - opened, 0)
+        return {
+            "requests": requests,
+            "connections_opened": opened,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / requests, 4) if requests else 0.0,
+        }
+
+
+class GeminiClient:
+    """
+    Process-wide google.genai client over pooled keep-alive connections.
+
+    Built once (in the app lifespan, or on first use in scripts) and shared
+    by every call through llm_gateway (async API), so requests skip client
+    construction and reuse warm HTTPS connections instead of paying TCP +
+    TLS setup each time. The httpx client is owned here so the pool size is
+    configurable and connection reuse can be measured.
+    """
+
+    def __init__(
+        self,
+        api_key: str = GEMINI_API_KEY,
+        max_connections: int = GEMINI_MAX_CONNECTIONS,
+        max_keepalive_connections: int = GEMINI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = GEMINI_KEEPALIVE_SECONDS,
+        timeout: float = GEMINI_TIMEOUT_SECONDS
+    ):
+        self.api_key = api_key
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.stats = ConnectionStats()
+        self._client: Optional[genai.Client] = None
+        self._async_http: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> genai.Client:
+        """Shared client; calls go through its .aio.models"""
+        if self._client is None:
+            self.start()
+        return self._client
+
+    @property
+    def aio(self):
+        return self.client.aio
+
+    def start(self):
+        with self._lock:
+            if self._client is not None:
+                return
+            self._async_http = httpx.AsyncClient(limits=self.limits, event_hooks={"request": [self._trace_async]})
+            self._client = genai.Client(
+                api_key=self.api_key,
+                http_options=types.HttpOptions(
+                    timeout=int(self.timeout * 1000),  # milliseconds
+                    httpx_async_client=self._async_http,
+                ),
+            )
+
+    async def close(self):
+        """Close pooled connections (app shutdown)"""
+        with self._lock:
+            async_http = self._async_http
+            self._client = self._async_http = None
+        if async_http is not None:
+            await async_http.aclose()
+        logger.info("Gemini connection stats: %s", self.stats.snapshot())
+
+    async def _trace_async(self, request: httpx.Request):
+        self.stats.on_request()
+
+        async def trace(event: str, info: dict):
+            if event == "connection.connect_tcp.complete":
+                self.stats.on_connect()
+
+        request.extensions["trace"] = trace
+
+
+gemini_client = GeminiClient()
+
+registry.callback(
+    "gemini_http_requests_total",
+    "HTTP requests sent by the shared Gemini client",
+    lambda: {(): gemini_client.stats.snapshot()["requests"]},
+    type_name="counter",
+)
+registry.callback(
+    "gemini_connections_opened_total",
+    "TCP connections opened by the shared Gemini client (requests minus these reused a pooled connection)",
+    lambda: {(): gemini_client.stats.snapshot()["connections_opened"]},
+    type_name="counter",
+)
+
+
+class GeminiBackend:
+    """LLMGateway backend calling Gemini through the shared gemini_client"""
+
+    def __init__(self, client: GeminiClient = gemini_client):
+        self.client = client
+
+    def start(self):
+        if not self.client.api_key:
+            # Calls fail (and fall back) instead of the app failing to start
+            logger.warning("GEMINI_API_KEY is not set; Gemini calls will fail")
+            return
+        self.client.start()
+
+    async def close(self):
+        await self.client.close()
+
+    async def generate(self, purpose: str, model: str, contents: str, config: Optional[dict] = None) -> str:
+        response = await self.client.aio.models.generate_content(model=model, contents=contents, config=config)
+        self._record_usage(purpose, response)
+        return response.text
+
+    async def stream(self, purpose: str, model: str, contents: str) -> AsyncIterator[str]:
+        response = await self.client.aio.models.generate_content_stream(model=model, contents=contents)
+        last = None
+        async for chunk in response:
+            last = chunk
+            # Trailing chunks may carry only finish metadata and no text
+            if chunk.text:
+                yield chunk.text
+        self._record_usage(purpose, last)
+
+    @staticmethod
+    def _record_usage(purpose: str, response):
+        # Streams report cumulative usage on their last chunk
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            record_tokens(purpose, usage.prompt_token_count, usage.candidates_token_count)
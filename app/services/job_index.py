@@ -0,0 +1,200 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from app.models import Job
+from app.services.job_listing import job_table_stamp
+from app.services.skill_matcher import job_skills, mentioned_skills, normalize_key, skill_weight
+
+# Weight factor of skills a description mentions beyond the required ones;
+# they only break ties between jobs with the same score
+DESCRIPTION_SKILL_WEIGHT = 0.5
+
+
+class RankedJob:
+    """A job with its match score against a candidate"""
+
+    def __init__(self, job_id: int, score: int, matched_weight: float):
+        self.job_id = job_id
+        self.score = score
+        self.matched_weight = matched_weight
+
+
+class _Columns:
+    """
+    Job x skill weight matrix in compressed sparse column form (plain NumPy).
+
+    Column c lists the jobs with skill c:
+    ``col_rows[col_ptr[c]:col_ptr[c + 1]]`` are job rows and ``col_data``
+    the matching weights.
+    """
+
+    def __init__(self, rows: List[Dict[int, float]], n_columns: int):
+        columns = np.asarray([c for row in rows for c in row], dtype=np.int32)
+        weights = np.asarray([w for row in rows for w in row.values()], dtype=np.float64)
+        row_ids = np.repeat(np.arange(len(rows), dtype=np.int32), [len(row) for row in rows])
+
+        # CSR -> CSC; the stable sort keeps rows ascending within a column
+        by_column = np.argsort(columns, kind="stable")
+        self.col_ptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(columns, minlength=n_columns)))
+        ).astype(np.int64)
+        self.col_rows = row_ids[by_column]
+        self.col_data = weights[by_column]
+        self.row_weights = np.bincount(row_ids, weights=weights, minlength=len(rows))
+
+    def matvec(self, columns: List[int], n_rows: int) -> np.ndarray:
+        """
+        Product with a 0/1 candidate vector: only the candidate's handful of
+        columns are gathered and summed per row with one ``bincount``.
+        """
+        if not columns:
+            return np.zeros(n_rows)
+        spans = [slice(self.col_ptr[c], self.col_ptr[c + 1]) for c in columns]
+        return np.bincount(
+            np.concatenate([self.col_rows[span] for span in spans]),
+            weights=np.concatenate([self.col_data[span] for span in spans]),
+            minlength=n_rows
+        )
+
+
+class _Matrix:
+    """
+    Skill matrices of all jobs, rows grouped by domain so a domain filter is
+    a contiguous slice of the result.
+
+    ``required`` holds each job's required skills (job_skills) with the
+    SKILL_WEIGHTS of skill_matcher, so a job's score is exactly the
+    match_skills score the preview and the analysis report for it.
+    ``mentioned`` holds skills its description mentions beyond those.
+    """
+
+    def __init__(self, jobs: List[Tuple[int, Optional[str], Optional[str], Optional[str]]]):
+        self.vocabulary: Dict[str, int] = {}
+        # domain -> (first row, end row)
+        self.domains: Dict[Optional[str], Tuple[int, int]] = {}
+
+        required_rows: List[Dict[int, float]] = []
+        mentioned_rows: List[Dict[int, float]] = []
+        job_ids: List[int] = []
+
+        jobs = sorted(jobs, key=lambda job: (job[1] or "", job[1] is not None, job[0]))
+        for row, (job_id, domain, skills_required, description) in enumerate(jobs):
+            required = {self._column(skill): skill_weight(skill) for skill in job_skills(skills_required, description)}
+            mentioned = {}
+            for skill in mentioned_skills(description):
+                column = self._column(skill)
+                if column not in required:
+                    mentioned[column] = DESCRIPTION_SKILL_WEIGHT * skill_weight(skill)
+
+            required_rows.append(required)
+            mentioned_rows.append(mentioned)
+            job_ids.append(job_id)
+            start, _ = self.domains.get(domain, (row, row))
+            self.domains[domain] = (start, row + 1)
+
+        self.required = _Columns(required_rows, len(self.vocabulary))
+        self.mentioned = _Columns(mentioned_rows, len(self.vocabulary))
+        self.job_ids = np.asarray(job_ids, dtype=np.int64)
+
+    def _column(self, skill: str) -> int:
+        return self.vocabulary.setdefault(normalize_key(skill), len(self.vocabulary))
+
+    def rank(self, owned: Iterable[str], domain: Optional[str], limit: int) -> List[RankedJob]:
+        if domain is None:
+            first, end = 0, len(self.job_ids)
+        elif domain in self.domains:
+            first, end = self.domains[domain]
+        else:
+            return []
+        if first == end or limit <= 0:
+            return []
+
+        columns = {self.vocabulary.get(normalize_key(skill)) for skill in owned}
+        columns.discard(None)
+        columns = sorted(columns)
+        n_rows = len(self.job_ids)
+
+        matched = self.required.matvec(columns, n_rows)[first:end]
+        bonus = self.mentioned.matvec(columns, n_rows)[first:end]
+        row_weights = self.required.row_weights[first:end]
+        # Same arithmetic and (half-to-even) rounding as match_skills
+        score = np.round(np.divide(100 * matched, row_weights, out=np.zeros_like(matched), where=row_weights > 0))
+
+        # Best score, then most description mentions matched, then most
+        # matched weight, then row (domain, id) order
+        key = score * 1e6 + np.minimum(bonus, 999) * 1e3 + np.minimum(matched, 999)
+        if len(key) > limit:
+            cutoff = -np.partition(-key, limit - 1)[limit - 1]
+            above = np.flatnonzero(key > cutoff)
+            ties = np.flatnonzero(key == cutoff)[:limit - len(above)]
+            selected = np.concatenate([above, ties])
+        else:
+            selected = np.arange(len(key))
+        order = selected[np.argsort(-key[selected], kind="stable")]
+
+        return [
+            RankedJob(int(self.job_ids[first + row]), int(score[row]), float(matched[row]))
+            for row in order
+        ]
+
+
+class JobIndex:
+    """
+    Precomputed skill index over every job posting.
+
+    Each job's required skills (weighted like skill_matcher.match_skills)
+    and the other skills its description mentions form sparse rows; ranking
+    a candidate is a sparse mat-vec over all jobs, so it stays in the low
+    milliseconds for tens of thousands of postings. The index is rebuilt when the job
+    table's version (see job_table_stamp) changes.
+    """
+
+    def __init__(self):
+        self._matrix: Optional[_Matrix] = None
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def rank(
+        self,
+        session: Session,
+        owned_skills: Iterable[str],
+        domain: Optional[str] = None,
+        limit: int = 5
+    ) -> List[RankedJob]:
+        """
+        Top jobs for a candidate, best match first.
+
+        Args:
+            session: Database session used to detect job table changes
+            owned_skills: Candidate skill names (any spelling)
+            domain: Only rank jobs of this domain (None = all domains)
+            limit: Maximum number of jobs returned
+
+        Returns:
+            RankedJob list; score is the 0-100 share of the job's skill weight covered
+        """
+        return self._current(session).rank(owned_skills, domain, limit)
+
+    def invalidate(self):
+        """Force a rebuild on the next rank call"""
+        self._stamp = None
+
+    def _current(self, session: Session) -> _Matrix:
+        stamp = job_table_stamp(session)
+        if self._matrix is not None and stamp == self._stamp:
+            return self._matrix
+
+        with self._lock:
+            if self._matrix is None or stamp != self._stamp:
+                jobs = session.exec(
+                    select(Job.id, Job.domain, Job.skills_required, Job.description).order_by(Job.id)
+                ).all()
+                self._matrix = _Matrix(jobs)
+                self._stamp = stamp
+            return self._matrix
+
+
+job_index = JobIndex()
@@ -0,0 +1,256 @@
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import IO, Dict, Iterable, Iterator, List
+
+from sqlalchemy import delete, inspect, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
+
+from app.core.config import INGEST_BATCH_SIZE
+from app.models import Job, JobSearch
+from app.services.job_listing import bump_job_table_version
+from app.services.job_search import upsert_search_documents
+
+logger = logging.getLogger(__name__)
+
+_READ_CHUNK = 1 << 16
+_REQUIRED_FIELDS = ("company", "title", "description")
+# Columns compared to decide whether an existing posting changed
+_SYNCED_FIELDS = ("description", "domain", "skills_required")
+# Unique index on the natural key that upsert_jobs' ON CONFLICT relies on
+NATURAL_KEY_INDEX = "uq_job_company_title"
+
+
+class MissingNaturalKey(RuntimeError):
+    """The (company, title) unique index is missing, so upserts cannot work"""
+
+
+class IngestStats:
+    """Counters of one ingestion run"""
+
+    def __init__(self):
+        self.read = 0
+        self.skipped = 0
+        self.written = 0  # inserted or changed
+        self.unchanged = 0
+        self.started_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Records per second"""
+        return self.read / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"read={self.read} written={self.written} unchanged={self.unchanged} "
+            f"skipped={self.skipped} elapsed={self.elapsed:.2f}s rate={self.rate:.0f}/s"
+        )
+
+
+def iter_records(f: IO[str]) -> Iterator[dict]:
+    """
+    Stream job records from a JSON array or NDJSON file.
+
+    The array form is decoded object by object from fixed-size chunks, so
+    memory use does not depend on the feed size.
+    """
+    buffer = f.read(_READ_CHUNK).lstrip()
+    if buffer.startswith("["):
+        yield from _iter_array(f, buffer[1:])
+        return
+
+    lines = (buffer + f.readline()).splitlines() if buffer else []
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _iter_array(f: IO[str], buffer: str) -> Iterator[dict]:
+    decoder = json.JSONDecoder()
+    eof = False
+    while True:
+        buffer = buffer.lstrip().lstrip(",").lstrip()
+        if buffer.startswith("]"):
+            return
+        try:
+            record, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            # Incomplete object at the chunk boundary: read more
+            if eof:
+                raise
+            chunk = f.read(_READ_CHUNK)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield record
+        buffer = buffer[end:]
+
+
+def normalize_record(item: dict) -> Dict:
+    """
+    Map a feed record onto Job columns.
+
+    Accepts skills_need as an alias of skills_required.
+
+    Raises:
+        ValueError: If a required field is missing or empty
+    """
+    for field in _REQUIRED_FIELDS:
+        if not item.get(field):
+            raise ValueError(f"missing {field}")
+    return {
+        "company": item["company"].strip(),
+        "title": item["title"].strip(),
+        "description": item["description"],
+        "domain": item.get("domain"),
+        "skills_required": item.get("skills_need") or item.get("skills_required"),
+    }
+
+
+def deduplicate_jobs(session: Session) -> int:
+    """
+    Delete all but the newest row (highest id) of each (company, title).
+
+    Tables filled before ingestion became an upsert can hold the same
+    posting several times, which blocks the natural-key unique index.
+    Search documents of the deleted rows go with them.
+
+    Returns:
+        Number of rows deleted
+    """
+    newer = aliased(Job)
+    duplicate_ids = select(Job.id).where(
+        select(newer.id)
+        .where(newer.company == Job.company, newer.title == Job.title, newer.id > Job.id)
+        .exists()
+    )
+    ids = list(session.exec(duplicate_ids).all())
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        session.exec(delete(JobSearch).where(JobSearch.job_id.in_(chunk)))
+        session.exec(delete(Job).where(Job.id.in_(chunk)))
+    if ids:
+        bump_job_table_version(session)
+    session.commit()
+    return len(ids)
+
+
+def ensure_natural_key(engine: Engine):
+    """
+    Make sure the (company, title) unique index exists, deduplicating
+    existing rows first if it does not.
+
+    create_missing_indexes only logs an index it cannot create, so this
+    runs before it (at startup and in initial_data.py) to fail loudly
+    instead of leaving upsert_jobs without its conflict target.
+
+    Raises:
+        MissingNaturalKey: If the index still cannot be created
+    """
+    if any(index["name"] == NATURAL_KEY_INDEX for index in inspect(engine).get_indexes(Job.__tablename__)):
+        return
+    with Session(engine) as session:
+        removed = deduplicate_jobs(session)
+    if removed:
+        logger.warning("Deleted %d duplicate job postings (same company and title)", removed)
+
+    index = next(index for index in Job.__table__.indexes if index.name == NATURAL_KEY_INDEX)
+    try:
+        index.create(engine, checkfirst=True)
+    except Exception as e:
+        raise MissingNaturalKey(
+            f"Could not create unique index {NATURAL_KEY_INDEX} on job(company, title): {e}"
+        ) from e
+
+
+def upsert_jobs(session: Session, rows: List[Dict]) -> int:
+    """
+    Insert new postings and update changed ones in bulk.
+
+    Uses INSERT ... ON CONFLICT (company, title) DO UPDATE, updating only
+    rows whose synced fields differ, so unchanged postings keep their
+    updated_at. Written rows get their search documents in the same
+    transaction. The job table version is bumped only if a row was written,
+    so re-ingesting an unchanged feed keeps the listing/search caches valid.
+
+    Returns:
+        Number of rows inserted or updated
+    """
+    if not rows:
+        return 0
+    # A statement may not touch the same conflict key twice; the last record wins
+    unique_rows = list({(row["company"], row["title"]): row for row in rows}.values())
+
+    now = datetime.now(timezone.utc)
+    for row in unique_rows:
+        row["created_at"] = now
+        row["updated_at"] = now
+
+    table = Job.__table__
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(table)
+    excluded = statement.excluded
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.company, table.c.title],
+        set_={field: excluded[field] for field in (*_SYNCED_FIELDS, "updated_at")},
+        where=or_(*(table.c[field].is_distinct_from(excluded[field]) for field in _SYNCED_FIELDS)),
+    ).returning(
+        table.c.id, table.c.company, table.c.title, table.c.description,
+        table.c.skills_required, table.c.updated_at
+    )
+    # executemany: compiled once and cached, sent as multi-row VALUES batches
+    # by the driver. Rows skipped by the WHERE clause return nothing.
+    written = session.connection().execute(statement, unique_rows).all()
+    if written:
+        upsert_search_documents(session, written)
+        bump_job_table_version(session)
+    return len(written)
+
+
+def ingest_jobs(session: Session, records: Iterable[dict], batch_size: int = INGEST_BATCH_SIZE) -> IngestStats:
+    """
+    Upsert a stream of job records in batches, committing per batch.
+
+    Invalid records are logged and skipped.
+    """
+    stats = IngestStats()
+    batch: List[Dict] = []
+
+    def flush():
+        written = upsert_jobs(session, batch)
+        session.commit()
+        stats.written += written
+        stats.unchanged += len({(row["company"], row["title"]) for row in batch}) - written
+        batch.clear()
+        logger.info("Ingested %s", stats)
+
+    for item in records:
+        stats.read += 1
+        try:
+            batch.append(normalize_record(item))
+        except (ValueError, AttributeError, TypeError) as e:
+            stats.skipped += 1
+            logger.warning("Skipping record %d: %s", stats.read, e)
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return stats
+
+
+def ingest_file(session: Session, path: str, batch_size: int = INGEST_BATCH_SIZE) -> IngestStats:
+    """Ingest one JSON array or NDJSON feed file"""
+    with open(path, "r", encoding="utf-8") as f:
+        return ingest_jobs(session, iter_records(f), batch_size)
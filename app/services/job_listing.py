@@ -0,0 +1,143 @@
+import base64
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+from app.core.config import JOBS_CACHE_MAX_ENTRIES, JOBS_CACHE_TTL_SECONDS
+from app.models import Job, JobTableVersion
+
+# Columns of the list view; the description is only served by GET /jobs/{id}
+LIST_COLUMNS = (Job.id, Job.company, Job.title, Job.domain, Job.skills_required, Job.created_at)
+
+
+class InvalidCursor(ValueError):
+    """The pagination cursor could not be decoded"""
+
+
+def job_table_stamp(session: Session) -> int:
+    """
+    Version of the job table, read from its one-row counter.
+
+    A primary-key lookup, so it costs the same on any table size. Writers
+    call bump_job_table_version in the transaction that changes job rows.
+    """
+    version = session.exec(select(JobTableVersion.version).where(JobTableVersion.id == 1)).first()
+    return version or 0
+
+
+def bump_job_table_version(session: Session):
+    """Advance the job table version (call in the transaction that writes jobs)"""
+    table = JobTableVersion.__table__
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(table).values(id=1, version=1)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={"version": table.c.version + 1},
+    )
+    session.connection().execute(statement)
+
+
+def encode_cursor(created_at: datetime, job_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{job_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, job_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(job_id)
+    except Exception as e:
+        raise InvalidCursor(str(e)) from e
+
+
+def list_jobs_page(
+    session: Session,
+    domain: Optional[str],
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    One page of jobs, newest first, without descriptions.
+
+    Keyset pagination on (created_at, id): the next page starts strictly
+    after the last row of this one, so the cost per page does not grow
+    with the page number the way OFFSET does.
+
+    Returns:
+        (job dicts, cursor of the next page or None on the last page)
+
+    Raises:
+        InvalidCursor: If cursor is malformed
+    """
+    statement = select(*LIST_COLUMNS)
+    if domain:
+        statement = statement.where(Job.domain == domain)
+    if cursor:
+        created_at, job_id = decode_cursor(cursor)
+        statement = statement.where(tuple_(Job.created_at, Job.id) < tuple_(created_at, job_id))
+    statement = statement.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit + 1)
+
+    rows = session.exec(statement).all()
+    jobs = [dict(row._mapping) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = jobs[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+    return jobs, next_cursor
+
+
+def listing_etag(stamp: int, *params) -> str:
+    """Strong ETag of a listing response for a table version and query"""
+    key = repr((stamp, params)).encode("utf-8")
+    return f'"{hashlib.sha256(key).hexdigest()[:32]}"'
+
+
+class ResponseCache:
+    """
+    Rendered response bodies keyed by ETag (LRU with TTL).
+
+    ETags include the job table version, so a job write makes every old
+    entry unreachable; they age out of the LRU instead of being purged.
+    """
+
+    def __init__(self, max_entries: int = JOBS_CACHE_MAX_ENTRIES, ttl_seconds: float = JOBS_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is None:
+                return None
+            body, stored_at = entry
+            if self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds:
+                del self._entries[etag]
+                return None
+            self._entries.move_to_end(etag)
+            return body
+
+    def put(self, etag: str, body: bytes):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[etag] = (body, time.time())
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+jobs_response_cache = ResponseCache()
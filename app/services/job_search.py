@@ -0,0 +1,227 @@
+import logging
+import re
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Float, column, delete, literal_column, or_, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, func, select
+
+from app.core.config import INGEST_BATCH_SIZE
+from app.models import Job, JobSearch
+
+logger = logging.getLogger(__name__)
+
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+_LATIN_WORD = re.compile(r"[a-z0-9]+")
+
+# tsvector config: 'simple' only lowercases, our tokens are already n-grams
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+_SQLITE_FTS_SETUP = [
+    # External-content FTS5 table mirroring jobsearch.tokens, kept in sync by triggers
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobsearch_fts USING fts5("
+    "tokens, content='jobsearch', content_rowid='job_id')",
+    "CREATE TRIGGER IF NOT EXISTS jobsearch_ai AFTER INSERT ON jobsearch BEGIN "
+    "INSERT INTO jobsearch_fts(rowid, tokens) VALUES (new.job_id, new.tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS jobsearch_ad AFTER DELETE ON jobsearch BEGIN "
+    "INSERT INTO jobsearch_fts(jobsearch_fts, rowid, tokens) VALUES ('delete', old.job_id, old.tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS jobsearch_au AFTER UPDATE ON jobsearch BEGIN "
+    "INSERT INTO jobsearch_fts(jobsearch_fts, rowid, tokens) VALUES ('delete', old.job_id, old.tokens); "
+    "INSERT INTO jobsearch_fts(rowid, tokens) VALUES (new.job_id, new.tokens); END",
+]
+
+_POSTGRES_SETUP = [
+    "CREATE INDEX IF NOT EXISTS ix_jobsearch_tokens ON jobsearch "
+    "USING gin (to_tsvector('simple'::regconfig, tokens))",
+]
+
+
+def search_tokens(text_value: Optional[str]) -> List[str]:
+    """
+    Korean-friendly tokens: overlapping bigrams of Hangul runs, plus
+    lowercase Latin words and numbers.
+
+    Korean attaches particles and compounds words without spaces
+    ("백엔드개발자를"), so whitespace tokenization would miss most queries;
+    bigrams match any substring of two or more syllables. A single-syllable
+    run is kept as a unigram.
+    """
+    if not text_value:
+        return []
+    tokens = []
+    for run in _HANGUL_RUN.findall(text_value):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    tokens.extend(_LATIN_WORD.findall(text_value.lower()))
+    return tokens
+
+
+def document_tokens(company: str, title: str, description: Optional[str], skills_required: Optional[str]) -> str:
+    """Search document of a job; title, company and skills are repeated to weigh more"""
+    heading = search_tokens(f"{title} {company} {skills_required or ''}")
+    return " ".join(heading + heading + search_tokens(description))
+
+
+def create_search_index(engine: Engine):
+    """Create the dialect specific full-text index over jobsearch (idempotent)"""
+    postgres = engine.dialect.name == "postgresql"
+    statements = _POSTGRES_SETUP if postgres else _SQLITE_FTS_SETUP
+    with engine.begin() as connection:
+        created = not postgres and not connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'jobsearch_fts'")
+        ).first()
+        for statement in statements:
+            connection.execute(text(statement))
+        if created:
+            # Documents written before the FTS table existed bypassed its triggers
+            connection.execute(text("INSERT INTO jobsearch_fts(jobsearch_fts) VALUES ('rebuild')"))
+
+
+def upsert_search_documents(session: Session, jobs: Iterable) -> int:
+    """
+    Tokenize jobs and write their search documents.
+
+    INSERT ... ON CONFLICT (job_id) DO UPDATE, so concurrent writers of the
+    same job converge instead of failing. Called by job ingestion in the
+    transaction that writes the jobs.
+
+    Args:
+        jobs: Rows with id, company, title, description, skills_required
+            and updated_at
+
+    Returns:
+        Number of documents written
+    """
+    documents = [
+        {
+            "job_id": job.id,
+            "tokens": document_tokens(job.company, job.title, job.description, job.skills_required),
+            "indexed_at": job.updated_at,
+        }
+        for job in jobs
+    ]
+    if not documents:
+        return 0
+    table = JobSearch.__table__
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.job_id],
+        set_={"tokens": statement.excluded.tokens, "indexed_at": statement.excluded.indexed_at},
+    )
+    session.connection().execute(statement, documents)
+    return len(documents)
+
+
+def sync_search_documents(engine: Engine, batch_size: int = INGEST_BATCH_SIZE) -> int:
+    """
+    Build documents for jobs without an up-to-date one and drop documents
+    of deleted jobs (startup backfill; ingestion keeps them current).
+
+    Returns:
+        Number of documents written
+    """
+    written = 0
+    with Session(engine) as session:
+        while True:
+            stale = session.exec(
+                select(Job.id, Job.company, Job.title, Job.description, Job.skills_required, Job.updated_at)
+                .outerjoin(JobSearch, JobSearch.job_id == Job.id)
+                .where(or_(JobSearch.job_id.is_(None), JobSearch.indexed_at < Job.updated_at))
+                .limit(batch_size)
+            ).all()
+            if not stale:
+                break
+            written += upsert_search_documents(session, stale)
+            session.commit()
+        session.exec(delete(JobSearch).where(~select(Job.id).where(Job.id == JobSearch.job_id).exists()))
+        session.commit()
+    if written:
+        logger.info("Built %d job search documents", written)
+    return written
+
+
+class JobSearchIndex:
+    """
+    Runs queries over the jobsearch documents.
+
+    Documents are written with the jobs they index (see
+    upsert_search_documents), so queries only read. Queries AND all tokens;
+    Latin words and single syllables match as prefixes. Postgres ranks with
+    ts_rank over a GIN tsvector index, SQLite (local development) with FTS5
+    bm25.
+    """
+
+    def search(
+        self,
+        session: Session,
+        query: str,
+        domain: Optional[str] = None,
+        limit: int = 20
+    ) -> List[dict]:
+        """
+        Jobs matching query, most relevant first.
+
+        Returns:
+            Job list-view dicts with a "score" (higher is more relevant;
+            the scale depends on the database)
+        """
+        tokens = search_tokens(query)
+        if not tokens:
+            return []
+
+        if session.get_bind().dialect.name == "postgresql":
+            return self._search_postgres(session, tokens, domain, limit)
+        return self._search_sqlite(session, tokens, domain, limit)
+
+    def _search_postgres(self, session: Session, tokens: List[str], domain: Optional[str], limit: int) -> List[dict]:
+        ts_query = func.to_tsquery(_TS_CONFIG, " & ".join(_postgres_term(token) for token in tokens))
+        ts_vector = func.to_tsvector(_TS_CONFIG, JobSearch.tokens)
+        score = func.ts_rank(ts_vector, ts_query).label("score")
+
+        statement = (
+            select(Job.id, Job.company, Job.title, Job.domain, Job.skills_required, Job.created_at, score)
+            .join(JobSearch, JobSearch.job_id == Job.id)
+            .where(ts_vector.op("@@")(ts_query))
+        )
+        if domain:
+            statement = statement.where(Job.domain == domain)
+        statement = statement.order_by(score.desc(), Job.id.desc()).limit(limit)
+        return [dict(row._mapping) for row in session.exec(statement)]
+
+    def _search_sqlite(self, session: Session, tokens: List[str], domain: Optional[str], limit: int) -> List[dict]:
+        statement = (
+            "SELECT job.id, job.company, job.title, job.domain, job.skills_required, job.created_at, "
+            "-bm25(jobsearch_fts) AS score "
+            "FROM jobsearch_fts JOIN job ON job.id = jobsearch_fts.rowid "
+            "WHERE jobsearch_fts MATCH :match"
+        )
+        params = {"match": " AND ".join(_fts5_term(token) for token in tokens), "limit": limit}
+        if domain:
+            statement += " AND job.domain = :domain"
+            params["domain"] = domain
+        statement += " ORDER BY score DESC, job.id DESC LIMIT :limit"
+
+        typed = text(statement).columns(
+            Job.id, Job.company, Job.title, Job.domain, Job.skills_required, Job.created_at,
+            column("score", Float)
+        )
+        return [dict(row._mapping) for row in session.connection().execute(typed, params)]
+
+
+def _is_prefix_term(token: str) -> bool:
+    return len(token) == 1 or token.isascii()
+
+
+def _postgres_term(token: str) -> str:
+    return f"{token}:*" if _is_prefix_term(token) else token
+
+
+def _fts5_term(token: str) -> str:
+    return f'"{token}"*' if _is_prefix_term(token) else f'"{token}"'
+
+
+job_search_index = JobSearchIndex()
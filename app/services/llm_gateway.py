@@ -0,0 +1,443 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+import httpx
+from google.genai import errors
+
+from app.core.config import (
+    LLM_BACKEND,
+    LLM_BREAKER_FAILURE_THRESHOLD,
+    LLM_BREAKER_RESET_SECONDS,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_PERCENTILE,
+    LLM_MAX_ATTEMPTS,
+    LLM_MAX_CONCURRENCY,
+    LLM_RETRY_BASE_DELAY,
+)
+from app.core.metrics import record_stage, registry
+from app.services.fake_backends import FakeLLMBackend
+from app.services.gemini_client import GeminiBackend
+from app.services.llm_metrics import llm_request_seconds, llm_requests
+
+logger = logging.getLogger(__name__)
+
+# Request timeout, rate limiting and upstream errors are worth retrying
+_TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class LLMUnavailable(Exception):
+    """Gemini did not answer within the call's deadline, or the circuit is open"""
+
+
+class CircuitOpen(LLMUnavailable):
+    """Call rejected without trying: the circuit breaker is open"""
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a failed call may succeed if retried"""
+    if isinstance(error, errors.APIError):
+        return error.code in _TRANSIENT_STATUS
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError, TimeoutError))
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while Gemini is degraded.
+
+    Opens after ``failure_threshold`` consecutive transient failures
+    (including deadline overruns). While open, calls are rejected for
+    ``reset_seconds``; then a single probe call is let through (half-open),
+    whose outcome closes or re-opens the circuit. A probe that never
+    reports back (e.g. cancelled) is replaced after another reset period.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = LLM_BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = LLM_BREAKER_RESET_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return "open"
+            return "half_open"
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now (claims the probe when half-open)"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_seconds:
+                return False
+            if self._probe_started_at is not None and now - self._probe_started_at < self.reset_seconds:
+                return False
+            self._probe_started_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("LLM circuit closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            probing = self._probe_started_at is not None
+            if probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+                if self._opened_at is None:
+                    logger.warning("LLM circuit opened after %d consecutive failures", self._failures)
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+
+class LatencyTracker:
+    """Latencies of recent successful calls, per purpose"""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, purpose: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(purpose, deque(maxlen=self.window)).append(seconds)
+
+    def purposes(self) -> List[str]:
+        with self._lock:
+            return list(self._samples)
+
+    def percentile(self, purpose: str, percent: float, min_samples: int = 1) -> Optional[float]:
+        """Latency percentile, or None with fewer than min_samples samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(purpose, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = min(int(len(samples) * percent / 100), len(samples) - 1)
+        return samples[index]
+
+
+def build_llm_backend(name: str = LLM_BACKEND):
+    """Return the configured LLM backend (LLM_BACKEND=gemini|fake)"""
+    if name == "fake":
+        return FakeLLMBackend()
+    return GeminiBackend()
+
+
+class GatewayStats:
+    """Counters of gateway outcomes (this worker only)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.retries = 0
+        self.hedged = 0
+        self.rejected = 0  # failed fast, circuit open
+        self.unavailable = 0  # retries or deadline exhausted
+        self._lock = threading.Lock()
+
+    def add(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "hedged": self.hedged,
+                "rejected": self.rejected,
+                "unavailable": self.unavailable,
+            }
+
+
+class LLMGateway:
+    """
+    Single path for all Gemini calls.
+
+    Calls go to a backend (GeminiBackend, or FakeLLMBackend for offline
+    load tests) selected by LLM_BACKEND.
+    Every call carries a purpose (interviewer, mentor, summary, analysis)
+    and a deadline covering all of its attempts. Transient failures are
+    retried with full-jitter exponential backoff while the deadline allows.
+    Once a purpose has enough latency samples, a call still running after
+    that purpose's p``hedge_percentile`` latency gets a second, hedged
+    request (if a concurrency slot is free) and the first answer wins.
+    Consecutive transient failures open the circuit breaker, after which
+    calls fail fast with LLMUnavailable so callers can fall back.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        max_attempts: int = LLM_MAX_ATTEMPTS,
+        retry_base_delay: float = LLM_RETRY_BASE_DELAY,
+        hedge_percentile: float = LLM_HEDGE_PERCENTILE,
+        hedge_min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+        breaker: Optional[CircuitBreaker] = None,
+        backend=None
+    ):
+        # Caps in-flight Gemini calls per worker so a burst of interview turns
+        # queues here instead of piling up unbounded upstream requests.
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_delay = retry_base_delay
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.breaker = breaker or CircuitBreaker()
+        self.backend = backend or build_llm_backend()
+        self.latency = LatencyTracker()
+        self.stats = GatewayStats()
+
+    def start(self):
+        """Set up the backend's client (app startup)"""
+        self.backend.start()
+
+    async def close(self):
+        """Release the backend's connections (app shutdown)"""
+        await self.backend.close()
+
+    def snapshot(self) -> dict:
+        """Circuit state, outcome counters and per-purpose p50/p95 latency"""
+        return {
+            "circuit": self.breaker.state,
+            **self.stats.snapshot(),
+            "latency": {
+                purpose: {
+                    "p50": self.latency.percentile(purpose, 50),
+                    "p95": self.latency.percentile(purpose, 95),
+                }
+                for purpose in self.latency.purposes()
+            },
+        }
+
+    @contextmanager
+    def _instrument(self, purpose: str) -> Iterator[None]:
+        """Count the call by outcome and time it as the request's "llm" stage"""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            yield
+            outcome = "ok"
+        except CircuitOpen:
+            outcome = "rejected"
+            raise
+        except LLMUnavailable:
+            outcome = "unavailable"
+            raise
+        except (asyncio.CancelledError, GeneratorExit):
+            outcome = "cancelled"
+            raise
+        finally:
+            llm_requests.inc(purpose=purpose, outcome=outcome)
+            if outcome != "rejected":
+                seconds = time.perf_counter() - started
+                llm_request_seconds.observe(seconds, purpose=purpose)
+                record_stage("llm", seconds)
+
+    def _admit(self, purpose: str):
+        self.stats.add("calls")
+        if not self.breaker.allow():
+            self.stats.add("rejected")
+            raise CircuitOpen(f"{purpose}: circuit open")
+
+    def _unavailable(self, purpose: str, last_error: Optional[BaseException]) -> LLMUnavailable:
+        self.stats.add("unavailable")
+        return LLMUnavailable(f"{purpose}: {last_error!r}" if last_error else f"{purpose}: deadline exceeded")
+
+    async def generate(
+        self,
+        purpose: str,
+        model: str,
+        contents: str,
+        deadline: float,
+        config: Optional[dict] = None,
+        hedge: bool = True
+    ) -> str:
+        """
+        Generate text within deadline seconds.
+
+        Raises:
+            LLMUnavailable: If the circuit is open, or every attempt failed
+                transiently or the deadline passed
+            Exception: Non-transient upstream errors, as raised by the SDK
+        """
+        with self._instrument(purpose):
+            return await self._generate(purpose, model, contents, deadline, config, hedge)
+
+    async def _generate(
+        self,
+        purpose: str,
+        model: str,
+        contents: str,
+        deadline: float,
+        config: Optional[dict],
+        hedge: bool
+    ) -> str:
+        self._admit(purpose)
+
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline
+        last_error: Optional[BaseException] = None
+        for attempt in range(1, self.max_attempts + 1):
+            remaining = expires_at - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                text = await asyncio.wait_for(
+                    self._hedged(purpose, model, contents, config, hedge, remaining), remaining
+                )
+            except Exception as e:
+                if not is_transient(e):
+                    self.breaker.record_success()  # Upstream answered
+                    raise
+                last_error = e
+                self.breaker.record_failure()
+                if attempt == self.max_attempts or self.breaker.state != "closed":
+                    break
+                delay = random.uniform(0, self.retry_base_delay * 2 ** (attempt - 1))
+                if loop.time() + delay >= expires_at:
+                    break
+                self.stats.add("retries")
+                logger.warning("LLM %s attempt %d failed, retrying in %.2fs: %r", purpose, attempt, delay, e)
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return text
+        raise self._unavailable(purpose, last_error)
+
+    async def stream(self, purpose: str, model: str, contents: str, deadline: float) -> AsyncIterator[str]:
+        """
+        Stream text chunks, finishing within deadline seconds.
+
+        Attempts are retried only until the first chunk is yielded; after
+        that a failure ends the stream.
+
+        Raises:
+            LLMUnavailable: As for generate(), or if the stream breaks off
+            Exception: Non-transient upstream errors before the first chunk
+        """
+        with self._instrument(purpose):
+            async for text in self._stream(purpose, model, contents, deadline):
+                yield text
+
+    async def _stream(self, purpose: str, model: str, contents: str, deadline: float) -> AsyncIterator[str]:
+        self._admit(purpose)
+
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline
+        last_error: Optional[BaseException] = None
+        for attempt in range(1, self.max_attempts + 1):
+            started_output = False
+            try:
+                async with self._semaphore:
+                    chunks = self.backend.stream(purpose, model, contents).__aiter__()
+                    while True:
+                        try:
+                            text = await asyncio.wait_for(chunks.__anext__(), max(expires_at - loop.time(), 0))
+                        except StopAsyncIteration:
+                            break
+                        started_output = True
+                        yield text
+            except Exception as e:
+                if not is_transient(e):
+                    self.breaker.record_success()
+                    raise
+                last_error = e
+                self.breaker.record_failure()
+                if started_output:
+                    self.stats.add("unavailable")
+                    raise LLMUnavailable(f"{purpose}: stream interrupted: {e!r}") from e
+                if attempt == self.max_attempts or self.breaker.state != "closed":
+                    break
+                delay = random.uniform(0, self.retry_base_delay * 2 ** (attempt - 1))
+                if loop.time() + delay >= expires_at:
+                    break
+                self.stats.add("retries")
+                logger.warning("LLM %s stream attempt %d failed, retrying in %.2fs: %r", purpose, attempt, delay, e)
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return
+        raise self._unavailable(purpose, last_error)
+
+    async def _hedged(
+        self,
+        purpose: str,
+        model: str,
+        contents: str,
+        config: Optional[dict],
+        hedge: bool,
+        remaining: float
+    ) -> str:
+        """One attempt, plus a hedged duplicate if it runs past the hedge threshold"""
+        threshold = None
+        if hedge and self.hedge_percentile > 0:
+            threshold = self.latency.percentile(purpose, self.hedge_percentile, self.hedge_min_samples)
+
+        pending = {asyncio.create_task(self._call(purpose, model, contents, config))}
+        try:
+            done = set()
+            if threshold is not None and threshold < remaining:
+                done, pending = await asyncio.wait(pending, timeout=threshold)
+                # Do not hedge when saturated: the duplicate would only queue
+                if not done and not self._semaphore.locked():
+                    self.stats.add("hedged")
+                    logger.info("LLM %s slower than p%g (%.2fs), sending hedged request", purpose, self.hedge_percentile, threshold)
+                    pending.add(asyncio.create_task(self._call(purpose, model, contents, config)))
+
+            error: Optional[BaseException] = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _call(self, purpose: str, model: str, contents: str, config: Optional[dict]) -> str:
+        async with self._semaphore:
+            started = time.monotonic()
+            text = await self.backend.generate(purpose, model, contents, config)
+        self.latency.record(purpose, time.monotonic() - started)
+        return text
+
+
+llm_gateway = LLMGateway()
+
+_CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+registry.callback(
+    "llm_circuit_state",
+    "LLM circuit breaker state (0 closed, 1 half-open, 2 open)",
+    lambda: {(): _CIRCUIT_STATES[llm_gateway.breaker.state]},
+)
+registry.callback(
+    "llm_gateway_events_total",
+    "LLM gateway events (calls, retries, hedged, rejected, unavailable)",
+    lambda: {(event,): count for event, count in llm_gateway.stats.snapshot().items()},
+    ["event"],
+    type_name="counter",
+)
@@ -0,0 +1,22 @@
+from app.core.metrics import registry
+
+llm_requests = registry.counter(
+    "llm_requests_total",
+    "Gateway calls by purpose and outcome (ok, error, unavailable, rejected, cancelled)",
+    ["purpose", "outcome"],
+)
+llm_request_seconds = registry.histogram(
+    "llm_request_duration_seconds",
+    "Gateway call duration including retries and hedging",
+    ["purpose"],
+)
+llm_tokens = registry.counter(
+    "llm_tokens_total",
+    "LLM tokens by purpose and kind (prompt, completion); estimated for the fake backend",
+    ["purpose", "kind"],
+)
+
+
+def record_tokens(purpose: str, prompt_tokens: int, completion_tokens: int):
+    llm_tokens.inc(prompt_tokens or 0, purpose=purpose, kind="prompt")
+    llm_tokens.inc(completion_tokens or 0, purpose=purpose, kind="completion")
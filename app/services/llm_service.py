@@ -1,22 +1,50 @@
 import json
-from typing import Dict, List
+import logging
+import random
+from typing import AsyncIterator, Dict, List, Optional
 
-import google.generativeai as genai
+from app.core.config import LLM_DEADLINE_SECONDS, LLM_FALLBACK_ENABLED
+from app.core.metrics import span
+from app.services.context_budget import ContextBudget, estimate_tokens
+from app.services.llm_gateway import LLMUnavailable, llm_gateway
 
-from app.core.config import GEMINI_API_KEY
+logger = logging.getLogger(__name__)
+
+# Served instead of a generated question while Gemini is unavailable
+FALLBACK_QUESTIONS = [
+    "{title} 프로젝트에서 가장 어려웠던 기술적 문제는 무엇이었고, 어떻게 해결하셨나요?",
+    "{skills}을(를) 선택한 이유와, 검토했던 다른 대안과 비교한 장단점을 설명해 주세요.",
+    "방금 설명하신 부분을 처음부터 다시 구현한다면 어떤 점을 다르게 설계하시겠습니까?",
+    "{title} 프로젝트의 성능이나 안정성을 어떻게 검증하셨는지 구체적인 수치와 함께 말씀해 주세요.",
+    "그 과정에서 본인이 직접 담당한 부분과 팀원이 담당한 부분을 구분해서 설명해 주세요.",
+]
+
+DEFAULT_TIPS = [
+    "답변을 더 구체적으로 말씀해 주세요.",
+    "기술적 용어를 정확히 사용하세요.",
+    "경험을 구조화해서 설명하세요 (STAR 기법)."
+]
+
+FALLBACK_FEEDBACK = "지금은 AI 멘토 피드백을 생성할 수 없어 기본 가이드를 드립니다. 상황, 본인의 역할, 수치로 확인한 결과를 함께 설명하면 더 설득력 있는 답변이 됩니다."
 
 
 class LLMService:
     """
     LLM service using Google Gemini API.
     Provides interviewer and mentor agent personalities.
+
+    Cheap to construct per request: calls go through the process-wide
+    llm_gateway (deadlines, retries, circuit breaker) and its pooled
+    connections. While Gemini is unavailable, questions and feedback fall
+    back to canned text unless LLM_FALLBACK_ENABLED is off.
     """
 
-    def __init__(self):
-        """Initialize Gemini models"""
-        genai.configure(api_key=GEMINI_API_KEY)
-        self.interviewer_model = genai.GenerativeModel('gemini-2.5-flash')
-        self.mentor_model = genai.GenerativeModel('gemini-2.5-flash')
+    interviewer_model = "gemini-2.5-flash"
+    mentor_model = "gemini-2.5-flash"
+
+    def __init__(self, context_budget: Optional[ContextBudget] = None):
+        """Initialize context budget"""
+        self.context_budget = context_budget or ContextBudget()
 
     def format_greeting(
         self,
@@ -41,7 +69,8 @@ class LLMService:
         self,
         user_answer: str,
         project_context: Dict[str, str],
-        history: List[Dict] = None
+        history: List[Dict] = None,
+        history_text: Optional[str] = None
     ) -> str:
         """
         Generate an aggressive follow-up question as a strict interviewer.
@@ -50,6 +79,8 @@ class LLMService:
             user_answer: The user's latest answer
             project_context: Project information (title, skills_used, content, results)
             history: Optional conversation history
+            history_text: Optional pre-rendered history (e.g. from a server-side
+                session); takes precedence over history
 
         Returns:
             Korean question string
@@ -57,14 +88,142 @@ class LLMService:
         Raises:
             Exception: If LLM generation fails
         """
-        history = history or []
+        with span("prompt"):
+            system_prompt = self._build_interviewer_prompt(
+                user_answer, project_context, history, history_text
+            )
+
+        try:
+            text = await llm_gateway.generate(
+                "interviewer", self.interviewer_model, system_prompt, deadline=LLM_DEADLINE_SECONDS
+            )
+            return text.strip()
+        except LLMUnavailable as e:
+            if LLM_FALLBACK_ENABLED:
+                logger.warning("Serving fallback question: %s", e)
+                return self.fallback_question(project_context)
+            raise Exception(f"면접관 질문 생성 실패: {str(e)}")
+        except Exception as e:
+            raise Exception(f"면접관 질문 생성 실패: {str(e)}")
 
-        # Build conversation history string
-        history_text = ""
-        if history:
-            for msg in history:
-                role_kr = "면접관" if msg["role"] == "interviewer" else "지원자"
-                history_text += f"{role_kr}: {msg['content']}\n"
+    async def stream_interviewer_question(
+        self,
+        user_answer: str,
+        project_context: Dict[str, str],
+        history: List[Dict] = None,
+        history_text: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the interviewer's follow-up question as it is generated.
+
+        Same prompt as generate_interviewer_question, but yields text deltas
+        so callers can start TTS before the whole question is available.
+
+        Yields:
+            Text chunks of the Korean question
+
+        Raises:
+            Exception: If LLM generation fails
+        """
+        with span("prompt"):
+            system_prompt = self._build_interviewer_prompt(
+                user_answer, project_context, history, history_text
+            )
+
+        started = False
+        try:
+            async for text in llm_gateway.stream(
+                "interviewer", self.interviewer_model, system_prompt, deadline=LLM_DEADLINE_SECONDS
+            ):
+                started = True
+                yield text
+        except LLMUnavailable as e:
+            # A question cut off mid-sentence cannot be completed with a canned one
+            if LLM_FALLBACK_ENABLED and not started:
+                logger.warning("Serving fallback question: %s", e)
+                yield self.fallback_question(project_context)
+                return
+            raise Exception(f"면접관 질문 생성 실패: {str(e)}")
+        except Exception as e:
+            raise Exception(f"면접관 질문 생성 실패: {str(e)}")
+
+    @staticmethod
+    def fallback_question(project_context: Dict[str, str]) -> str:
+        """Canned follow-up question about the project, for when Gemini is unavailable"""
+        return random.choice(FALLBACK_QUESTIONS).format(
+            title=project_context.get("title") or "이번",
+            skills=project_context.get("skills_used") or "사용하신 기술 스택",
+        )
+
+    @staticmethod
+    def render_turn(role: str, content: str) -> str:
+        """Render one conversation message as a transcript line"""
+        role_kr = "면접관" if role == "interviewer" else "지원자"
+        return f"{role_kr}: {content}\n"
+
+    @classmethod
+    def render_history(cls, history: List[Dict]) -> str:
+        """Render a full conversation history as transcript text"""
+        return "".join(cls.render_turn(msg["role"], msg["content"]) for msg in history or [])
+
+    def render_bounded_history(self, history: List[Dict]) -> str:
+        """Render a client-sent history within the context budget"""
+        return self.context_budget.compact_history(history or [], self.render_turn)
+
+    def _report_prompt_size(self, kind: str, prompt: str, history_text: str):
+        logger.info(
+            "%s prompt: ~%d tokens (history ~%d tokens, %d chars)",
+            kind,
+            estimate_tokens(prompt),
+            estimate_tokens(history_text),
+            len(prompt),
+        )
+
+    async def summarize_history(self, previous_summary: str, transcript: str) -> str:
+        """
+        Fold older interview turns into the rolling summary.
+
+        Args:
+            previous_summary: Summary of turns folded earlier (may be empty)
+            transcript: Rendered turns to fold in
+
+        Returns:
+            Updated Korean summary
+
+        Raises:
+            Exception: If LLM generation fails
+        """
+        prompt = f"""
+다음은 기술 면접의 이전 대화 요약과 그 이후 대화 기록입니다.
+두 내용을 합쳐 면접관이 이후 질문을 이어가는 데 필요한 정보만 담은 간결한 요약을 작성하세요.
+
+규칙:
+1. 한국어, 최대 {self.context_budget.summary_tokens // 2}자 내외
+2. 이미 다룬 주제, 지원자가 설명한 기술적 결정과 근거, 답변이 부족했던 부분을 포함
+3. 요약만 출력하고, 다른 설명은 포함하지 마세요.
+
+이전 요약:
+{previous_summary or "없음"}
+
+대화 기록:
+{transcript}
+"""
+        text = await llm_gateway.generate(
+            "summary", self.interviewer_model, prompt, deadline=LLM_DEADLINE_SECONDS
+        )
+        return text.strip()
+
+    def _build_interviewer_prompt(
+        self,
+        user_answer: str,
+        project_context: Dict[str, str],
+        history: List[Dict] = None,
+        history_text: Optional[str] = None
+    ) -> str:
+        """Build the strict-interviewer prompt for the latest answer"""
+        if history_text is None:
+            history_text = self.render_bounded_history(history)
+        project_context = self.context_budget.project_context(project_context)
 
         # Construct system prompt
         system_prompt = f"""
@@ -96,18 +255,15 @@ class LLMService:
 
 위 답변을 분석하고, 기술적 깊이를 평가할 수 있는 날카로운 후속 질문을 하나 생성하세요. 질문만 출력하고, 다른 설명은 포함하지 마세요.
 """
-
-        try:
-            response = self.interviewer_model.generate_content(system_prompt)
-            return response.text.strip()
-        except Exception as e:
-            raise Exception(f"면접관 질문 생성 실패: {str(e)}")
+        self._report_prompt_size("interviewer", system_prompt, history_text)
+        return system_prompt
 
     async def generate_mentor_feedback(
         self,
         interviewer_question: str,
         user_answer: str,
-        history: List[Dict] = None
+        history: List[Dict] = None,
+        history_text: Optional[str] = None
     ) -> Dict[str, any]:
         """
         Generate constructive feedback as a supportive mentor.
@@ -116,6 +272,7 @@ class LLMService:
             interviewer_question: The interviewer's question
             user_answer: The user's answer
             history: Optional conversation history
+            history_text: Optional pre-rendered history; takes precedence over history
 
         Returns:
             Dictionary with 'feedback' (str) and 'tips' (list of str)
@@ -123,17 +280,12 @@ class LLMService:
         Raises:
             Exception: If LLM generation fails
         """
-        history = history or []
-
-        # Build conversation history string
-        history_text = ""
-        if history:
-            for msg in history:
-                role_kr = "면접관" if msg["role"] == "interviewer" else "지원자"
-                history_text += f"{role_kr}: {msg['content']}\n"
+        with span("prompt"):
+            if history_text is None:
+                history_text = self.render_bounded_history(history)
 
-        # Construct system prompt
-        system_prompt = f"""
+            # Construct system prompt
+            system_prompt = f"""
 당신은 따뜻하고 경험 많은 기술 멘토입니다.
 
 역할:
@@ -170,10 +322,14 @@ class LLMService:
 
 JSON 형식만 출력하고, 다른 텍스트는 포함하지 마세요.
 """
+            self._report_prompt_size("mentor", system_prompt, history_text)
 
+        response_text = None
         try:
-            response = self.mentor_model.generate_content(system_prompt)
-            response_text = response.text.strip()
+            response_text = await llm_gateway.generate(
+                "mentor", self.mentor_model, system_prompt, deadline=LLM_DEADLINE_SECONDS
+            )
+            response_text = response_text.strip()
 
             # Clean markdown code blocks if present
             if response_text.startswith("```json"):
@@ -191,12 +347,13 @@ JSON 형식만 출력하고, 다른 텍스트는 포함하지 마세요.
         except json.JSONDecodeError as e:
             # Fallback if JSON parsing fails
             return {
-                "feedback": response.text.strip() if response else "피드백을 생성할 수 없습니다.",
-                "tips": [
-                    "답변을 더 구체적으로 말씀해 주세요.",
-                    "기술적 용어를 정확히 사용하세요.",
-                    "경험을 구조화해서 설명하세요 (STAR 기법)."
-                ]
+                "feedback": response_text or "피드백을 생성할 수 없습니다.",
+                "tips": list(DEFAULT_TIPS)
             }
+        except LLMUnavailable as e:
+            if LLM_FALLBACK_ENABLED:
+                logger.warning("Serving fallback feedback: %s", e)
+                return {"feedback": FALLBACK_FEEDBACK, "tips": list(DEFAULT_TIPS)}
+            raise Exception(f"멘토 피드백 생성 실패: {str(e)}")
         except Exception as e:
             raise Exception(f"멘토 피드백 생성 실패: {str(e)}")
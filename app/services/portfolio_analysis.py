@@ -0,0 +1,95 @@
+from typing import List, Optional
+
+from app.models import Job, Project, User
+from app.schemas.analysis import PortfolioAnalysisResponse
+from app.services.analysis_cache import analysis_fingerprint
+from app.services.program_catalogue import program_catalogue
+from app.services.skill_matcher import portfolio_skills
+from app.utils.ai_analysis import analyze_portfolio
+
+
+class AnalysisError(Exception):
+    """The AI analysis returned an error instead of a result"""
+
+
+def owned_skills(user: User, project: Optional[Project]) -> List[str]:
+    """Skills from the profile, the project's stack and its write-up (see portfolio_skills)"""
+    if project is None:
+        return portfolio_skills(user.skills, None, None)
+    return portfolio_skills(user.skills, project.skills_used, project.content)
+
+
+def build_payload(user: User, project: Project, job: Job) -> dict:
+    """Analysis inputs for a user, their project and the selected job"""
+    return {
+        "user_data": {
+            "self_summary": user.self_summary or "",
+            "survey_text": user.survey_text or "",
+            "skills": user.skills or ""
+        },
+        "project_data": {
+            "title": project.title,
+            "content": project.content or "",
+            "skills_used": project.skills_used or ""
+        },
+        "job_data": {
+            "company": job.company,
+            "title": job.title,
+            "description": job.description,
+            "skills_required": job.skills_required or ""
+        },
+        "domain": user.domain,
+        "analyzed_project": project.title,
+        "analyzed_job": f"{job.company} - {job.title}",
+    }
+
+
+def payload_fingerprint(payload: dict) -> str:
+    """Cache fingerprint of an analysis payload"""
+    return analysis_fingerprint(
+        payload["user_data"],
+        payload["project_data"],
+        payload["job_data"],
+        program_catalogue.version
+    )
+
+
+async def run_portfolio_analysis(payload: dict) -> dict:
+    """
+    Run the Gemini portfolio analysis for a payload.
+
+    The call goes through llm_gateway on the event loop, so concurrent
+    analyses are bounded by LLM_MAX_CONCURRENCY instead of occupying
+    default-executor threads while they wait on Gemini.
+
+    Args:
+        payload: Dict with user_data, project_data, job_data, domain,
+            analyzed_project and analyzed_job
+
+    Returns:
+        Validated PortfolioAnalysisResponse as a dict
+
+    Raises:
+        AnalysisError: If the AI analysis reported an error
+        LLMUnavailable: If Gemini is unavailable (circuit open or deadline passed)
+        Exception: If the response could not be produced or validated
+    """
+    analysis_result = await analyze_portfolio(
+        payload["user_data"],
+        payload["project_data"],
+        payload["job_data"],
+        domain=payload.get("domain")
+    )
+
+    # Check if result contains error
+    if not isinstance(analysis_result, dict):
+        raise AnalysisError(str(analysis_result))
+    if "error" in analysis_result:
+        raise AnalysisError(analysis_result["error"])
+
+    # Add metadata for tracking
+    analysis_result["analyzed_project"] = payload["analyzed_project"]
+    analysis_result["analyzed_job"] = payload["analyzed_job"]
+
+    # Validate so malformed AI output is never stored
+    return PortfolioAnalysisResponse.model_validate(analysis_result).model_dump()
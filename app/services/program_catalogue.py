@@ -0,0 +1,136 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from app.core.config import PROGRAM_CANDIDATE_LIMIT, PROGRAM_CATALOGUE_RELOAD_SECONDS
+from app.services.skill_matcher import parse_skills, skill_key
+
+logger = logging.getLogger(__name__)
+
+PROGRAMS_PATH = Path(__file__).resolve().parent.parent.parent / "dummy_data" / "program_dummy.json"
+
+
+class _Snapshot:
+    """Immutable catalogue contents plus its indexes"""
+
+    def __init__(self, programs: List[dict], version: str, stamp: Optional[Tuple[int, int]]):
+        self.programs = programs
+        self.version = version
+        self.stamp = stamp
+
+        by_skill = defaultdict(set)
+        by_domain = defaultdict(set)
+        for index, program in enumerate(programs):
+            for skill in parse_skills(program.get("program_skills")):
+                by_skill[skill_key(skill)].add(index)
+            by_domain[program.get("domain") or ""].add(index)
+        self.by_skill: Dict[str, FrozenSet[int]] = {token: frozenset(ids) for token, ids in by_skill.items()}
+        self.by_domain: Dict[str, FrozenSet[int]] = {domain: frozenset(ids) for domain, ids in by_domain.items()}
+
+
+class ProgramCatalogue:
+    """
+    Training program catalogue with an inverted skill index.
+
+    The JSON file is parsed once and indexed by canonical skill and domain, so
+    an analysis only sends the programs that can cover the candidate's skill
+    gap instead of the whole catalogue. The file is re-checked at most every
+    ``reload_seconds`` and re-indexed when its mtime or size changes. Readers
+    always see a complete snapshot; a reload swaps it atomically.
+    """
+
+    def __init__(self, path: Path = PROGRAMS_PATH, reload_seconds: float = PROGRAM_CATALOGUE_RELOAD_SECONDS):
+        self.path = path
+        self.reload_seconds = reload_seconds
+        self._snapshot: Optional[_Snapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Parse and index the catalogue file (called at startup)"""
+        with self._lock:
+            self._snapshot = self._read(self._snapshot)
+            self._checked_at = time.monotonic()
+
+    @property
+    def version(self) -> str:
+        """Content hash of the loaded catalogue"""
+        return self._current().version
+
+    @property
+    def programs(self) -> List[dict]:
+        return self._current().programs
+
+    def candidates(
+        self,
+        missing_skills: Iterable[str],
+        related_skills: Iterable[str] = (),
+        domain: Optional[str] = None,
+        limit: int = PROGRAM_CANDIDATE_LIMIT
+    ) -> List[dict]:
+        """
+        Programs whose skills overlap the given skills, best matches first.
+
+        Args:
+            missing_skills: Skill names the candidate lacks; each overlap weighs most
+            related_skills: Other job skill names, used to rank and fill remaining slots
+            domain: Only consider programs of this domain (None = all domains)
+            limit: Maximum number of programs returned
+
+        Returns:
+            Program dicts ordered by overlap score, then catalogue order
+        """
+        snapshot = self._current()
+        allowed = snapshot.by_domain.get(domain, frozenset()) if domain else None
+
+        scores: Dict[int, int] = defaultdict(int)
+        for weight, skills in ((2, missing_skills), (1, related_skills)):
+            for key in {skill_key(skill) for skill in skills}:
+                for index in snapshot.by_skill.get(key, ()):
+                    if allowed is None or index in allowed:
+                        scores[index] += weight
+
+        ranked = sorted(scores, key=lambda index: (-scores[index], index))
+        return [snapshot.programs[index] for index in ranked[:limit]]
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < self.reload_seconds:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or now - self._checked_at >= self.reload_seconds:
+                self._snapshot = self._read(self._snapshot)
+                self._checked_at = now
+            return self._snapshot
+
+    def _read(self, previous: Optional[_Snapshot]) -> _Snapshot:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return _Snapshot([], "none", None)
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if previous is not None and previous.stamp == stamp:
+            return previous
+
+        try:
+            raw = self.path.read_bytes()
+            programs = json.loads(raw)
+        except Exception as e:
+            # Keep serving the last good catalogue while the file is mid-edit
+            logger.warning("Failed to load program catalogue %s: %s", self.path, e)
+            return previous or _Snapshot([], "none", None)
+
+        version = hashlib.sha256(raw).hexdigest()[:16]
+        logger.info("Loaded %d training programs (catalogue %s)", len(programs), version)
+        return _Snapshot(programs, version, stamp)
+
+
+program_catalogue = ProgramCatalogue()
@@ -0,0 +1,281 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import Depends
+from sqlalchemy import func, inspect, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import INTERVIEW_SESSION_STORE
+from app.core.database import get_session
+from app.models import InterviewSession, InterviewTurn
+from app.services.llm_service import LLMService
+
+
+class InterviewSessionStore(ABC):
+    """
+    Server-side interview transcript storage.
+
+    Each session keeps its turns plus a pre-rendered transcript
+    (``history_text``) that is extended by one line per turn, so a turn
+    request only carries the new answer and prompt building never
+    re-renders the whole conversation.
+    """
+
+    @abstractmethod
+    async def create(self, user_id: int, project_id: int) -> InterviewSession:
+        """Create an empty session"""
+
+    @abstractmethod
+    async def get_by_id(self, session_id: str) -> Optional[InterviewSession]:
+        """Return the session, or None if it does not exist"""
+
+    async def get(self, session_id: str, user_id: int) -> Optional[InterviewSession]:
+        """Return the session if it exists and belongs to user_id"""
+        interview_session = await self.get_by_id(session_id)
+        if interview_session is None or interview_session.user_id != user_id:
+            return None
+        return interview_session
+
+    @abstractmethod
+    async def append_turns(self, session_id: str, turns: List[Tuple[str, str]]):
+        """Append (role, content) turns and extend the rendered transcript"""
+
+    @abstractmethod
+    async def list_turns(
+        self,
+        session_id: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> List[InterviewTurn]:
+        """Turns with start <= seq < end, in order"""
+
+    @abstractmethod
+    async def fold(
+        self,
+        session_id: str,
+        expected_summarized_turns: int,
+        folded_turns: int,
+        folded_prefix_length: int,
+        summary: str
+    ) -> bool:
+        """
+        Replace the summary and drop the folded turns from the rendered window.
+
+        Applied only if summarized_turns still equals expected_summarized_turns.
+        folded_prefix_length is the length of the rendered folded turns, which
+        are always the head of history_text.
+
+        Returns:
+            True if the fold was applied
+        """
+
+    async def find_question_for_answer(self, session_id: str, user_answer: str) -> Optional[str]:
+        """
+        Return the interviewer question that user_answer responded to.
+
+        Uses the question preceding the latest matching user turn, or the
+        latest question if the answer has not been recorded yet.
+        """
+        last_question = None
+        candidate = None
+        for turn in await self.list_turns(session_id):
+            if turn.role == "interviewer":
+                last_question = turn.content
+            elif turn.role == "user" and turn.content == user_answer:
+                candidate = last_question
+        return candidate or last_question
+
+
+class DatabaseSessionStore(InterviewSessionStore):
+    """Session store backed by the interviewsession/interviewturn tables"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, user_id: int, project_id: int) -> InterviewSession:
+        interview_session = InterviewSession(user_id=user_id, project_id=project_id)
+        self.session.add(interview_session)
+        await self.session.commit()
+        await self.session.refresh(interview_session)
+        return interview_session
+
+    async def get_by_id(self, session_id: str) -> Optional[InterviewSession]:
+        return await self.session.get(InterviewSession, session_id)
+
+    async def append_turns(self, session_id: str, turns: List[Tuple[str, str]]):
+        # Reserve seq positions and extend the transcript in one UPDATE: the
+        # row lock it takes serializes concurrent turns on the same session,
+        # so they never get the same seq or drop transcript lines
+        rendered = "".join(LLMService.render_turn(role, content) for role, content in turns)
+        turn_count = (await self.session.exec(
+            update(InterviewSession)
+            .where(InterviewSession.id == session_id)
+            .values(
+                history_text=InterviewSession.history_text + rendered,
+                turn_count=InterviewSession.turn_count + len(turns),
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(InterviewSession.turn_count)
+        )).scalar_one()
+
+        first_seq = turn_count - len(turns)
+        for offset, (role, content) in enumerate(turns):
+            self.session.add(
+                InterviewTurn(session_id=session_id, seq=first_seq + offset, role=role, content=content)
+            )
+        await self.session.commit()
+
+    async def list_turns(
+        self,
+        session_id: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> List[InterviewTurn]:
+        statement = (
+            select(InterviewTurn)
+            .where(InterviewTurn.session_id == session_id, InterviewTurn.seq >= start)
+            .order_by(InterviewTurn.seq)
+        )
+        if end is not None:
+            statement = statement.where(InterviewTurn.seq < end)
+        return list((await self.session.exec(statement)).all())
+
+    async def fold(
+        self,
+        session_id: str,
+        expected_summarized_turns: int,
+        folded_turns: int,
+        folded_prefix_length: int,
+        summary: str
+    ) -> bool:
+        result = await self.session.exec(
+            update(InterviewSession)
+            .where(
+                InterviewSession.id == session_id,
+                InterviewSession.summarized_turns == expected_summarized_turns,
+            )
+            .values(
+                summary=summary,
+                summarized_turns=InterviewSession.summarized_turns + folded_turns,
+                # Cut the folded head in SQL so turns appended meanwhile are kept
+                history_text=func.substr(InterviewSession.history_text, folded_prefix_length + 1),
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+        await self.session.commit()
+        return result.rowcount == 1
+
+
+class MemorySessionStore(InterviewSessionStore):
+    """
+    Process-local session store.
+
+    Only suitable for a single worker (local development, load tests);
+    with several uvicorn workers a session is visible only to the worker
+    that created it.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, InterviewSession] = {}
+        self._turns: Dict[str, List[InterviewTurn]] = {}
+
+    async def create(self, user_id: int, project_id: int) -> InterviewSession:
+        interview_session = InterviewSession(user_id=user_id, project_id=project_id)
+        self._sessions[interview_session.id] = interview_session
+        self._turns[interview_session.id] = []
+        return interview_session
+
+    async def get_by_id(self, session_id: str) -> Optional[InterviewSession]:
+        return self._sessions.get(session_id)
+
+    async def append_turns(self, session_id: str, turns: List[Tuple[str, str]]):
+        interview_session = self._sessions[session_id]
+        session_turns = self._turns[session_id]
+        for role, content in turns:
+            session_turns.append(
+                InterviewTurn(session_id=session_id, seq=len(session_turns), role=role, content=content)
+            )
+            interview_session.history_text += LLMService.render_turn(role, content)
+        interview_session.turn_count = len(session_turns)
+        interview_session.updated_at = datetime.now(timezone.utc)
+
+    async def list_turns(
+        self,
+        session_id: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> List[InterviewTurn]:
+        return list(self._turns.get(session_id, [])[start:end])
+
+    async def fold(
+        self,
+        session_id: str,
+        expected_summarized_turns: int,
+        folded_turns: int,
+        folded_prefix_length: int,
+        summary: str
+    ) -> bool:
+        interview_session = self._sessions.get(session_id)
+        if interview_session is None or interview_session.summarized_turns != expected_summarized_turns:
+            return False
+        interview_session.summary = summary
+        interview_session.summarized_turns += folded_turns
+        interview_session.history_text = interview_session.history_text[folded_prefix_length:]
+        interview_session.updated_at = datetime.now(timezone.utc)
+        return True
+
+
+_memory_store = MemorySessionStore()
+
+
+def repair_turn_sequence(engine: Engine) -> int:
+    """
+    Renumber the turns of sessions that hold duplicate seq values.
+
+    Before seq positions were reserved atomically, concurrent turns on one
+    session could get the same seq, which blocks the (session_id, seq)
+    unique index. Affected sessions are renumbered in (seq, id) order, the
+    order they were listed in. Runs at startup before create_missing_indexes;
+    a no-op once the index exists.
+
+    Returns:
+        Number of sessions renumbered
+    """
+    if any(index["name"] == "uq_interviewturn_session_id_seq"
+           for index in inspect(engine).get_indexes(InterviewTurn.__tablename__)):
+        return 0
+    with Session(engine) as session:
+        session_ids = session.exec(
+            select(InterviewTurn.session_id)
+            .group_by(InterviewTurn.session_id, InterviewTurn.seq)
+            .having(func.count() > 1)
+            .distinct()
+        ).all()
+        for session_id in session_ids:
+            turns = session.exec(
+                select(InterviewTurn)
+                .where(InterviewTurn.session_id == session_id)
+                .order_by(InterviewTurn.seq, InterviewTurn.id)
+            ).all()
+            for seq, turn in enumerate(turns):
+                turn.seq = seq
+            interview_session = session.get(InterviewSession, session_id)
+            if interview_session is not None:
+                interview_session.turn_count = len(turns)
+        session.commit()
+    return len(session_ids)
+
+
+def build_session_store(session: AsyncSession) -> InterviewSessionStore:
+    """Return the configured session store (INTERVIEW_SESSION_STORE=db|memory)"""
+    if INTERVIEW_SESSION_STORE == "memory":
+        return _memory_store
+    return DatabaseSessionStore(session)
+
+
+def get_session_store(session: AsyncSession = Depends(get_session)) -> InterviewSessionStore:
+    """FastAPI dependency for the configured session store"""
+    return build_session_store(session)
@@ -0,0 +1,252 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+# Canonical skill name -> aliases (compared after normalize_key)
+SKILL_ALIASES: Dict[str, List[str]] = {
+    # Languages
+    "Java": ["자바"],
+    "Kotlin": ["코틀린"],
+    "Python": ["파이썬", "py", "python3"],
+    "JavaScript": ["js", "자바스크립트", "es6", "ecmascript"],
+    "TypeScript": ["ts", "타입스크립트"],
+    "Go": ["golang", "고랭"],
+    "C": [],
+    "C++": ["cpp", "cplusplus"],
+    "C#": ["csharp"],
+    "Rust": [],
+    "Swift": [],
+    "Dart": [],
+    "SQL": [],
+    # Backend frameworks
+    "Spring": ["spring framework", "스프링"],
+    "Spring Boot": ["springboot", "스프링부트", "스프링 부트"],
+    "JPA": ["spring data jpa", "hibernate"],
+    "MyBatis": [],
+    "Django": ["장고"],
+    "Flask": [],
+    "FastAPI": [],
+    "Node.js": ["node", "nodejs"],
+    "Express": ["express.js", "expressjs"],
+    "NestJS": ["nest", "nest.js"],
+    # Frontend
+    "React": ["react.js", "reactjs", "리액트"],
+    "Vue": ["vue.js", "vuejs", "뷰"],
+    "Angular": [],
+    "Next.js": ["next", "nextjs"],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "Redux": [],
+    "Flutter": ["플러터"],
+    # Data stores
+    "MySQL": ["마이에스큐엘"],
+    "PostgreSQL": ["postgres", "psql", "포스트그레스"],
+    "Oracle": ["oracle db"],
+    "MongoDB": ["mongo"],
+    "Redis": ["레디스"],
+    "Elasticsearch": ["elastic search"],
+    # Messaging / data
+    "Kafka": ["apache kafka", "카프카"],
+    "RabbitMQ": [],
+    "Spark": ["apache spark"],
+    "Airflow": ["apache airflow"],
+    # Infra / cloud
+    "AWS": ["amazon web services", "아마존웹서비스"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Azure": ["microsoft azure"],
+    "Docker": ["도커"],
+    "Kubernetes": ["k8s", "쿠버네티스"],
+    "Terraform": [],
+    "Linux": ["리눅스"],
+    "Nginx": [],
+    "CI/CD": ["cicd", "github actions", "jenkins"],
+    # Collaboration
+    "Git": ["github", "gitlab", "깃"],
+    "Jira": [],
+}
+
+# Relative importance when scoring; unlisted skills weigh 1.0
+SKILL_WEIGHTS: Dict[str, float] = {
+    "Git": 0.5,
+    "Jira": 0.3,
+    "HTML": 0.5,
+    "CSS": 0.5,
+    "Linux": 0.7,
+}
+
+_SEPARATORS = re.compile(r"[,/|·\n]+")
+# Skill names that contain a separator character
+_PROTECTED = re.compile(r"ci\s*/\s*cd", re.IGNORECASE)
+_KEY_NOISE = re.compile(r"[\s._\-]+")
+_WORD = re.compile(r"[A-Za-z][A-Za-z0-9+#.]*")
+# Aliases too ambiguous to detect in free text
+_AMBIGUOUS_MENTIONS = {"next", "nest", "spring"}
+
+
+def normalize_key(name: str) -> str:
+    """Lookup key: lowercase without spaces, dots, hyphens or underscores"""
+    return _KEY_NOISE.sub("", name.lower())
+
+
+_CANONICAL: Dict[str, str] = {}
+for _name, _aliases in SKILL_ALIASES.items():
+    for _alias in [_name, *_aliases]:
+        _CANONICAL[normalize_key(_alias)] = _name
+
+
+@lru_cache(maxsize=4096)
+def canonical_skill(name: str) -> Optional[str]:
+    """
+    Canonical display name of a skill.
+
+    Unknown skills keep their original spelling (whitespace collapsed) so
+    they still match the same spelling elsewhere.
+
+    Returns:
+        Canonical name, or None for an empty string
+    """
+    cleaned = " ".join(name.split())
+    if not cleaned:
+        return None
+    key = normalize_key(cleaned)
+    return _CANONICAL.get(key, cleaned)
+
+
+def parse_skills(text: Optional[str]) -> List[str]:
+    """Split a comma separated skill string into unique canonical names, in order"""
+    if not text:
+        return []
+    text = _PROTECTED.sub("CICD", text)
+
+    skills: List[str] = []
+    seen = set()
+    for piece in _SEPARATORS.split(text):
+        skill = canonical_skill(piece)
+        if skill is None:
+            continue
+        key = normalize_key(skill)
+        if key not in seen:
+            seen.add(key)
+            skills.append(skill)
+    return skills
+
+
+def mentioned_skills(text: Optional[str]) -> List[str]:
+    """
+    Known skills mentioned in free text (descriptions, project write-ups).
+
+    Only Latin-script words and word pairs are looked up, and very short or
+    ambiguous aliases ("Go", "ts", "next") are ignored, so this only finds
+    skills the dictionary can identify with confidence.
+    """
+    if not text:
+        return []
+    words = [normalize_key(word) for word in _WORD.findall(text)]
+    candidates = words + [a + b for a, b in zip(words, words[1:])]
+
+    skills: List[str] = []
+    for key in candidates:
+        if key in _AMBIGUOUS_MENTIONS or (len(key) < 3 and key.isalnum()):
+            continue
+        skill = _CANONICAL.get(key)
+        if skill is not None and skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+def skill_weight(skill: str) -> float:
+    """Scoring weight of a canonical skill name"""
+    return SKILL_WEIGHTS.get(skill, 1.0)
+
+
+def portfolio_skills(
+    profile_skills: Optional[str],
+    project_skills: Optional[str],
+    project_content: Optional[str]
+) -> List[str]:
+    """
+    Skills a candidate owns: the profile, the project's stack and skills
+    mentioned in the project write-up.
+
+    Job ranking, the skill-match preview and the analysis prompt all use
+    this one set so their matched/missing skills and scores agree.
+    """
+    return parse_skills(profile_skills) + parse_skills(project_skills) + mentioned_skills(project_content)
+
+
+def job_skills(skills_required: Optional[str], description: Optional[str]) -> List[str]:
+    """Skills a job requires: its listed skills, or those its description mentions if none are listed"""
+    return parse_skills(skills_required) or mentioned_skills(description)
+
+
+def skill_key(name: str) -> str:
+    """Matching key of a skill: the normalized canonical name"""
+    return normalize_key(canonical_skill(name) or "")
+
+
+class SkillMatch:
+    """Result of matching a candidate's skills against required skills"""
+
+    def __init__(self, matched: List[str], missing: List[str], extra: List[str], score: int):
+        self.matched = matched
+        self.missing = missing
+        self.extra = extra
+        self.score = score
+
+    def to_dict(self) -> dict:
+        return {
+            "matched_skills": self.matched,
+            "missing_skills": self.missing,
+            "extra_skills": self.extra,
+            "score": self.score,
+        }
+
+
+def match_skills(owned: Iterable[str], required: Iterable[str]) -> SkillMatch:
+    """
+    Set-based weighted match of owned skills against required skills.
+
+    Args:
+        owned: Candidate skill names (any spelling)
+        required: Required skill names (any spelling)
+
+    Returns:
+        SkillMatch with canonical names in the required list's order and a
+        0-100 score (share of required skill weight that is covered; 0 when
+        nothing is required)
+    """
+    owned_keys = {}
+    for name in owned:
+        skill = canonical_skill(name)
+        if skill:
+            owned_keys.setdefault(normalize_key(skill), skill)
+
+    matched, missing = [], []
+    required_keys = set()
+    total_weight = matched_weight = 0.0
+    for name in required:
+        skill = canonical_skill(name)
+        if not skill:
+            continue
+        key = normalize_key(skill)
+        if key in required_keys:
+            continue
+        required_keys.add(key)
+
+        weight = skill_weight(skill)
+        total_weight += weight
+        if key in owned_keys:
+            matched.append(skill)
+            matched_weight += weight
+        else:
+            missing.append(skill)
+
+    extra = [skill for key, skill in owned_keys.items() if key not in required_keys]
+    score = round(100 * matched_weight / total_weight) if total_weight else 0
+    return SkillMatch(matched, missing, extra, score)
+
+
+def match_portfolio(user_data: dict, project_data: dict, job_data: dict) -> SkillMatch:
+    """Match the user's portfolio skills against a job's required skills"""
+    owned = portfolio_skills(user_data.get("skills"), project_data.get("skills_used"), project_data.get("content"))
+    return match_skills(owned, job_skills(job_data.get("skills_required"), job_data.get("description")))
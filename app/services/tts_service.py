@@ -1,23 +1,128 @@
+import asyncio
 import base64
-import hashlib
-from typing import Dict, Optional
+import itertools
+from typing import Dict, List, Optional
 
+import google.auth
 from google.cloud import texttospeech_v1
 
-from app.core.config import GOOGLE_APPLICATION_CREDENTIALS, TTS_VOICE_NAME
+from app.core.config import (
+    TTS_BACKEND,
+    TTS_CACHE_DIR,
+    TTS_CACHE_DISK_MAX_BYTES,
+    TTS_CACHE_MAX_BYTES,
+    TTS_CACHE_TTL_SECONDS,
+    TTS_CLIENT_POOL_SIZE,
+    TTS_MAX_CONCURRENCY,
+    TTS_VOICE_NAME,
+)
+from app.core.metrics import registry, span
+from app.services.audio_cache import AudioCache
+from app.services.fake_backends import FakeTTSBackend
+
+# Hit rate = hit / (hit + joined + miss); "joined" waited on another request's synthesis
+tts_cache_requests = registry.counter(
+    "tts_cache_requests_total",
+    "TTS requests by how they were served: hit (audio cache), joined (in-flight synthesis), miss",
+    ["result"],
+)
+
+
+class GoogleTTSBackend:
+    """
+    TTSService backend calling Google Cloud TTS over a pool of async gRPC
+    clients, so channels and credentials are set up once per worker.
+    """
+
+    def __init__(self, pool_size: int = TTS_CLIENT_POOL_SIZE):
+        self._pool_size = max(1, pool_size)
+        self._clients: List[texttospeech_v1.TextToSpeechAsyncClient] = []
+        self._round_robin = itertools.count()
+
+    def _get_client(self) -> texttospeech_v1.TextToSpeechAsyncClient:
+        """
+        Return the next async client from the pool.
+
+        Clients are created lazily on first use because grpc.aio channels
+        bind to the event loop that is running when they are created.
+        """
+        if not self._clients:
+            credentials, _ = google.auth.default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            self._clients = [
+                texttospeech_v1.TextToSpeechAsyncClient(credentials=credentials)
+                for _ in range(self._pool_size)
+            ]
+        return self._clients[next(self._round_robin) % len(self._clients)]
+
+    async def close(self):
+        """Close all pooled gRPC channels"""
+        clients, self._clients = self._clients, []
+        for client in clients:
+            await client.transport.close()
+
+    async def synthesize(self, text: str, voice: str, speaking_rate: float, sample_rate_hertz: int) -> bytes:
+        synthesis_input = texttospeech_v1.SynthesisInput(text=text)
+
+        voice_params = texttospeech_v1.VoiceSelectionParams(
+            language_code="ko-KR",
+            name=voice
+        )
+
+        audio_config = texttospeech_v1.AudioConfig(
+            audio_encoding=texttospeech_v1.AudioEncoding.MP3,
+            speaking_rate=speaking_rate,
+            sample_rate_hertz=sample_rate_hertz
+        )
+
+        response = await self._get_client().synthesize_speech(
+            input=synthesis_input,
+            voice=voice_params,
+            audio_config=audio_config
+        )
+        return response.audio_content
+
+
+def build_tts_backend(name: str = TTS_BACKEND):
+    """Return the configured TTS backend (TTS_BACKEND=google|fake)"""
+    if name == "fake":
+        return FakeTTSBackend()
+    return GoogleTTSBackend()
 
 
 class TTSService:
     """
-    Text-to-Speech service using Google Cloud TTS.
+    Text-to-Speech service using Google Cloud TTS (or the fake backend).
     Converts Korean text to base64-encoded MP3 audio.
+
+    One instance is shared per worker process (see get_tts_service) so the
+    gRPC channels and credentials are set up once instead of per request.
     """
 
-    def __init__(self):
-        """Initialize TTS client with optional in-memory cache"""
-        self.client = texttospeech_v1.TextToSpeechClient()
-        self.cache: Dict[str, str] = {}
+    sample_rate_hertz = 24000
+
+    def __init__(
+        self,
+        max_concurrency: int = TTS_MAX_CONCURRENCY,
+        cache: Optional[AudioCache] = None,
+        backend=None
+    ):
+        """Initialize backend, audio cache and concurrency limit"""
+        self.cache = cache or AudioCache(
+            max_bytes=TTS_CACHE_MAX_BYTES,
+            ttl_seconds=TTS_CACHE_TTL_SECONDS,
+            disk_dir=TTS_CACHE_DIR or None,
+            disk_max_bytes=TTS_CACHE_DISK_MAX_BYTES,
+        )
+        self.backend = backend or build_tts_backend()
         self.voice_name = TTS_VOICE_NAME
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def close(self):
+        """Close the backend's pooled channels"""
+        await self.backend.close()
 
     async def text_to_speech(
         self,
@@ -39,51 +144,147 @@ class TTSService:
         Raises:
             Exception: If TTS generation fails
         """
-        voice = voice_name or self.voice_name
+        audio = await self.synthesize(text, voice_name, speaking_rate)
+        with span("encode"):
+            return base64.b64encode(audio).decode('utf-8')
 
-        # Check cache
-        cache_key = self._generate_cache_key(text, voice)
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+    async def synthesize(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        speaking_rate: float = 1.0
+    ) -> bytes:
+        """
+        Convert text to raw MP3 bytes, served from the audio cache when possible.
 
-        try:
-            # Prepare TTS request
-            synthesis_input = texttospeech_v1.SynthesisInput(text=text)
+        Concurrent requests for the same phrase share a single synthesis call;
+        if the request running it is cancelled, a waiting one takes over.
 
-            voice_params = texttospeech_v1.VoiceSelectionParams(
-                language_code="ko-KR",
-                name=voice
-            )
+        Raises:
+            Exception: If TTS generation fails
+        """
+        voice = voice_name or self.voice_name
+        cache_key = self.audio_id(text, voice, speaking_rate)
 
-            audio_config = texttospeech_v1.AudioConfig(
-                audio_encoding=texttospeech_v1.AudioEncoding.MP3,
-                speaking_rate=speaking_rate,
-                sample_rate_hertz=24000
-            )
+        while True:
+            # Check cache
+            audio = await self.cache.get(cache_key)
+            if audio is not None:
+                tts_cache_requests.inc(result="hit")
+                return audio
 
-            # Generate audio
-            response = self.client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice_params,
-                audio_config=audio_config
-            )
+            # Join an in-flight synthesis of the same phrase
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                break
+            tts_cache_requests.inc(result="joined")
+            try:
+                with span("tts"):
+                    return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Re-raise our own cancellation; if the owner was cancelled
+                # instead, synthesize it ourselves (or join a newer owner)
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
 
-            # Convert to base64
-            audio_base64 = base64.b64encode(response.audio_content).decode('utf-8')
+        tts_cache_requests.inc(result="miss")
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = pending
+        try:
+            audio = await self._synthesize_uncached(text, voice, speaking_rate)
+            await self.cache.put(cache_key, audio)
+            pending.set_result(audio)
+            return audio
+        except Exception as e:
+            pending.set_exception(e)
+            # Mark retrieved so waiters-less failures don't log "never retrieved"
+            pending.exception()
+            raise
+        finally:
+            # Cancelled (e.g. a streaming client disconnected): release the waiters
+            if not pending.done():
+                pending.cancel()
+            del self._inflight[cache_key]
 
-            # Cache the result
-            self.cache[cache_key] = audio_base64
+    def audio_id(
+        self,
+        text: str,
+        voice_name: Optional[str] = None,
+        speaking_rate: float = 1.0
+    ) -> str:
+        """Stable ID of the audio for a phrase (its cache key)"""
+        voice = voice_name or self.voice_name
+        return self.cache.make_key(text, voice, speaking_rate, self.sample_rate_hertz)
 
-            return audio_base64
+    async def get_audio(self, audio_id: str) -> Optional[bytes]:
+        """Return previously synthesized audio by ID, or None if not cached"""
+        return await self.cache.get(audio_id)
 
+    async def _synthesize_uncached(self, text: str, voice: str, speaking_rate: float) -> bytes:
+        try:
+            # Generate audio (bounded so bursts queue instead of flooding the API);
+            # the stage includes the queueing, which is what the request waits for
+            with span("tts"):
+                async with self._semaphore:
+                    return await self.backend.synthesize(text, voice, speaking_rate, self.sample_rate_hertz)
         except Exception as e:
             raise Exception(f"TTS 생성 실패: {str(e)}")
 
-    def _generate_cache_key(self, text: str, voice: str) -> str:
-        """Generate cache key from text and voice"""
-        key_string = f"{text}:{voice}"
-        return hashlib.md5(key_string.encode()).hexdigest()
-
     def clear_cache(self):
-        """Clear the audio cache"""
+        """Clear the in-process audio cache"""
         self.cache.clear()
+
+
+_tts_service: Optional[TTSService] = None
+
+
+def get_tts_service() -> TTSService:
+    """Return the process-wide TTS service (FastAPI dependency)"""
+    global _tts_service
+    if _tts_service is None:
+        _tts_service = TTSService()
+    return _tts_service
+
+
+async def close_tts_service():
+    """Release pooled TTS channels on application shutdown"""
+    global _tts_service
+    if _tts_service is not None:
+        await _tts_service.close()
+        _tts_service = None
+
+
+def _audio_cache_values(fields: Dict[tuple, str]) -> Dict[tuple, float]:
+    """AudioCache.stats() values of the current service as {labels: value}"""
+    if _tts_service is None:
+        return {}
+    stats = _tts_service.cache.stats()
+    return {labels: stats[field] for labels, field in fields.items()}
+
+
+# Audio cache effectiveness, read at scrape time. Lookups also count
+# GET /interview/audio fetches; hit rate = (memory + disk) / all lookups.
+registry.callback(
+    "tts_audio_cache_lookups_total",
+    "Audio cache lookups by the tier that answered (memory, disk) or miss",
+    lambda: _audio_cache_values({("memory",): "hits", ("disk",): "disk_hits", ("miss",): "misses"}),
+    ["result"],
+    type_name="counter",
+)
+registry.callback(
+    "tts_audio_cache_removals_total",
+    "Audio cache memory entries removed for space (evicted) or age (expired)",
+    lambda: _audio_cache_values({("evicted",): "evictions", ("expired",): "expirations"}),
+    ["reason"],
+    type_name="counter",
+)
+registry.callback(
+    "tts_audio_cache_entries",
+    "Audio clips held in the memory tier",
+    lambda: _audio_cache_values({(): "entries"}),
+)
+registry.callback(
+    "tts_audio_cache_bytes",
+    "Bytes of audio held in the memory tier",
+    lambda: _audio_cache_values({(): "bytes"}),
+)
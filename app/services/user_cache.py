@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_SECONDS
+from app.models import User
+
+# (column values or None after an invalidation, version, stored_at)
+_Entry = Tuple[Optional[Dict], Optional[datetime], float]
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite returns naive datetimes; they are stored as UTC
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class UserCache:
+    """
+    Per-worker cache of authenticated users by id (LRU with TTL).
+
+    Entries hold column values, never session-bound instances; get() rebuilds
+    a fresh detached User per call, which the caller merges into its session
+    without a SELECT, so the route can still modify and commit it. Writers
+    call invalidate() with the row's new updated_at: the entry becomes a
+    tombstone at that version, and a concurrent request that read the old
+    row cannot put it back. Other workers see the change once their entry
+    expires (TTL).
+    """
+
+    def __init__(self, max_entries: int = USER_CACHE_MAX_ENTRIES, ttl_seconds: float = USER_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[User]:
+        """
+        Cached user as a detached instance, or None on a miss.
+
+        Attach it with session.merge(user, load=False): it is marked as
+        loaded from the database, so the merge issues no SELECT.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] is None:
+                return None
+            values, _, stored_at = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    def put(self, user: User):
+        """Cache a user just loaded from the database"""
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        version = _as_utc(user.updated_at)
+        values = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        with self._lock:
+            entry = self._entries.get(user.id)
+            if entry is not None and entry[1] is not None and version is not None and version < entry[1]:
+                return  # Read before a newer write
+            self._entries[user.id] = (values, version, time.time())
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int, version: Optional[datetime] = None):
+        """Drop a user after a write; version is the row's new updated_at"""
+        with self._lock:
+            self._entries[user_id] = (None, _as_utc(version), time.time())
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache()
@@ -1,34 +1,36 @@
 import json
 import os
-from pathlib import Path
-from google.genai import Client
+from typing import Optional
 from dotenv import load_dotenv
 
+from app.core.config import LLM_ANALYSIS_DEADLINE_SECONDS, LLM_BACKEND
+from app.services.llm_gateway import LLMUnavailable, llm_gateway
+from app.services.program_catalogue import program_catalogue
+from app.services.skill_matcher import SkillMatch, match_portfolio
+
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
-def analyze_portfolio(user_data: dict, project_data: dict, job_data: dict) -> dict:
-    if not GEMINI_API_KEY:
+
+def candidate_programs(skill_match: SkillMatch, domain: Optional[str] = None) -> list:
+    """Training programs that can cover the candidate's skill gap for the job"""
+    return program_catalogue.candidates(skill_match.missing, skill_match.matched, domain=domain)
+
+
+async def analyze_portfolio(user_data: dict, project_data: dict, job_data: dict, domain: Optional[str] = None) -> dict:
+    if not GEMINI_API_KEY and LLM_BACKEND == "gemini":
         return "Gemini API Key is missing."
 
-    client = Client(api_key=GEMINI_API_KEY)
+    # Skill matching is deterministic; the model only writes the narrative parts
+    skill_match = match_portfolio(user_data, project_data, job_data)
 
-    programs = []
-    try:
-        base_path = Path(__file__).resolve().parent.parent.parent
-        json_path = base_path / "dummy_data" / "program_dummy.json"
-        
-        if json_path.exists():
-            with open(json_path, "r", encoding="utf-8") as f:
-                programs = json.load(f)
-            
-    except Exception as e:
-        print(f"Error loading program_dummy.json: {e}")
+    # Only programs whose skills overlap the job's skills are sent to the model
+    programs = candidate_programs(skill_match, domain)
 
     try:
         if programs:
-            programs_text = json.dumps(programs, ensure_ascii=False, indent=2)
+            programs_text = json.dumps(programs, ensure_ascii=False, separators=(",", ":"))
         else:
             programs_text = "No training programs available at the moment."
 
@@ -46,22 +48,26 @@ def analyze_portfolio(user_data: dict, project_data: dict, job_data: dict) -> di
         [Survey / Career Interests]
         {user_data.get('survey_text', 'N/A')}
         
-        [Candidate Skills]
-        {user_data.get('skills', 'N/A')}
-        
         === PROJECT EXPERIENCE ===
         [Project Content]
         {project_data.get('content', 'N/A')}
         
-        [Project Tech Stack]
-        {project_data.get('skills_used', 'N/A')}
-        
         === JOB OPENING ===
         [Job Description]
         {job_data.get('description', 'N/A')}
         
-        [Required Skills]
-        {job_data.get('skills_required', 'N/A')}
+        === SKILL MATCH (precomputed, candidate skills + project tech stack and write-up vs. required skills) ===
+        [Matched Skills]
+        {', '.join(skill_match.matched) or 'None'}
+        
+        [Missing Skills]
+        {', '.join(skill_match.missing) or 'None'}
+        
+        [Other Candidate Skills]
+        {', '.join(skill_match.extra) or 'None'}
+        
+        [Baseline Skill Score]
+        {skill_match.score} / 100
         
         === AVAILABLE TRAINING PROGRAMS (JSON) ===
         {programs_text}
@@ -69,10 +75,10 @@ def analyze_portfolio(user_data: dict, project_data: dict, job_data: dict) -> di
         ---
         
         Analysis Instructions:
-        1. **Skill Match Analysis**: Compare [Candidate Skills] & [Project Tech Stack] against [Required Skills]. Identify matched skills and specifically highlight **missing skills**.
+        1. **Skill Match Analysis**: Explain the precomputed [Matched Skills] and [Missing Skills] (do not re-derive them), specifically highlighting the **missing skills**.
         2. **Fit Evaluation**: Evaluate if the [Project Content] and [Self Summary] align with the responsibilities described in [Job Description]. Determine if the candidate is a good fit for the role.
-        3. **Missing Competencies**: Clearly list the key competencies or skills the candidate is lacking for this specific role.
-        4. **Overall Score**: Give a fit score out of 100 based on the analysis.
+        3. **Missing Competencies**: List every item of [Missing Skills], plus any other key competencies from [Job Description] the candidate is lacking.
+        4. **Overall Score**: Give a fit score out of 100, starting from [Baseline Skill Score] and adjusting for the fit evaluation.
         5. **Recommended Programs**: Check the [AVAILABLE TRAINING PROGRAMS] list. If a program's listed skills cover **at least one** of the identified [Missing Competencies/Skills], recommend that program. 
            **IMPORTANT**: For each recommendation, return the ENTIRE JSON object of the program as found in the input list, and add a "recommendation_reason" field explaining why it was chosen.
 
@@ -85,21 +91,28 @@ def analyze_portfolio(user_data: dict, project_data: dict, job_data: dict) -> di
         - "recommended_programs": [{{ ...full_program_object..., "recommendation_reason": "Reason for recommendation" }}]
         """
         
-        response = client.models.generate_content(
-            model='gemini-flash-latest',
-            contents=prompt,
+        # Gateway: deadline, retries and circuit breaker over the shared client
+        response_text = await llm_gateway.generate(
+            "analysis",
+            'gemini-flash-latest',
+            prompt,
+            deadline=LLM_ANALYSIS_DEADLINE_SECONDS,
             config={
                 'response_mime_type': 'application/json',
-            }
+            },
+            hedge=False
         )
         
         try:
-            return json.loads(response.text)
+            return json.loads(response_text)
         except json.JSONDecodeError:
             return {
                 "error": "Failed to parse AI response as JSON",
-                "raw_response": response.text
+                "raw_response": response_text
             }
             
+    except LLMUnavailable:
+        # Callers tell an unavailable upstream (retry later) from a bad answer
+        raise
     except Exception as e:
         return {"error": f"Error analyzing job match: {str(e)}"}
\ No newline at end of file
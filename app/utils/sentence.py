@@ -0,0 +1,46 @@
+import re
+from typing import List
+
+# 문장 종결 부호(뒤따르는 따옴표/괄호 포함) + 공백, 또는 줄바꿈을 문장 경계로 사용
+# "3.5"처럼 공백 없이 이어지는 마침표는 경계로 보지 않는다.
+_BOUNDARY = re.compile(r"(?<=[.?!。？！…])[\"'”’)\]]*\s+|\n+")
+
+
+class SentenceSplitter:
+    """
+    Incrementally split streamed Korean text into sentences.
+
+    Text is fed in arbitrary chunks (e.g. LLM stream deltas); complete
+    sentences are returned as soon as their boundary is seen. Sentences
+    shorter than ``min_length`` are merged into the next one so TTS is not
+    called for fragments like "네." on their own.
+    """
+
+    def __init__(self, min_length: int = 10):
+        self.min_length = min_length
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        """Add a chunk and return the sentences it completed"""
+        self._buffer += text
+        sentences = []
+        start = 0
+        for match in _BOUNDARY.finditer(self._buffer):
+            sentence = self._buffer[start:match.end()].strip()
+            if len(sentence) < self.min_length:
+                continue
+            sentences.append(sentence)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> List[str]:
+        """Return whatever text remains once the stream has ended"""
+        rest, self._buffer = self._buffer.strip(), ""
+        return [rest] if rest else []
+
+
+def split_sentences(text: str, min_length: int = 10) -> List[str]:
+    """Split a complete text into sentences"""
+    splitter = SentenceSplitter(min_length)
+    return splitter.feed(text) + splitter.flush()
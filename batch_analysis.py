@@ -0,0 +1,40 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from app.core.config import ANALYSIS_BATCH_CONCURRENCY
+from app.services.batch_analysis import stream_batch_analysis
+
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+logger = logging.getLogger(__name__)
+
+
+def read_user_ids(args) -> list:
+    user_ids = list(args.user_ids)
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            user_ids += [int(line) for line in f if line.strip()]
+    return user_ids
+
+
+async def run(user_ids: list, concurrency: int):
+    async for record in stream_batch_analysis(user_ids, concurrency=concurrency):
+        if "summary" in record:
+            logger.info(f"Batch analysis completed: {record['summary']}")
+            continue
+        print(json.dumps(record, ensure_ascii=False), flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze many users' portfolios and print NDJSON results")
+    parser.add_argument("user_ids", nargs="*", type=int, help="User ids to analyze")
+    parser.add_argument("--file", help="File with one user id per line")
+    parser.add_argument("--concurrency", type=int, default=ANALYSIS_BATCH_CONCURRENCY)
+    args = parser.parse_args()
+
+    user_ids = read_user_ids(args)
+    if not user_ids:
+        parser.error("no user ids given")
+    asyncio.run(run(user_ids, args.concurrency))
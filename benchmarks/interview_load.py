@@ -0,0 +1,121 @@
+"""
+Load test for POST /interview/chat/interviewer against the fake LLM and TTS backends.
+
+The app runs with LLM_BACKEND=fake and TTS_BACKEND=fake, and the fake LLM
+answers after a fixed latency, so the measured throughput reflects how many
+interview turns a single worker can keep in flight rather than the real
+upstream speed. No network or Google credentials are needed.
+
+Usage:
+    python -m benchmarks.interview_load --requests 200 --concurrency 64 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks.stats import LatencyRecorder
+
+
+class StubResult:
+    def __init__(self, item):
+        self.item = item
+
+    def first(self):
+        return self.item
+
+
+class StubSession:
+    def __init__(self, project):
+        self.project = project
+
+    async def exec(self, statement):
+        return StubResult(self.project)
+
+
+def build_app(latency: float):
+    # Read by app.core.config on import
+    os.environ["LLM_BACKEND"] = "fake"
+    os.environ["TTS_BACKEND"] = "fake"
+    os.environ["FAKE_LLM_LATENCY"] = f"fixed:{latency}"
+    os.environ["FAKE_LLM_TOKEN_INTERVAL"] = "0"
+    os.environ["FAKE_LLM_ERROR_RATE"] = "0"
+    os.environ["FAKE_TTS_LATENCY"] = "fixed:0"
+
+    from app.api import deps
+    from app.core.database import get_session
+    from app.main import app
+    from app.models import Project, User
+
+    user = User(id=1, email="load@test.com", hashed_password="x", name="부하테스트", domain="BE")
+    project = Project(
+        id=1,
+        user_id=1,
+        title="OneWave Backend API",
+        content="FastAPI 기반 면접 시뮬레이션 백엔드",
+        skills_used="Python, FastAPI, PostgreSQL",
+        results="응답 시간 40% 개선",
+        created_at=datetime.now(timezone.utc),
+    )
+
+    def override_session():
+        yield StubSession(project)
+
+    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[deps.get_current_user] = lambda: user
+    return app
+
+
+async def run(app, total: int, concurrency: int, recorder: LatencyRecorder) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one_turn(i: int):
+            async with semaphore:
+                sent = time.perf_counter()
+                response = await client.post(
+                    "/interview/chat/interviewer",
+                    json={"user_answer": f"답변 {i}", "conversation_history": []},
+                )
+                recorder.record("POST /interview/chat/interviewer", time.perf_counter() - sent, response.status_code)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one_turn(i) for i in range(total)))
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.5, help="fake LLM latency in seconds")
+    parser.add_argument("--workers", type=int, default=8, help="uvicorn worker count to compare against")
+    args = parser.parse_args()
+
+    app = build_app(args.latency)
+
+    recorder = LatencyRecorder()
+    elapsed = asyncio.run(run(app, args.requests, args.concurrency, recorder))
+    latency = recorder.summary()["POST /interview/chat/interviewer"]
+    throughput = args.requests / elapsed
+    # A worker that blocks on the LLM call completes at most 1 turn per latency window.
+    blocking_ceiling = args.workers / args.latency
+
+    print(f"requests={args.requests} concurrency={args.concurrency} latency={args.latency}s")
+    print(f"elapsed={elapsed:.2f}s throughput={throughput:.1f} req/s (single worker)")
+    print(f"latency p50={latency['p50_ms']:.0f}ms p95={latency['p95_ms']:.0f}ms p99={latency['p99_ms']:.0f}ms")
+    print(f"blocking ceiling for {args.workers} workers: {blocking_ceiling:.1f} req/s")
+    print(f"in-flight turns per worker: {throughput * args.latency:.1f}")
+
+    if throughput * args.latency <= args.workers:
+        raise SystemExit("FAIL: single-worker concurrency did not exceed the worker count")
+    print("OK: one worker keeps more turns in flight than the whole blocking worker pool")
+
+
+if __name__ == "__main__":
+    main()
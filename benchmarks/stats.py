@@ -0,0 +1,126 @@
+"""
+Latency bookkeeping shared by the benchmarks: per-endpoint samples,
+percentile summaries, JSON reports and comparison against a baseline.
+"""
+import json
+import math
+import platform
+import subprocess
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+
+def percentile(sorted_samples: List[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(len(sorted_samples) * percent / 100), 1)
+    return sorted_samples[rank - 1]
+
+
+class LatencyRecorder:
+    """Latencies and status codes of requests, grouped by endpoint"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    def record(self, endpoint: str, seconds: float, status: int):
+        """Record one request; status 0 means the request itself failed"""
+        self.samples[endpoint].append(seconds)
+        self.statuses[endpoint][status] += 1
+
+    def finish(self):
+        self.finished_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-endpoint count, errors, throughput and latency percentiles (ms)"""
+        elapsed = self.elapsed
+        result = {}
+        for endpoint in sorted(self.samples):
+            samples = sorted(self.samples[endpoint])
+            statuses = self.statuses[endpoint]
+            result[endpoint] = {
+                "count": len(samples),
+                "errors": sum(n for status, n in statuses.items() if status == 0 or status >= 400),
+                "statuses": {str(status): n for status, n in sorted(statuses.items())},
+                "throughput": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+                "mean_ms": round(sum(samples) / len(samples) * 1000, 2),
+                "p50_ms": round(percentile(samples, 50) * 1000, 2),
+                "p95_ms": round(percentile(samples, 95) * 1000, 2),
+                "p99_ms": round(percentile(samples, 99) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2),
+            }
+        return result
+
+
+def git_revision() -> Optional[str]:
+    """Current commit (with a -dirty suffix for uncommitted changes), if in a git checkout"""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout
+        return revision + ("-dirty" if dirty.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(name: str, recorder: LatencyRecorder, config: dict, totals: dict) -> dict:
+    return {
+        "benchmark": name,
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": config,
+        "totals": {**totals, "elapsed_s": round(recorder.elapsed, 3)},
+        "endpoints": recorder.summary(),
+    }
+
+
+def save_report(report: dict, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def print_report(report: dict):
+    print(f"{report['benchmark']} @ {report['revision'] or 'unknown revision'}")
+    print("  " + "  ".join(f"{key}={value}" for key, value in report["totals"].items()))
+    print(f"  {'endpoint':<40} {'count':>6} {'err':>5} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for endpoint, stats in report["endpoints"].items():
+        print(
+            f"  {endpoint:<40} {stats['count']:>6} {stats['errors']:>5} {stats['throughput']:>8.1f} "
+            f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f}"
+        )
+
+
+def compare_reports(baseline: dict, current: dict, max_regression: float) -> List[str]:
+    """
+    Print p50/p95 changes per endpoint against a baseline report.
+
+    Returns:
+        Endpoints whose p95 grew by more than max_regression percent
+    """
+    regressions = []
+    print(f"compared with {baseline.get('revision') or 'baseline'}:")
+    for endpoint, stats in current["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(endpoint)
+        if before is None:
+            print(f"  {endpoint:<40} (new)")
+            continue
+        changes = []
+        for key in ("p50_ms", "p95_ms"):
+            change = (stats[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            changes.append(f"{key[:3]} {before[key]:.1f} -> {stats[key]:.1f} ms ({change:+.1f}%)")
+            if key == "p95_ms" and change > max_regression:
+                regressions.append(endpoint)
+        print(f"  {endpoint:<40} " + "  ".join(changes))
+    return regressions
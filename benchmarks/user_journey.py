@@ -0,0 +1,267 @@
+"""
+End-to-end benchmark of the user journey, with fake LLM and TTS backends.
+
+Each simulated user runs the full flow:
+signup -> login -> survey -> portfolio -> interview start ->
+N interview turns (plus fetching each question's audio) -> portfolio analysis.
+Journeys run with a configurable concurrency. The report gives throughput
+and p50/p95/p99 latency per endpoint, and is saved as JSON so runs can be
+compared between commits.
+
+By default the app runs in-process on a fresh SQLite database (pass
+--database-url for a local Postgres), with LLM_BACKEND=fake and
+TTS_BACKEND=fake, so no network or Google credentials are needed. With
+--base-url the journeys target an already running server instead (start it
+with the fake backends, and seed jobs with initial_data.py).
+
+Usage:
+    python -m benchmarks.user_journey --users 100 --concurrency 20 --turns 3
+    python -m benchmarks.user_journey --compare benchmarks/results/baseline.json --max-regression 10
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from typing import Optional
+
+import httpx
+
+from benchmarks.stats import LatencyRecorder, build_report, compare_reports, print_report, save_report
+
+ANSWERS = [
+    "Spring Boot로 REST API를 만들고, 조회가 많은 게시글 목록은 Redis에 캐싱해서 응답 시간을 절반 정도로 줄였습니다.",
+    "처음에는 단일 DB로 시작했지만 트래픽이 늘면서 읽기 전용 복제본을 두고 조회 쿼리를 분리했습니다.",
+    "Kafka를 도입한 이유는 알림 발송을 비동기로 처리해 게시글 작성 요청이 외부 시스템에 묶이지 않게 하기 위해서였습니다.",
+    "장애가 났을 때는 요청 ID를 로그에 남겨 두었기 때문에, 느린 요청을 추적해서 N+1 쿼리를 찾아낼 수 있었습니다.",
+    "테스트는 서비스 계층 단위 테스트와 Testcontainers를 사용한 통합 테스트로 나누어 작성했습니다.",
+]
+
+# Server errors worth retrying like a real client (auth busy, LLM briefly unavailable)
+_MAX_RETRIES = 3
+_MAX_RETRY_AFTER = 5.0
+
+
+class JourneyFailed(Exception):
+    pass
+
+
+def configure_environment(args, workdir: str):
+    """Select the fake backends and database; must run before the app is imported"""
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["LLM_BACKEND"] = "fake"
+    os.environ["TTS_BACKEND"] = "fake"
+    os.environ["FAKE_LLM_LATENCY"] = args.llm_latency
+    os.environ["FAKE_LLM_TOKEN_INTERVAL"] = str(args.llm_token_interval)
+    os.environ["FAKE_LLM_ERROR_RATE"] = str(args.llm_error_rate)
+    os.environ["FAKE_TTS_LATENCY"] = args.tts_latency
+    os.environ["FAKE_TTS_ERROR_RATE"] = str(args.tts_error_rate)
+    os.environ["FAKE_BACKEND_SEED"] = str(args.seed)
+    # A fresh audio cache per run: earlier runs must not turn syntheses into cache hits
+    os.environ["TTS_CACHE_DIR"] = os.path.join(workdir, "tts-cache")
+    if args.bcrypt_rounds:
+        os.environ["BCRYPT_ROUNDS"] = str(args.bcrypt_rounds)
+
+
+def seed_jobs(path: str):
+    """Load the job postings the analysis step ranks against (idempotent upsert)"""
+    from sqlmodel import Session
+
+    from app.core.database import engine
+    from app.services.job_ingestion import ingest_file
+
+    with Session(engine) as session:
+        print(f"seeded jobs: {ingest_file(session, path)}")
+
+
+async def call(
+    client: httpx.AsyncClient,
+    recorder: LatencyRecorder,
+    endpoint: str,
+    method: str,
+    url: str,
+    **kwargs
+) -> httpx.Response:
+    """Send one request, recording its latency under the endpoint template"""
+    for attempt in range(_MAX_RETRIES + 1):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            recorder.record(endpoint, time.perf_counter() - started, 0)
+            raise JourneyFailed(f"{endpoint}: {e!r}")
+        recorder.record(endpoint, time.perf_counter() - started, response.status_code)
+
+        retry_after = float(response.headers.get("Retry-After", "0") or 0)
+        if response.status_code == 503 and attempt < _MAX_RETRIES and retry_after <= _MAX_RETRY_AFTER:
+            await asyncio.sleep(retry_after)
+            continue
+        if response.status_code >= 400:
+            raise JourneyFailed(f"{endpoint}: {response.status_code} {response.text[:200]}")
+        return response
+
+
+async def journey(client: httpx.AsyncClient, recorder: LatencyRecorder, args, run_id: str, index: int):
+    """One user's path from signup to portfolio analysis"""
+    rng = random.Random(f"{args.seed}-{index}")
+    answers = itertools.cycle(rng.sample(ANSWERS, len(ANSWERS)))
+    email = f"bench-{run_id}-{index}@example.com"
+    password = "bench-password"
+
+    async def think():
+        if args.think_time > 0:
+            await asyncio.sleep(rng.uniform(0, 2 * args.think_time))
+
+    await call(client, recorder, "POST /auth/signup", "POST", "/auth/signup",
+               json={"email": email, "name": f"부하테스트{index}", "password": password})
+    response = await call(client, recorder, "POST /auth/login", "POST", "/auth/login",
+                          json={"email": email, "password": password})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    await think()
+
+    await call(client, recorder, "POST /users/me/survey", "POST", "/users/me/survey", headers=headers,
+               json={"domain": "BE", "text": "금융권 백엔드 시스템 구축과 대용량 트래픽 처리에 관심이 있습니다."})
+    await call(client, recorder, "POST /users/me/portfolio", "POST", "/users/me/portfolio", headers=headers, json={
+        "self_summary": "효율적인 시스템 설계와 대용량 데이터 처리에 관심이 많은 백엔드 개발자입니다.",
+        "user_skills": "Java, Spring Boot, MySQL, Git",
+        # Distinct per user: identical inputs would share one cached analysis
+        "title": f"게시판 웹 서비스 프로젝트 {index}",
+        "content": "Spring Boot와 JPA를 사용한 게시판입니다. RESTful API 설계와 DB 정규화를 적용했고, 실시간 알림을 위해 Kafka를 도입했습니다.",
+        "skills_used": "Java, Spring Boot, JPA, MySQL, Kafka",
+        "results": "게시글 목록 응답 시간 45% 개선",
+    })
+    await think()
+
+    response = await call(client, recorder, "POST /interview/start", "POST", "/interview/start",
+                          headers=headers, params={"audio_format": "url"})
+    started = response.json()
+    session_id, question = started["session_id"], started["message"]
+    if started.get("audio_url"):
+        await call(client, recorder, "GET /interview/audio/{audio_id}", "GET",
+                   httpx.URL(started["audio_url"]).path, headers=headers)
+
+    for _ in range(args.turns):
+        await think()
+        response = await call(client, recorder, "POST /interview/chat/turn", "POST", "/interview/chat/turn",
+                              headers=headers, params={"audio_format": "url"},
+                              json={"user_answer": next(answers), "session_id": session_id, "interviewer_question": question})
+        interviewer = response.json()["interviewer"]
+        question = interviewer["message"]
+        if interviewer.get("audio_url"):
+            await call(client, recorder, "GET /interview/audio/{audio_id}", "GET",
+                       httpx.URL(interviewer["audio_url"]).path, headers=headers)
+
+    if not args.skip_analysis:
+        await think()
+        await call(client, recorder, "POST /analysis/portfolio", "POST", "/analysis/portfolio", headers=headers)
+
+
+async def drive(client: httpx.AsyncClient, args) -> dict:
+    """Run all journeys and return the report"""
+    recorder = LatencyRecorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    run_id = uuid.uuid4().hex[:8]
+    failures = []
+
+    async def one(index: int):
+        async with semaphore:
+            try:
+                await journey(client, recorder, args, run_id, index)
+            except JourneyFailed as e:
+                failures.append(str(e))
+
+    await asyncio.gather(*(one(i) for i in range(args.users)))
+    recorder.finish()
+
+    for failure in failures[:5]:
+        print(f"journey failed: {failure}", file=sys.stderr)
+
+    completed = args.users - len(failures)
+    requests = sum(len(samples) for samples in recorder.samples.values())
+    config = {
+        key: getattr(args, key)
+        for key in ("users", "concurrency", "turns", "think_time", "llm_latency", "llm_token_interval",
+                    "llm_error_rate", "tts_latency", "tts_error_rate", "seed", "bcrypt_rounds", "skip_analysis")
+    }
+    config["target"] = args.base_url or ("postgresql" if args.database_url and "postgres" in args.database_url else "sqlite (in-process)")
+    return build_report("user_journey", recorder, config, {
+        "journeys": args.users,
+        "completed": completed,
+        "failed": len(failures),
+        "requests": requests,
+        "journeys_per_s": round(completed / recorder.elapsed, 2),
+        "requests_per_s": round(requests / recorder.elapsed, 2),
+    })
+
+
+async def run(args) -> dict:
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            return await drive(client, args)
+
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        seed_jobs(args.jobs)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.timeout) as client:
+            return await drive(client, args)
+
+
+def default_output(report: dict) -> str:
+    directory = os.path.join(os.path.dirname(__file__), "results")
+    os.makedirs(directory, exist_ok=True)
+    stamp = report["timestamp"][:19].replace(":", "").replace("-", "")
+    return os.path.join(directory, f"user_journey-{report['revision'] or 'unknown'}-{stamp}.json")
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50, help="number of user journeys")
+    parser.add_argument("--concurrency", type=int, default=16, help="journeys running at once")
+    parser.add_argument("--turns", type=int, default=3, help="interview turns per journey")
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean pause between journey steps (s)")
+    parser.add_argument("--skip-analysis", action="store_true", help="end journeys after the interview")
+    parser.add_argument("--database-url", help="database for the in-process app (default: fresh SQLite file)")
+    parser.add_argument("--base-url", help="target a running server instead of the in-process app")
+    parser.add_argument("--jobs", default="dummy_data/job_dummy.json", help="job feed seeded before the run")
+    parser.add_argument("--llm-latency", default="lognormal:0.8:0.4", help="fake LLM latency spec (see FAKE_LLM_LATENCY)")
+    parser.add_argument("--llm-token-interval", type=float, default=0.03, help="fake LLM delay per streamed chunk (s)")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--tts-latency", default="lognormal:0.3:0.3", help="fake TTS latency spec")
+    parser.add_argument("--tts-error-rate", type=float, default=0.0)
+    parser.add_argument("--bcrypt-rounds", type=int, help="override BCRYPT_ROUNDS for the in-process app")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-request client timeout (s)")
+    parser.add_argument("--output", help="report path (default: benchmarks/results/user_journey-<revision>-<time>.json)")
+    parser.add_argument("--compare", help="baseline report to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="allowed p95 increase over the baseline (%%)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="onewave-bench-") as workdir:
+        if not args.base_url:
+            configure_environment(args, workdir)
+        report = asyncio.run(run(args))
+
+    print_report(report)
+    output = args.output or default_output(report)
+    save_report(report, output)
+    print(f"report saved to {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.max_regression)
+        if regressions:
+            raise SystemExit(f"FAIL: p95 regressed more than {args.max_regression:.0f}% on: {', '.join(regressions)}")
+    if report["totals"]["failed"]:
+        raise SystemExit(f"FAIL: {report['totals']['failed']} journeys failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,49 @@
-import json
+import argparse
 import logging
-from sqlmodel import Session, select
-from app.core.database import engine
-from app.models.job import Job
+
+from sqlmodel import Session, SQLModel
+
+import app.models  # noqa: F401  (register tables)
+from app.core.config import INGEST_BATCH_SIZE
+from app.core.database import create_missing_indexes, engine
+from app.services.job_ingestion import MissingNaturalKey, ensure_natural_key, ingest_file
+from app.services.job_search import create_search_index
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def init_db():
+
+def init_db(paths, batch_size=INGEST_BATCH_SIZE):
+    # The upsert needs the (company, title) unique index
+    SQLModel.metadata.create_all(engine)
     try:
-        with open("dummy_data/job_dummy.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        logger.error("dummy.json file not found.")
-        return
+        ensure_natural_key(engine)
+    except MissingNaturalKey as e:
+        raise SystemExit(f"Cannot ingest jobs: {e}")
+    create_missing_indexes()
+    # Search documents are written with the jobs, so their index must exist first
+    create_search_index(engine)
 
     with Session(engine) as session:
-        for item in data:
-            # Handle both skills_need and skills_required from JSON
-            # Pop both to avoid duplicate keyword argument error
-            skills_required = item.pop("skills_need", None) or item.pop("skills_required", None)
-
-            # Check for duplicates to prevent adding the same data multiple times
-            existing_job = session.exec(
-                select(Job).where(Job.company == item["company"], Job.title == item["title"])
-            ).first()
-
-            if not existing_job:
-                job = Job(skills_required=skills_required, **item)
-                session.add(job)
-                logger.info(f"Adding job: {job.company} - {job.title}")
-            else:
-                logger.info(f"Job already exists: {item['company']} - {item['title']}")
-
-        session.commit()
-        logger.info("Data initialization completed.")
+        for path in paths:
+            try:
+                stats = ingest_file(session, path, batch_size)
+            except FileNotFoundError:
+                logger.error(f"{path} file not found.")
+                continue
+            logger.info(f"Ingested {path}: {stats}")
+    logger.info("Data initialization completed.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Upsert job postings from JSON array / NDJSON feeds (idempotent)"
+    )
+    parser.add_argument("paths", nargs="*", default=["dummy_data/job_dummy.json"], help="Feed files")
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE, help="Rows per INSERT statement")
+    args = parser.parse_args()
+    init_db(args.paths, args.batch_size)
+
 
 if __name__ == "__main__":
-    init_db()
+    main()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from app.utils.ai_analysis import analyze_portfolio
 
@@ -17,7 +18,7 @@ def test_ai_analysis():
     print(f"Target Job: {job_data['company']} - {job_data['title']}")
     print("Sending data to Gemini API...")
 
-    result = analyze_portfolio(user_data, project_data, job_data)
+    result = asyncio.run(analyze_portfolio(user_data, project_data, job_data))
 
     print("\n--- AI Analysis Result ---")
     print(json.dumps(result, indent=2, ensure_ascii=False))